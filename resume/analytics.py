@@ -0,0 +1,255 @@
+"""Which sections and project links visitors actually use.
+
+Recording must not slow a rerun down, so ``record()`` only appends to an
+in-memory buffer. When the buffer holds ``CAPACITY`` unwritten events,
+new ones are dropped and counted, not waited for. A background thread
+writes the buffer to SQLite every ``FLUSH_INTERVAL`` seconds, or sooner once
+``BATCH`` events are waiting, as one ``executemany`` per batch. The
+database is in WAL mode, so the workers of ``resume.cluster`` can share it
+and the report can read it while they write.
+
+Events are ``(time, kind, name)``:
+
+- ``section``: a section was shown. With the option-menu sidebar that is
+  a new menu selection. With client-side panes, switching sections never
+  reaches the server, so each pane's CSS references a beacon URL as its
+  background image, and the browser requests it the first time the pane
+  is shown on a page load. Only the slugs of an existing tenant's sections
+  are recorded.
+- ``link``: a project link was followed. Project links point at
+  ``/resume-go/<slug>``, which records the click and redirects to the
+  project. Only links from ``content.PROJECTS`` are redirected.
+
+Another tenant's (``resume.tenants``) events are named ``<tenant>/<slug>``,
+and its links point at ``/resume-go/<tenant>/<slug>``, which redirects
+only to that tenant's projects.
+
+Like ``resume.links``, this only runs under ``streamlit run``; elsewhere
+the URLs stay the plain ones and nothing is recorded. Simulated sessions
+(``resume.headless``, e.g. the warm-up of ``resume.prewarm``) run inside
+``paused()`` and are not recorded either.
+``RESUME_ANALYTICS=0`` turns it off. The aggregated report:
+
+    python -m resume.analytics [--days 7]
+"""
+import argparse
+import atexit
+import contextlib
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+from resume import server, tenants
+
+ROOT = Path(__file__).resolve().parent.parent
+ENABLED = os.environ.get("RESUME_ANALYTICS", "1") != "0"
+DB_PATH = Path(os.environ.get("RESUME_ANALYTICS_DB", ROOT / ".cache" / "analytics.sqlite3"))
+CAPACITY = 10_000  # unwritten events held before new ones are dropped
+BATCH = 500
+FLUSH_INTERVAL = 1.0
+BEACON_PREFIX = "resume-event"
+GO_PREFIX = "resume-go"
+
+NAME = r"(?:[a-z0-9-]+/)?[a-z0-9-]+"  # [tenant/]slug
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (time REAL NOT NULL, kind TEXT NOT NULL, name TEXT NOT NULL);
+CREATE INDEX IF NOT EXISTS events_by_time ON events (time);
+"""
+
+log = logging.getLogger("resume.analytics")
+
+_lock = threading.Lock()
+_local = threading.local()
+_wake = threading.Event()
+_buffer = []
+_stats = {"recorded": 0, "dropped": 0, "written": 0, "failed": 0}
+_started = False
+
+
+def slug(text):
+    return re.sub(r"[^a-z0-9]+", "-", text.lower()).strip("-")
+
+
+def event_name(text, tenant=None):
+    tenant = tenant or tenants.current()
+    return slug(text) if tenant.is_default else f"{tenant.id}/{slug(text)}"
+
+
+def _tenant(tenant_id):
+    try:
+        return tenants.load(tenant_id) if tenant_id else tenants.DEFAULT
+    except ValueError:
+        return None
+
+
+def _section(name):
+    """Whether ``[tenant/]slug`` names a section of an existing tenant."""
+    from resume import layouts  # imports this module
+
+    tenant_id, _, section = name.rpartition("/")
+    return _tenant(tenant_id) is not None and section in map(layouts.section_slug, layouts.SECTIONS)
+
+
+def _link(name):
+    """The project link that ``[tenant/]slug`` stands for, or None."""
+    tenant_id, _, project = name.rpartition("/")
+    tenant = _tenant(tenant_id)
+    if tenant is None:
+        return None
+    # Nothing outside the tenant's own projects is redirected to.
+    return next((link for title, link in tenant.PROJECTS.items() if slug(title) == project), None)
+
+
+# --- RECORDING ---
+def record(kind, name):
+    """Queue one event; never blocks on the database."""
+    if not _started or getattr(_local, "paused", False):
+        return
+    with _lock:
+        if len(_buffer) >= CAPACITY:
+            _stats["dropped"] += 1
+            return
+        _buffer.append((time.time(), kind, name))
+        _stats["recorded"] += 1
+        full = len(_buffer) >= BATCH
+    if full:
+        _wake.set()
+
+
+@contextlib.contextmanager
+def paused():
+    """Record nothing from this thread inside the block."""
+    paused_before = getattr(_local, "paused", False)  # blocks may nest
+    _local.paused = True
+    try:
+        yield
+    finally:
+        _local.paused = paused_before
+
+
+def connect(path=DB_PATH):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    db = sqlite3.connect(path, timeout=5)
+    db.execute("PRAGMA journal_mode=WAL")
+    db.execute("PRAGMA synchronous=NORMAL")  # durable enough in WAL mode, and no fsync per batch
+    db.executescript(SCHEMA)
+    return db
+
+
+def flush(db):
+    """Write everything buffered so far in batches of ``BATCH``."""
+    global _buffer
+    with _lock:
+        pending, _buffer = _buffer, []
+    for i in range(0, len(pending), BATCH):
+        batch = pending[i:i + BATCH]
+        try:
+            with db:
+                db.executemany("INSERT INTO events (time, kind, name) VALUES (?, ?, ?)", batch)
+        except sqlite3.Error:
+            log.exception("dropping %d analytics events", len(batch))
+            _stats["failed"] += len(batch)
+        else:
+            _stats["written"] += len(batch)
+
+
+def _write_forever():
+    db = connect()
+    while True:
+        _wake.wait(FLUSH_INTERVAL)
+        _wake.clear()
+        flush(db)
+
+
+def _flush_at_exit():
+    if _buffer:
+        flush(connect())
+
+
+# --- ROUTES ---
+def _handlers():
+    import tornado.web
+
+    class BeaconHandler(tornado.web.RequestHandler):
+        def get(self, kind, name):
+            if kind == "section" and _section(name):
+                record(kind, name)
+            self.set_header("Cache-Control", "no-store")
+            self.set_status(204)
+
+    class GoHandler(tornado.web.RequestHandler):
+        def get(self, name):
+            target = _link(name)
+            if target is None:
+                raise tornado.web.HTTPError(404)
+            record("link", name)
+            self.set_header("Cache-Control", "no-store")
+            self.redirect(target)
+
+    return BeaconHandler, GoHandler
+
+
+def start():
+    """Start the writer and add the routes, once, under ``streamlit run`` only."""
+    global _started
+    if not ENABLED or _started or server.current() is None:
+        return
+    with _lock:
+        if _started:
+            return
+        beacon, go = _handlers()
+        if not server.add_routes([(f"{BEACON_PREFIX}/(section)/({NAME})", beacon),
+                                  (f"{GO_PREFIX}/({NAME})", go)]):
+            return
+        _started = True
+    threading.Thread(target=_write_forever, name="resume-analytics", daemon=True).start()
+    atexit.register(_flush_at_exit)
+
+
+def beacon_url(kind, name):
+    """URL that records ``kind``/``name`` when fetched, or None when not recording."""
+    return server.url(f"{BEACON_PREFIX}/{kind}/{event_name(name)}") if _started else None
+
+
+def link_url(project, link):
+    """Where a project link should point: through ``/resume-go`` when recording."""
+    return server.url(f"{GO_PREFIX}/{event_name(project)}") if _started else link
+
+
+def stats():
+    with _lock:
+        return dict(_stats, buffered=len(_buffer))
+
+
+# --- REPORT ---
+def report(db, days=None):
+    """``(kind, name, events, last seen)`` rows, most used first."""
+    since = time.time() - days * 86400 if days else 0
+    return db.execute(
+        "SELECT kind, name, COUNT(*), MAX(time) FROM events WHERE time >= ? "
+        "GROUP BY kind, name ORDER BY kind, COUNT(*) DESC, name", (since,)).fetchall()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--days", type=float, default=None, help="only the last N days")
+    parser.add_argument("--db", type=Path, default=DB_PATH)
+    args = parser.parse_args(argv)
+
+    if not args.db.exists():
+        print(f"no analytics recorded yet ({args.db})")
+        return
+    rows = report(connect(args.db), args.days)
+    print(f"{'kind':<8} {'name':<45} {'events':>7}  last seen (UTC)")
+    for kind, name, count, last in rows:
+        print(f"{kind:<8} {name:<45} {count:>7}  {time.strftime('%Y-%m-%d %H:%M', time.gmtime(last))}")
+    print(f"{sum(row[2] for row in rows)} events")
+
+
+if __name__ == "__main__":
+    main()
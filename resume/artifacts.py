@@ -0,0 +1,438 @@
+"""Downloadable CV files generated from ``resume.content``.
+
+``assets/CV.pdf`` used to be maintained by hand and drifted from what the
+apps show. Instead each format is rendered from the same content (whose
+work history, skills, education and certifications come from
+``assets/CV.docx``, see ``resume.cv``) into ``.cache/artifacts/`` under a
+name keyed by a hash of its inputs (the content and this module's code), so
+it is only rebuilt when one of those changes:
+
+- ``pdf``: A4, the PDF standard Helvetica fonts (no font files needed; text
+  outside Windows-1252, i.e. the emoji, is dropped);
+- ``docx``: a minimal WordprocessingML package with Title/Heading styles;
+- ``html``: a single self-contained, print-friendly page.
+
+Everything is standard library and deterministic. Build them ahead of
+serving so a download never waits on a render:
+
+    python -m resume.artifacts
+
+Other tenants (``resume.tenants``) get theirs on their first visit, named
+``CV-<tenant>.<hash>.<kind>`` so that pruning one never touches another's.
+"""
+import hashlib
+import html
+import io
+import os
+import threading
+import zipfile
+import zlib
+from pathlib import Path
+from xml.sax.saxutils import escape as xml_escape
+
+from resume import assets, tenants
+
+ROOT = Path(__file__).resolve().parent.parent
+CACHE_DIR = Path(os.environ.get("RESUME_ARTIFACTS_DIR", ROOT / ".cache" / "artifacts"))
+STEM = "CV"
+KINDS = ("pdf", "docx", "html")
+MIMETYPES = {
+    "pdf": "application/pdf",
+    "docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+    "html": "text/html",
+}
+
+_lock = threading.Lock()
+_keys = {}  # (tenant key, kind) -> artifact key
+
+
+def model(tenant=None):
+    """The structured resume every artifact is rendered from."""
+    content = tenant or tenants.current()
+    return {
+        "name": content.NAME,
+        "description": content.DESCRIPTION.strip(),
+        "email": content.EMAIL,
+        "social_media": dict(content.SOCIAL_MEDIA),
+        "experience": list(content.EXPERIENCE),
+        "skills": list(content.SKILLS),
+        "jobs": list(content.JOBS),
+        "education": list(content.EDUCATION),
+        "certifications": list(content.CERTIFICATIONS),
+        "projects": dict(content.PROJECTS),
+    }
+
+
+def _plain(text):
+    """``text`` without emoji and other decorations, trimmed."""
+    return "".join(c for c in text if c in "–’" or (ord(c) < 0x2000 and c.isprintable())).strip()
+
+
+# --- PDF ---
+# Advance widths (1/1000 em) of printable ASCII in the standard fonts.
+_HELVETICA = (
+    "278 278 355 556 556 889 667 191 333 333 389 584 278 333 278 278 556 556 556 556 556 556 556 556 556 556 "
+    "278 278 584 584 584 556 1015 667 667 722 722 667 611 778 722 278 500 667 556 833 722 778 667 778 722 667 "
+    "611 722 667 944 667 667 611 278 278 278 469 556 333 556 556 500 556 556 278 556 556 222 222 500 222 833 "
+    "556 556 556 556 333 500 278 556 500 722 500 500 500 334 260 334 584"
+)
+_HELVETICA_BOLD = (
+    "278 333 474 556 556 889 722 238 333 333 389 584 278 333 278 278 556 556 556 556 556 556 556 556 556 556 "
+    "333 333 584 584 584 611 975 722 722 722 722 667 611 778 722 278 556 722 611 833 722 778 667 778 722 667 "
+    "611 722 667 944 667 667 611 333 278 333 584 556 333 556 611 556 611 556 333 611 611 278 278 556 278 889 "
+    "611 611 611 611 389 556 333 611 556 778 556 556 500 389 280 389 584"
+)
+_WIDTHS = {"F1": list(map(int, _HELVETICA.split())), "F2": list(map(int, _HELVETICA_BOLD.split()))}
+_PAGE = (595, 842)  # A4 in points
+_MARGIN = 56
+_ACCENT = (0, 0.48, 1)  # the apps' #007bff
+
+
+def _text_width(text, font, size):
+    widths = _WIDTHS[font]
+    return sum(widths[ord(c) - 32] if 32 <= ord(c) < 127 else 556 for c in text) * size / 1000
+
+
+def _wrap(text, font, size, width):
+    lines, line = [], ""
+    for word in text.split():
+        candidate = f"{line} {word}" if line else word
+        if line and _text_width(candidate, font, size) > width:
+            lines.append(line)
+            line = word
+        else:
+            line = candidate
+    return lines + [line] if line else lines
+
+
+def _pdf_string(text):
+    out = []
+    for byte in text.encode("cp1252", "replace"):
+        char = chr(byte)
+        if char in "()\\":
+            out.append("\\" + char)
+        elif 32 <= byte < 127:
+            out.append(char)
+        else:
+            out.append(f"\\{byte:03o}")
+    return "(" + "".join(out) + ")"
+
+
+class _PdfPages:
+    """Lays out wrapped text top to bottom, starting new pages as needed."""
+
+    def __init__(self):
+        self.pages = []
+        self._new_page()
+
+    def _new_page(self):
+        self.ops = []
+        self.pages.append(self.ops)
+        self.y = _PAGE[1] - _MARGIN
+
+    def space(self, points):
+        self.y -= points
+
+    def text(self, text, size=10.5, font="F1", color=None, indent=0, bullet=None, after=2):
+        width = _PAGE[0] - 2 * _MARGIN - indent
+        leading = size * 1.35
+        for i, line in enumerate(_wrap(_plain(text), font, size, width)):
+            if self.y - leading < _MARGIN:
+                self._new_page()
+            self.y -= leading
+            if color:
+                self.ops.append("%g %g %g rg" % color)
+            if bullet and i == 0:
+                self.ops.append(f"BT /{font} {size:g} Tf {_MARGIN + indent - 10:g} {self.y:.2f} Td {_pdf_string(bullet)} Tj ET")
+            self.ops.append(f"BT /{font} {size:g} Tf {_MARGIN + indent:g} {self.y:.2f} Td {_pdf_string(line)} Tj ET")
+            if color:
+                self.ops.append("0 0 0 rg")
+        self.y -= after
+
+    def rule(self):
+        self.space(4)
+        self.ops.append(f"0.8 0.8 0.8 RG 0.5 w {_MARGIN} {self.y:.2f} m {_PAGE[0] - _MARGIN} {self.y:.2f} l S")
+        self.space(6)
+
+
+def render_pdf(resume):
+    doc = _PdfPages()
+    doc.text(resume["name"], size=22, font="F2", after=4)
+    doc.text(resume["description"], size=11)
+    doc.text(" | ".join([resume["email"], *resume["social_media"].values()]), size=9)
+
+    def heading(title):
+        doc.space(10)
+        doc.text(title, size=14, font="F2", color=_ACCENT)
+        doc.rule()
+
+    heading("Experience & Qualifications")
+    for line in resume["experience"]:
+        doc.text(line, indent=12, bullet="•")
+    heading("Skills")
+    for skill, details in resume["skills"]:
+        doc.text(f"{_plain(skill)}: {details}", indent=12, bullet="•")
+    heading("Work History")
+    for role, dates, bullets in resume["jobs"]:
+        doc.space(4)
+        doc.text(role, size=11, font="F2", after=0)
+        doc.text(dates, size=9.5, color=(0.35, 0.35, 0.35))
+        for bullet in bullets:
+            doc.text(bullet, size=10, indent=12, bullet="•")
+    if resume["education"]:
+        heading("Education")
+        for title, details in resume["education"]:
+            doc.space(4)
+            doc.text(title, size=11, font="F2", after=0)
+            doc.text(details, size=9.5, color=(0.35, 0.35, 0.35))
+    if resume["certifications"]:
+        heading("Certifications")
+        for line in resume["certifications"]:
+            doc.text(line, indent=12, bullet="•")
+    heading("Projects & Accomplishments")
+    for project, link in resume["projects"].items():
+        doc.text(project, size=11, font="F2", after=0)
+        doc.text(link, size=9.5, color=_ACCENT)
+
+    # Objects: 1 catalog, 2 page tree, 3-4 fonts, 5 info, then page/contents pairs.
+    objects = [None, None,
+               b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>",
+               b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica-Bold /Encoding /WinAnsiEncoding >>",
+               b"<< /Title " + _pdf_string(f"{_plain(resume['name'])} - CV").encode() + b" /Producer (resume.artifacts) >>"]
+    kids = []
+    for ops in doc.pages:
+        stream = zlib.compress("\n".join(ops).encode("latin-1"), 9)
+        page_id, contents_id = len(objects) + 1, len(objects) + 2
+        kids.append(f"{page_id} 0 R")
+        objects.append(f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 {_PAGE[0]} {_PAGE[1]}] "
+                       f"/Resources << /Font << /F1 3 0 R /F2 4 0 R >> >> /Contents {contents_id} 0 R >>".encode())
+        objects.append(f"<< /Length {len(stream)} /Filter /FlateDecode >>\nstream\n".encode() + stream + b"\nendstream")
+    objects[0] = b"<< /Type /Catalog /Pages 2 0 R >>"
+    objects[1] = f"<< /Type /Pages /Kids [{' '.join(kids)}] /Count {len(kids)} >>".encode()
+
+    out = io.BytesIO()
+    out.write(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(out.tell())
+        out.write(f"{number} 0 obj\n".encode() + body + b"\nendobj\n")
+    xref = out.tell()
+    out.write(f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode())
+    out.write("".join(f"{offset:010d} 00000 n \n" for offset in offsets).encode())
+    out.write(f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R /Info 5 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode())
+    return out.getvalue()
+
+
+# --- DOCX ---
+_W = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+_DOCX_PARTS = {
+    "[Content_Types].xml": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/word/document.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+        '<Override PartName="/word/styles.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.styles+xml"/>'
+        '</Types>'
+    ),
+    "_rels/.rels": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+        'Target="word/document.xml"/></Relationships>'
+    ),
+    "word/_rels/document.xml.rels": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" '
+        'Target="styles.xml"/></Relationships>'
+    ),
+    "word/styles.xml": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        f'<w:styles xmlns:w="{_W}">'
+        '<w:docDefaults><w:rPrDefault><w:rPr><w:rFonts w:ascii="Calibri" w:hAnsi="Calibri"/>'
+        '<w:sz w:val="21"/></w:rPr></w:rPrDefault>'
+        '<w:pPrDefault><w:pPr><w:spacing w:after="60"/></w:pPr></w:pPrDefault></w:docDefaults>'
+        '<w:style w:type="paragraph" w:default="1" w:styleId="Normal"><w:name w:val="Normal"/></w:style>'
+        '<w:style w:type="paragraph" w:styleId="Title"><w:name w:val="Title"/><w:basedOn w:val="Normal"/>'
+        '<w:rPr><w:b/><w:sz w:val="44"/></w:rPr></w:style>'
+        '<w:style w:type="paragraph" w:styleId="Heading1"><w:name w:val="heading 1"/><w:basedOn w:val="Normal"/>'
+        '<w:pPr><w:keepNext/><w:spacing w:before="240" w:after="80"/><w:outlineLvl w:val="0"/></w:pPr>'
+        '<w:rPr><w:b/><w:color w:val="007BFF"/><w:sz w:val="28"/></w:rPr></w:style>'
+        '<w:style w:type="paragraph" w:styleId="Heading2"><w:name w:val="heading 2"/><w:basedOn w:val="Normal"/>'
+        '<w:pPr><w:keepNext/><w:spacing w:before="120" w:after="0"/><w:outlineLvl w:val="1"/></w:pPr>'
+        '<w:rPr><w:b/><w:sz w:val="22"/></w:rPr></w:style>'
+        '<w:style w:type="paragraph" w:styleId="ListBullet"><w:name w:val="List Bullet"/><w:basedOn w:val="Normal"/>'
+        '<w:pPr><w:ind w:left="360" w:hanging="180"/></w:pPr></w:style>'
+        '</w:styles>'
+    ),
+}
+
+
+def _paragraph(text, style=None):
+    props = f'<w:pPr><w:pStyle w:val="{style}"/></w:pPr>' if style else ""
+    return f'<w:p>{props}<w:r><w:t xml:space="preserve">{xml_escape(text)}</w:t></w:r></w:p>'
+
+
+def render_docx(resume):
+    body = [
+        _paragraph(resume["name"], "Title"),
+        _paragraph(resume["description"]),
+        _paragraph(" | ".join([resume["email"], *resume["social_media"].values()])),
+        _paragraph("Experience & Qualifications", "Heading1"),
+        *(_paragraph(line, "ListBullet") for line in resume["experience"]),
+        _paragraph("Skills", "Heading1"),
+        *(_paragraph(f"{skill}: {details}", "ListBullet") for skill, details in resume["skills"]),
+        _paragraph("Work History", "Heading1"),
+    ]
+    for role, dates, bullets in resume["jobs"]:
+        body += [_paragraph(role, "Heading2"), _paragraph(dates)]
+        body += [_paragraph(f"• {bullet}", "ListBullet") for bullet in bullets]
+    if resume["education"]:
+        body.append(_paragraph("Education", "Heading1"))
+        for title, details in resume["education"]:
+            body += [_paragraph(title, "Heading2"), _paragraph(details)]
+    if resume["certifications"]:
+        body.append(_paragraph("Certifications", "Heading1"))
+        body += [_paragraph(f"• {line}", "ListBullet") for line in resume["certifications"]]
+    body.append(_paragraph("Projects & Accomplishments", "Heading1"))
+    for project, link in resume["projects"].items():
+        body += [_paragraph(project, "Heading2"), _paragraph(link)]
+    document = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        f'<w:document xmlns:w="{_W}"><w:body>{"".join(body)}'
+        '<w:sectPr><w:pgSz w:w="11906" w:h="16838"/>'
+        '<w:pgMar w:top="1134" w:right="1134" w:bottom="1134" w:left="1134"/></w:sectPr>'
+        '</w:body></w:document>'
+    )
+
+    out = io.BytesIO()
+    with zipfile.ZipFile(out, "w", zipfile.ZIP_DEFLATED) as package:
+        for name, data in sorted({**_DOCX_PARTS, "word/document.xml": document}.items()):
+            # A fixed timestamp keeps the package byte-for-byte reproducible.
+            info = zipfile.ZipInfo(name, date_time=(1980, 1, 1, 0, 0, 0))
+            info.compress_type = zipfile.ZIP_DEFLATED
+            package.writestr(info, data)
+    return out.getvalue()
+
+
+# --- HTML ---
+_HTML_CSS = """\
+body {font-family: Helvetica, Arial, sans-serif; max-width: 720px; margin: 2rem auto; padding: 0 1rem;
+      color: #222; line-height: 1.45;}
+h1 {margin-bottom: 0;} h2 {color: #007bff; border-bottom: 1px solid #ccc;} h3 {margin: 1rem 0 0;}
+.dates {color: #595959; margin: 0;} a {color: #007bff;}
+@media print {body {margin: 0; max-width: none;} a {color: inherit; text-decoration: none;}}
+"""
+
+
+def render_html(resume):
+    esc = html.escape
+    links = " | ".join(
+        [f'<a href="mailto:{esc(resume["email"])}">{esc(resume["email"])}</a>']
+        + [f'<a href="{esc(url)}">{esc(name)}</a>' for name, url in resume["social_media"].items()]
+    )
+    items = lambda lines: "<ul>\n" + "\n".join(f"<li>{esc(line)}</li>" for line in lines) + "\n</ul>"
+    jobs = "\n".join(
+        f'<h3>{esc(role)}</h3>\n<p class="dates">{esc(dates)}</p>\n{items(bullets)}'
+        for role, dates, bullets in resume["jobs"]
+    )
+    education = "".join(
+        f'<h3>{esc(title)}</h3>\n<p class="dates">{esc(details)}</p>\n' for title, details in resume["education"]
+    )
+    if education:
+        education = f"<h2>Education</h2>\n{education}"
+    certifications = f'<h2>Certifications</h2>\n{items(resume["certifications"])}\n' if resume["certifications"] else ""
+    projects = "\n".join(
+        f'<h3>{esc(project)}</h3>\n<p><a href="{esc(link)}">{esc(link)}</a></p>'
+        for project, link in resume["projects"].items()
+    )
+    return f"""<!doctype html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{esc(resume["name"])} - CV</title>
+<style>
+{_HTML_CSS}</style>
+</head>
+<body>
+<h1>{esc(resume["name"])}</h1>
+<p>{esc(resume["description"])}</p>
+<p>{links}</p>
+<h2>Experience &amp; Qualifications</h2>
+{items(resume["experience"])}
+<h2>Skills</h2>
+{items(f"{skill}: {details}" for skill, details in resume["skills"])}
+<h2>Work History</h2>
+{jobs}
+{education}{certifications}<h2>Projects &amp; Accomplishments</h2>
+{projects}
+</body>
+</html>
+""".encode()
+
+
+RENDERERS = {"pdf": render_pdf, "docx": render_docx, "html": render_html}
+
+
+# --- CACHE ---
+def key(kind, tenant=None):
+    """Hash of everything ``kind`` is rendered from: the content and this code."""
+    tenant = tenant or tenants.current()
+    if (tenant.key, kind) not in _keys:
+        digest = hashlib.sha256(f"{kind}\n{model(tenant)!r}\n".encode())
+        digest.update(assets.digest(__file__).encode())
+        _keys[tenant.key, kind] = digest.hexdigest()
+    return _keys[tenant.key, kind]
+
+
+def _stem(tenant):
+    return STEM if tenant.is_default else f"{STEM}-{tenant.id}"
+
+
+def filename(kind):
+    """The name a download of ``kind`` should be saved as."""
+    return f"{STEM}.{kind}"
+
+
+def path(kind, tenant=None):
+    """Path of the current ``kind`` artifact, rendering it if it is missing."""
+    tenant = tenant or tenants.current()
+    digest = key(kind, tenant)
+    target = CACHE_DIR / f"{_stem(tenant)}.{digest[:12]}.{kind}"
+    if not target.exists():
+        with _lock:
+            if not target.exists():
+                data = RENDERERS[kind](model(tenant))
+                target.parent.mkdir(parents=True, exist_ok=True)
+                tmp = target.with_name(f".{target.name}.{os.getpid()}")
+                tmp.write_bytes(data)
+                os.replace(tmp, target)
+                _prune(_stem(tenant), kind, digest)
+    return target
+
+
+def _prune(stem, kind, digest):
+    """Remove ``kind`` artifacts rendered from older inputs."""
+    for old in CACHE_DIR.glob(f"{stem}.*.{kind}"):
+        if old.name.split(".")[1] != digest[:12]:
+            old.unlink(missing_ok=True)
+
+
+def read_bytes(kind, tenant=None):
+    """Bytes of the current ``kind`` artifact, served from the asset cache."""
+    return assets.read_bytes(path(kind, tenant))
+
+
+def build(tenant=None):
+    """Render any artifact whose inputs changed; returns the current paths."""
+    return [path(kind, tenant or tenants.DEFAULT) for kind in KINDS]
+
+
+if __name__ == "__main__":
+    for target in build():
+        print(f"{target.stat().st_size:>9,}  {target.relative_to(ROOT)}")
@@ -0,0 +1,137 @@
+"""Process-wide cache for the files every rerun reads (CSS, CV, images).
+
+Streamlit re-executes ``app.py`` on every interaction, but imported modules
+stay in ``sys.modules`` for the life of the server process. Keeping the
+cache here means each file is read (and each image decoded) once per process
+and shared by every session as immutable ``bytes``.
+
+Entries are revalidated with a single ``stat`` call. When the mtime or size
+changes the file is re-read; decoded objects are only thrown away if the
+content hash actually changed.
+
+The cache holds at most ``RESUME_ASSET_CACHE_BYTES`` (default 64 MiB) of
+file contents and decoded images, evicting the least recently used files
+first, so serving many tenants' images does not grow it without bound.
+
+``RESUME_SHARED_ASSETS=0`` turns the sharing off: every read then returns a
+fresh copy and every image is decoded again, the way the scripts behaved
+before this cache. It exists so ``python -m resume.memory`` can measure
+what sharing saves.
+"""
+import hashlib
+import io
+import os
+import threading
+from pathlib import Path
+
+from resume.lru import ByteLRU, MiB, budget
+
+SHARED = os.environ.get("RESUME_SHARED_ASSETS", "1") != "0"
+
+_lock = threading.Lock()
+_entries = ByteLRU(budget("RESUME_ASSET_CACHE_BYTES", 64 * MiB))
+_stats = {"hits": 0, "misses": 0, "reloads": 0}
+
+
+class _Entry:
+    __slots__ = ("mtime_ns", "size", "data", "digest", "decoded", "weight")
+
+    def __init__(self, st, data):
+        self.mtime_ns = st.st_mtime_ns
+        self.size = st.st_size
+        self.data = data
+        self.digest = hashlib.sha256(data).hexdigest()
+        self.decoded = {}
+        self.weight = self.size  # plus whatever has been decoded from it
+
+
+def _entry(path):
+    path = Path(path)
+    key = str(path.resolve())
+    st = os.stat(key)
+    with _lock:
+        entry = _entries.get(key)
+        if not SHARED:
+            entry = None
+        elif entry is not None and entry.mtime_ns == st.st_mtime_ns and entry.size == st.st_size:
+            _stats["hits"] += 1
+            return entry
+
+    data = path.read_bytes()
+    fresh = _Entry(st, data)
+    with _lock:
+        if entry is None:
+            _stats["misses"] += 1
+        else:
+            _stats["reloads"] += 1
+            if entry.digest == fresh.digest:
+                # Touched but unchanged: keep what we already decoded.
+                fresh.decoded, fresh.weight = entry.decoded, entry.weight
+        _entries.put(key, fresh, fresh.weight)
+    return fresh
+
+
+def _decoded(path, entry, kind, value, size):
+    """Keep ``value`` decoded from ``entry`` and count its ``size`` against the budget.
+
+    Returns the value to use: another rerun may have decoded it first.
+    """
+    key = str(Path(path).resolve())
+    with _lock:
+        if kind in entry.decoded:
+            return entry.decoded[kind]
+        entry.decoded[kind] = value
+        entry.weight += size
+        # Only re-weigh the entry if it is still the cached one; an evicted
+        # or replaced entry must not come back.
+        if _entries.get(key) is entry:
+            _entries.put(key, entry, entry.weight)
+    return value
+
+
+def read_bytes(path):
+    """Return the file contents as shared, immutable bytes."""
+    return _entry(path).data
+
+
+def read_text(path, encoding="utf-8"):
+    entry = _entry(path)
+    text = entry.decoded.get("text")
+    if text is None:
+        text = entry.data.decode(encoding)
+        text = _decoded(path, entry, "text", text, len(text))
+    return text
+
+
+def digest(path):
+    """SHA-256 of the current file contents."""
+    return _entry(path).digest
+
+
+def open_image(path):
+    """Return a decoded PIL image, decoded once per file version.
+
+    The image is shared between sessions, so callers must not mutate it.
+    """
+    entry = _entry(path)
+    image = entry.decoded.get("image")
+    if image is None:
+        from PIL import Image
+
+        image = Image.open(io.BytesIO(entry.data))
+        image.load()
+        image = _decoded(path, entry, "image", image, image.width * image.height * len(image.getbands()))
+    return image
+
+
+def stats():
+    with _lock:
+        return dict(_stats, entries=len(_entries), bytes=_entries.bytes, evictions=_entries.evictions)
+
+
+def clear():
+    with _lock:
+        _entries.clear()
+        _entries.evictions = 0
+        for name in _stats:
+            _stats[name] = 0
@@ -0,0 +1,163 @@
+"""Per-section render benchmarks for app.py and app2.py.
+
+Each script is run headlessly (see ``resume.headless``) once per sidebar
+option - or once for the whole page when there is no sidebar menu - and for
+every section we record the metrics below. The sections of ``app.py`` are
+measured with the option menu (``RESUME_NAV_MODE=server``) so that each has
+its own row; the page as the default client-side navigation sends it is
+measured too, as ``(page)``.
+
+- ``ms``: median script execution time over ``--repeat`` warm reruns;
+- ``deltas`` / ``bytes``: ForwardMsgs the browser would receive;
+- ``opens``: files opened during a warm rerun;
+- ``decodes`` / ``encodes``: PIL images opened or saved during a warm rerun.
+
+Results are compared against ``benchmarks/baseline.json`` and the command
+exits non-zero when a section regresses past the thresholds below:
+
+    python -m resume.bench            # compare against the baseline
+    python -m resume.bench --update   # record a new baseline
+"""
+import argparse
+import json
+import statistics
+import sys
+from pathlib import Path
+
+from resume import headless, layouts
+
+ROOT = Path(__file__).resolve().parent.parent
+SCRIPTS = ("app.py", "app2.py")
+BASELINE = ROOT / "benchmarks" / "baseline.json"
+
+# A section fails when a metric exceeds baseline * (1 + ratio) + slack.
+# Timings are noisy, so they get a generous ratio and an absolute floor.
+THRESHOLDS = {
+    "ms": (0.5, 2.0),
+    "deltas": (0.0, 0),
+    "bytes": (0.1, 0),
+    "opens": (0.0, 0),
+    "decodes": (0.0, 0),
+    "encodes": (0.0, 0),
+}
+
+
+class _Probe:
+    """Counts file opens and PIL decode/encode calls while ``active``."""
+
+    def __init__(self):
+        self.active = False
+        self.counts = dict(opens=0, decodes=0, encodes=0)
+        sys.addaudithook(self._audit)
+        from PIL import Image
+
+        self._open, self._save = Image.open, Image.Image.save
+        probe = self
+
+        def counting_open(*args, **kwargs):
+            if probe.active:
+                probe.counts["decodes"] += 1
+            return probe._open(*args, **kwargs)
+
+        def counting_save(image, *args, **kwargs):
+            if probe.active:
+                probe.counts["encodes"] += 1
+            return probe._save(image, *args, **kwargs)
+
+        Image.open, Image.Image.save = counting_open, counting_save
+
+    def _audit(self, event, args):
+        if self.active and event == "open":
+            self.counts["opens"] += 1
+
+    def measure(self, fn):
+        for name in self.counts:
+            self.counts[name] = 0
+        self.active = True
+        try:
+            result = fn()
+        finally:
+            self.active = False
+        return result, dict(self.counts)
+
+
+def run(scripts=SCRIPTS, repeat=5):
+    """Return ``{"script::section": metrics}`` for every section of ``scripts``."""
+    probe = _Probe()
+    results = {}
+    default = layouts.NAV_MODE
+    try:
+        for nav_mode in ("server", "client"):
+            layouts.NAV_MODE = nav_mode
+            for script in scripts:
+                path = ROOT / script
+                for section in [name for name, _ in headless.sections(path)]:
+                    if f"{script}::{section}" not in results:
+                        results[f"{script}::{section}"] = _measure(probe, path, section, repeat)
+    finally:
+        layouts.NAV_MODE = default
+    return results
+
+
+def _measure(probe, path, section, repeat):
+    session = headless.Session(path)
+    render = session.run if section == "(page)" else (lambda: session.select(section))
+    cold = render()
+    runs = []
+    for _ in range(repeat):
+        last, counts = probe.measure(render)
+        runs.append(last.seconds)
+    return dict(
+        ms=round(statistics.median(runs) * 1000, 2),
+        cold_ms=round(cold.seconds * 1000, 2),
+        deltas=last.deltas,
+        bytes=last.bytes,
+        **counts,
+    )
+
+
+def compare(results, baseline):
+    """Yield a human-readable line for every metric that regressed."""
+    for key, metrics in results.items():
+        base = baseline.get(key)
+        if base is None:
+            continue
+        for name, (ratio, slack) in THRESHOLDS.items():
+            if name in base and metrics[name] > base[name] * (1 + ratio) + slack:
+                yield f"{key}: {name} {base[name]} -> {metrics[name]}"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("scripts", nargs="*", default=list(SCRIPTS))
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--baseline", type=Path, default=BASELINE)
+    parser.add_argument("--update", action="store_true", help="write the results as the new baseline")
+    args = parser.parse_args(argv)
+
+    results = run(args.scripts, args.repeat)
+    columns = ("ms", "cold_ms", "deltas", "bytes", "opens", "decodes", "encodes")
+    width = max(map(len, results))
+    print(f"{'section':<{width}}  " + "  ".join(f"{c:>8}" for c in columns))
+    for key, metrics in results.items():
+        print(f"{key:<{width}}  " + "  ".join(f"{metrics[c]:>8}" for c in columns))
+
+    if args.update:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(results, indent=2, sort_keys=True) + "\n")
+        print(f"baseline written to {args.baseline}")
+        return 0
+
+    try:
+        baseline = json.loads(args.baseline.read_text())
+    except FileNotFoundError:
+        print(f"no baseline at {args.baseline}; run with --update first")
+        return 0
+    regressions = list(compare(results, baseline))
+    for line in regressions:
+        print(f"REGRESSION {line}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
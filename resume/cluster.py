@@ -0,0 +1,308 @@
+"""Serve one app from several Streamlit processes behind a sticky proxy.
+
+A single ``streamlit run`` handles every websocket session in one process,
+so one core does all the work. This starts ``--workers`` copies of the app
+on local ports and puts a small asyncio reverse proxy in front of them:
+
+- sticky sessions: the first response sets a ``resume_worker`` cookie and
+  every later request from that browser (the ``/stream`` websocket, ``/media``
+  files registered by its session) goes to the same worker;
+- health checks: workers run under ``resume.prewarm``, and each one's
+  ``/readyz`` is polled; workers that are unhealthy or still warming up get
+  no new visitors;
+- restarts: a worker that exits, or stays unhealthy, is (re)started with a
+  backoff. Visitors pinned to it are moved to another worker.
+
+The worker count defaults to ``WEB_CONCURRENCY`` (set by Heroku per dyno
+size) or the number of usable cores:
+
+    python -m resume.cluster app.py --port 8501 --workers 4
+
+Anything after ``--`` is passed to every worker's ``streamlit run``.
+"""
+import argparse
+import asyncio
+import logging
+import os
+import secrets
+import signal
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from resume import httpclient
+
+ROOT = Path(__file__).resolve().parent.parent
+COOKIE = "resume_worker"
+HEALTH_PATH = "/readyz"  # see resume/prewarm.py
+HEALTH_INTERVAL = 2.0
+HEALTH_TIMEOUT = 2.0
+UNHEALTHY_AFTER = 3  # consecutive failed checks before a live worker is restarted
+STARTUP_GRACE = 30.0  # seconds a new worker has to become healthy
+WAIT_FOR_WORKER = 30.0  # how long a request waits for any healthy worker
+RESTART_DELAY = (1.0, 30.0)  # initial and maximum backoff
+
+log = logging.getLogger("resume.cluster")
+
+
+def default_workers():
+    if os.environ.get("WEB_CONCURRENCY"):
+        return int(os.environ["WEB_CONCURRENCY"])
+    return len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count() or 1
+
+
+class Worker:
+    def __init__(self, index, port, command, env):
+        self.index = index
+        self.port = port
+        self.command = command
+        self.env = env
+        self.process = None
+        self.started = 0.0
+        self.healthy = False
+        self.failures = 0
+        self.restarts = 0
+        self.delay = RESTART_DELAY[0]
+        self.connections = 0
+        self.restarting = None  # the pending restart task, if any
+
+    def start(self):
+        self.process = subprocess.Popen(self.command, cwd=ROOT, env=self.env)
+        self.started = time.monotonic()
+        self.healthy = False
+        self.failures = 0
+        log.info("worker %d started on port %d (pid %d)", self.index, self.port, self.process.pid)
+
+    def stop(self):
+        if self.process and self.process.poll() is None:
+            self.process.terminate()
+            try:
+                self.process.wait(10)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+                self.process.wait()
+        self.healthy = False
+
+    @property
+    def alive(self):
+        return self.process is not None and self.process.poll() is None
+
+
+async def check(port, path=HEALTH_PATH):
+    """True when ``GET path`` on the local ``port`` answers 200."""
+    try:
+        reader, writer = await asyncio.wait_for(asyncio.open_connection("127.0.0.1", port), HEALTH_TIMEOUT)
+    except (OSError, asyncio.TimeoutError):
+        return False
+    try:
+        writer.write(f"GET {path} HTTP/1.0\r\nHost: 127.0.0.1\r\n\r\n".encode())
+        status = await asyncio.wait_for(reader.readline(), HEALTH_TIMEOUT)
+        return status.split(b" ")[1:2] == [b"200"]
+    except (OSError, asyncio.TimeoutError):
+        return False
+    finally:
+        writer.close()
+
+
+class Cluster:
+    def __init__(self, script, workers, base_port, streamlit_args=()):
+        # Workers share a cookie secret so a browser's XSRF cookie stays
+        # valid if it has to be moved to another worker.
+        secret = os.environ.get("STREAMLIT_SERVER_COOKIE_SECRET") or secrets.token_hex(16)
+        self.workers = []
+        for index in range(workers):
+            port = base_port + index
+            command = [
+                sys.executable, "-m", "resume.prewarm", script,
+                "--server.headless", "true", "--server.address", "127.0.0.1",
+                "--server.port", str(port), "--server.cookieSecret", secret,
+                *streamlit_args,
+            ]
+            env = dict(os.environ)
+            if env.get("RESUME_METRICS_PORT"):
+                env["RESUME_METRICS_PORT"] = str(int(env["RESUME_METRICS_PORT"]) + index)
+            self.workers.append(Worker(index, port, command, env))
+        self._next = 0
+
+    # --- ROUTING ---
+    def pick(self, pinned=None):
+        """The worker for a request: the pinned one if healthy, else the least busy."""
+        if pinned is not None and 0 <= pinned < len(self.workers) and self.workers[pinned].healthy:
+            return self.workers[pinned]
+        healthy = [w for w in self.workers if w.healthy]
+        if not healthy:
+            return None
+        # Rotate the starting point so ties don't all land on worker 0.
+        self._next = (self._next + 1) % len(healthy)
+        rotated = healthy[self._next:] + healthy[:self._next]
+        return min(rotated, key=lambda w: w.connections)
+
+    async def wait_pick(self, pinned):
+        deadline = time.monotonic() + WAIT_FOR_WORKER
+        while True:
+            worker = self.pick(pinned)
+            if worker or time.monotonic() > deadline:
+                return worker
+            await asyncio.sleep(0.1)
+
+    # --- PROXY ---
+    async def handle(self, client_reader, client_writer):
+        try:
+            head = await client_reader.readuntil(b"\r\n\r\n")
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+            client_writer.close()
+            return
+        pinned = _pinned_worker(head)
+        worker = await self.wait_pick(pinned)
+        if worker is None:
+            client_writer.write(b"HTTP/1.1 503 Service Unavailable\r\nContent-Length: 0\r\nConnection: close\r\n\r\n")
+            client_writer.close()
+            return
+
+        try:
+            upstream_reader, upstream_writer = await asyncio.open_connection("127.0.0.1", worker.port)
+        except OSError:
+            worker.healthy = False
+            client_writer.write(b"HTTP/1.1 502 Bad Gateway\r\nContent-Length: 0\r\nConnection: close\r\n\r\n")
+            client_writer.close()
+            return
+
+        worker.connections += 1
+        upstream_writer.write(head)
+        # Everything after the first request head (its body, further
+        # keep-alive requests, websocket frames) goes to the same worker.
+        to_upstream = asyncio.create_task(_pipe(client_reader, upstream_writer))
+        try:
+            response = await upstream_reader.readuntil(b"\r\n\r\n")
+            if pinned != worker.index:
+                cookie = f"Set-Cookie: {COOKIE}={worker.index}; Path=/; HttpOnly; SameSite=Lax\r\n"
+                response = response[:-2] + cookie.encode() + b"\r\n"
+            client_writer.write(response)
+            await _pipe(upstream_reader, client_writer)
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+            pass
+        finally:
+            to_upstream.cancel()
+            worker.connections -= 1
+            upstream_writer.close()
+            client_writer.close()
+
+    # --- SUPERVISION ---
+    async def supervise(self):
+        for worker in self.workers:
+            worker.start()
+        while True:
+            await asyncio.gather(*(self._check(worker) for worker in self.workers))
+            await asyncio.sleep(HEALTH_INTERVAL)
+
+    async def _check(self, worker):
+        if worker.restarting:
+            return
+        if not worker.alive:
+            log.warning("worker %d exited with %s", worker.index, worker.process.returncode)
+            self._restart(worker)
+            return
+        ok = await check(worker.port)
+        if ok:
+            if not worker.healthy:
+                log.info("worker %d healthy", worker.index)
+            worker.healthy, worker.failures = True, 0
+            if time.monotonic() - worker.started > 60:
+                worker.delay = RESTART_DELAY[0]
+            return
+        worker.healthy = False
+        if time.monotonic() - worker.started < STARTUP_GRACE:
+            return
+        worker.failures += 1
+        if worker.failures >= UNHEALTHY_AFTER:
+            log.warning("worker %d failed %d health checks", worker.index, worker.failures)
+            self._restart(worker)
+
+    def _restart(self, worker):
+        # Runs beside the health checks so one worker's backoff doesn't hold
+        # up the others.
+        async def restart():
+            await asyncio.to_thread(worker.stop)
+            await asyncio.sleep(delay)
+            worker.start()
+            worker.restarting = None
+
+        worker.healthy = False
+        worker.restarts += 1
+        delay, worker.delay = worker.delay, min(worker.delay * 2, RESTART_DELAY[1])
+        worker.restarting = asyncio.create_task(restart())
+
+    def stop(self):
+        for worker in self.workers:
+            worker.stop()
+
+
+def _pinned_worker(head):
+    for line in head.split(b"\r\n")[1:]:
+        name, _, value = line.partition(b":")
+        if name.strip().lower() != b"cookie":
+            continue
+        for pair in value.split(b";"):
+            key, _, index = pair.strip().partition(b"=")
+            if key == COOKIE.encode() and index.isdigit():
+                return int(index)
+    return None
+
+
+async def _pipe(reader, writer):
+    try:
+        while True:
+            data = await reader.read(65536)
+            if not data:
+                break
+            writer.write(data)
+            await writer.drain()
+    except ConnectionError:
+        pass
+    finally:
+        if writer.can_write_eof():
+            try:
+                writer.write_eof()
+            except OSError:
+                pass
+
+
+async def serve(cluster, host, port):
+    loop = asyncio.get_running_loop()
+    stopped = loop.create_future()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, lambda: stopped.done() or stopped.set_result(None))
+
+    server = await asyncio.start_server(cluster.handle, host, port, limit=httpclient.MAX_HEAD)
+    supervisor = asyncio.create_task(cluster.supervise())
+    log.info("proxy listening on %s:%d for %d workers", host, port, len(cluster.workers))
+    try:
+        await stopped
+    finally:
+        supervisor.cancel()
+        server.close()
+        cluster.stop()
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    streamlit_args = []
+    if "--" in argv:
+        argv, streamlit_args = argv[:argv.index("--")], argv[argv.index("--") + 1:]
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("script", nargs="?", default="app.py")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=int(os.environ.get("PORT", 8501)))
+    parser.add_argument("--workers", type=int, default=default_workers())
+    parser.add_argument("--worker-port", type=int, default=None,
+                        help="first worker port (default: --port + 1)")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s %(message)s")
+    cluster = Cluster(args.script, max(args.workers, 1), args.worker_port or args.port + 1, streamlit_args)
+    asyncio.run(serve(cluster, args.host, args.port))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""Measure cold start: process launch to the first completed script run.
+
+A sleeping dyno's first visitor waits for all of it, so each script is
+started in a fresh process, with plain ``streamlit run`` ("cold") and with
+``python -m resume.prewarm`` ("prewarm"), and we record:
+
+- ``server_ready``: until ``/healthz`` (cold) or ``/readyz`` (prewarm)
+  answers 200;
+- ``first_script``: launch until the first visitor's script run sends
+  ``script_finished``;
+- ``first_visit``: that first script run alone, from connecting;
+- ``steady``: the same for the visitors after it (median of ``VISITORS``).
+
+``first_visit`` against ``steady`` is what the first visitor pays for
+being first. Each figure is the median over ``--runs`` launches, since the
+occasional launch is a second slower for no reason of ours. The command
+exits non-zero when ``first_script`` goes over the budget:
+
+    python -m resume.coldstart                # both apps, both modes
+    python -m resume.coldstart --budget 4 --mode prewarm app.py
+"""
+import argparse
+import asyncio
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+from pathlib import Path
+
+from resume.wsclient import StreamlitSession
+
+ROOT = Path(__file__).resolve().parent.parent
+SCRIPTS = ("app.py", "app2.py")
+HOST = "127.0.0.1"
+# Seconds from launch to first script_finished. Measured at ~1.9s for either
+# app on a warm page cache; the slack covers a slower dyno filesystem.
+BUDGET = 3.0
+TIMEOUT = 60.0
+VISITORS = 5  # after the first, for the steady-state figure
+READY_PATHS = {False: "/healthz", True: "/readyz"}
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind((HOST, 0))
+        return sock.getsockname()[1]
+
+
+def launch(script, port, *options, env=None, prewarm=False):
+    command = ["resume.prewarm", script] if prewarm else ["streamlit", "run", script]
+    return subprocess.Popen(
+        [sys.executable, "-m", *command,
+         "--server.headless", "true", "--server.port", str(port), "--server.address", HOST,
+         "--browser.gatherUsageStats", "false", *options],
+        cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+
+
+def wait_healthy(port, deadline, path="/healthz"):
+    while time.monotonic() < deadline:
+        try:
+            with urllib.request.urlopen(f"http://{HOST}:{port}{path}", timeout=1) as response:
+                if response.status == 200:
+                    return
+        except OSError:
+            pass
+        time.sleep(0.02)
+    raise TimeoutError(f"{path} on port {port} not ready after {TIMEOUT:.0f}s")
+
+
+def measure(script, prewarm=False):
+    port = free_port()
+    start = time.monotonic()
+    process = launch(script, port, prewarm=prewarm)
+    try:
+        wait_healthy(port, start + TIMEOUT, READY_PATHS[prewarm])
+        server_ready = time.monotonic() - start
+
+        async def visit():
+            t = time.monotonic()
+            session = await StreamlitSession.connect(HOST, port)
+            try:
+                await session.rerun()
+            finally:
+                await session.close()
+            return time.monotonic() - t
+
+        async def drive():
+            first_visit = await visit()
+            first_script = time.monotonic() - start
+            steady = statistics.median([await visit() for _ in range(VISITORS)])
+            return first_script, first_visit, steady
+
+        first_script, first_visit, steady = asyncio.run(asyncio.wait_for(drive(), TIMEOUT))
+    finally:
+        process.terminate()
+        process.wait()
+    return {"server_ready": server_ready, "first_script": first_script, "first_visit": first_visit, "steady": steady}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("scripts", nargs="*", default=list(SCRIPTS))
+    parser.add_argument("--budget", type=float, default=BUDGET, help="seconds to first script_finished")
+    parser.add_argument("--runs", type=int, default=3, help="launches per script")
+    parser.add_argument("--mode", choices=("cold", "prewarm", "both"), default="both")
+    args = parser.parse_args(argv)
+
+    modes = {"cold": [False], "prewarm": [True], "both": [False, True]}[args.mode]
+    columns = ("server_ready", "first_script", "first_visit", "steady")
+    print(f"{'script':<10}  {'mode':<8}  " + "  ".join(f"{c:>12}" for c in columns))
+    over = []
+    for script in args.scripts:
+        for prewarm in modes:
+            mode = "prewarm" if prewarm else "cold"
+            runs = [measure(script, prewarm) for _ in range(args.runs)]
+            result = {c: statistics.median(run[c] for run in runs) for c in columns}
+            print(f"{script:<10}  {mode:<8}  " + "  ".join(f"{result[c]:>11.3f}s" for c in columns))
+            if result["first_script"] > args.budget:
+                over.append(f"{script} ({mode}): first script run after "
+                            f"{result['first_script']:.2f}s > {args.budget:.2f}s")
+    for line in over:
+        print(f"OVER BUDGET {line}")
+    return 1 if over else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,52 @@
+"""The resume itself: everything the apps and the static export render."""
+from resume import cv
+
+PAGE_TITLE = "Digital CV | Cheshi Emmanuel"
+PAGE_ICON = ":wave:"
+NAME = "Cheshi Emmanuel"
+DESCRIPTION = """
+Data Analyst, Data Scientist, Digital Skills Trainer/Instructor, Machine Learning Engineer
+"""
+EMAIL = "emmychesh@yahoo.com"
+SOCIAL_MEDIA = {
+    "Facebook": "https://facebook.com/emmanuel.cheshi",
+    "LinkedIn": "https://www.linkedin.com/in/emmanuel-cheshi-b50abb154/",
+    "GitHub": "https://github.com/EmmyChesh",
+    "Twitter": "https://twitter.com/emmychesh17",
+}
+PROJECTS = {
+    "🏆 Analytical Dashboards - Various Analysis": "https://github.com/EmmyChesh/Analytical-Dashboards",
+    "🏆 Text To Speech Web-App and Language Converter": "https://emmychesh-text-to-speech-trans.streamlit.app",
+    "🏆 Car Price Predictor Web App": "https://emmycheshpredictorapp.streamlit.app",
+    "🏆 Diamond Price Predictor Web App": "https://emmychesh-diamonds.streamlit.app",
+    "🏆 Image Attendance and Security System Register": "https://github.com/EmmyChesh/Image-Attendance-and-Security-System",
+    "🏆 Lip Reading Deep Learning App": "https://github.com/EmmyChesh/Lip-Reading-Deep-Learning-Model/tree/main/app",
+    "🏆 Alzheimer Disease Prediction Web App": "https://emmychesh-alzheimer.streamlit.app"
+}
+EXPERIENCE = [
+    "✔️ 5+ years of experience extracting actionable insights from data",
+    "✔️ 3+ years of experience creating and deploying robust Machine Learning models",
+    "✔️ 3+ years as a data science/analytics instructor, facilitating comprehensive learning experiences",
+    "✔️ Hands-on experience with Python, Excel, Power BI, SQL",
+    "✔️ Strong understanding of statistical principles and analysis",
+    "✔️ Excellent team player with a strong sense of initiative",
+]
+# Skills, work history, education and certifications are read from
+# assets/CV.docx (see resume/cv.py).
+_CV = cv.load()
+SKILLS = cv.skills(_CV)
+# (title, dates, bullets) - most recent first
+JOBS = cv.jobs(_CV)
+# (title, details) - most recent first
+EDUCATION = cv.education(_CV)
+CERTIFICATIONS = list(_CV["certifications"])
+PROJECT_IMAGES = {
+    "🏆 Analytical Dashboards - Various Analysis": "power_bi_dashboards.png",
+    "🏆 Text To Speech Web-App and Language Converter": "text_to_speech.png",
+    "🏆 Car Price Predictor Web App": "car_price_predictor.jpg",
+    "🏆 Diamond Price Predictor Web App": "diamond_price_predictor.jpg",
+    "🏆 Image Attendance and Security System Register": "image_attendance_register.jpeg",
+    "🏆 Lip Reading Deep Learning App": "lip_reading.jpg",
+    "🏆 Alzheimer Disease Prediction Web App": "alzheimer.jpg"
+}
+THANK_YOU = "Thank you for visiting my digital resume. Feel free to explore my projects and reach out to me through my social media channels or mail!"
@@ -0,0 +1,292 @@
+"""The work history and skills, read from ``assets/CV.docx``.
+
+The Word document is the canonical resume; ``resume.content`` takes its
+jobs and skills from here instead of keeping a second copy. A DOCX is a zip
+package, so only the standard library is needed: ``zipfile`` for the
+package and ``xml.etree`` for ``word/document.xml``.
+
+Parsing happens in two stages:
+
+1. The body is cut into sections at its top-level ``Heading1`` paragraphs,
+   on the raw XML. Each section is parsed into blocks, ``[style, numbered,
+   text]`` per paragraph, cached under a hash of that section's XML.
+2. The blocks are assembled into the model (name, contact, summary,
+   competencies, jobs, skills, education, certifications), which is cheap.
+
+Both are kept in ``.cache/cv.json`` (``RESUME_CV_CACHE``). The model is
+stored under the hash of the DOCX and of this module, so a start with an
+unchanged document reads the file to hash it and loads one JSON file;
+the package is not unzipped. When the document changes, only the
+sections whose XML changed are parsed again. A cache that cannot be
+written (a read-only deploy) only costs that parse on every start.
+
+If the document is missing or cannot be parsed, the last model in the
+cache is used, with a warning; without one, ``load`` raises a ValueError
+that names the file.
+
+    python -m resume.cv            # parse (incrementally) and summarise
+    python -m resume.cv --force    # ignore the cache
+"""
+import argparse
+import hashlib
+import io
+import json
+import logging
+import os
+import re
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+SOURCE = ROOT / "assets" / "CV.docx"
+CACHE_FILE = Path(os.environ.get("RESUME_CV_CACHE", ROOT / ".cache" / "cv.json"))
+DOCUMENT = "word/document.xml"
+
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_PARAGRAPH = re.compile(r"<w:p[ >]")
+_HEADING = re.compile(r'<w:pStyle w:val="Heading1"\s*/>')
+# Paragraphs inside these are not top level, so no section starts there.
+_NESTED = (("<w:tbl>", "</w:tbl>"), ("<w:txbxContent>", "</w:txbxContent>"))
+_CODE = hashlib.sha256(Path(__file__).read_bytes()).hexdigest()
+
+log = logging.getLogger("resume.cv")
+
+
+# --- STAGE 1: SECTIONS ---
+def _top_level(xml, position):
+    return all(xml.count(open_tag, 0, position) == xml.count(close_tag, 0, position)
+               for open_tag, close_tag in _NESTED)
+
+
+def split(xml):
+    """``(document start tag, [section XML])``; the sections cover the whole body."""
+    document_tag = xml[xml.index("<w:document"):xml.index(">", xml.index("<w:document")) + 1]
+    start = xml.index("<w:body>") + len("<w:body>")
+    end = xml.rindex("</w:body>")
+    cuts = []
+    for match in _HEADING.finditer(xml, start, end):
+        paragraph = max(m.start() for m in _PARAGRAPH.finditer(xml, start, match.start()))
+        if _top_level(xml, paragraph) and paragraph not in cuts:
+            cuts.append(paragraph)
+    bounds = [start, *[cut for cut in cuts if cut > start], end]
+    return document_tag, [xml[a:b] for a, b in zip(bounds, bounds[1:]) if xml[a:b].strip()]
+
+
+def _text(paragraph):
+    parts = []
+    for node in paragraph.iter():
+        if node.tag == f"{_W}t":
+            parts.append(node.text or "")
+        elif node.tag == f"{_W}tab":
+            parts.append("\t")
+        elif node.tag in (f"{_W}br", f"{_W}cr"):
+            parts.append("\n")
+    return "".join(parts)
+
+
+def parse_section(document_tag, section):
+    """The blocks of one section: ``[style, numbered, text]`` per paragraph."""
+    import xml.etree.ElementTree as ET
+
+    body = ET.fromstring(f"{document_tag}<w:body>{section}</w:body></w:document>").find(f"{_W}body")
+    blocks = []
+    for child in body:
+        for paragraph in [child] if child.tag == f"{_W}p" else child.iter(f"{_W}p"):
+            style = paragraph.find(f"{_W}pPr/{_W}pStyle")
+            numbered = paragraph.find(f"{_W}pPr/{_W}numPr") is not None
+            blocks.append([style.get(f"{_W}val") if style is not None else None, numbered, _text(paragraph)])
+    return blocks
+
+
+# --- STAGE 2: MODEL ---
+def _heading(text):
+    """Whether a paragraph reads as a heading: short and all capitals."""
+    return len(text) < 60 and text.isupper()
+
+
+def _plain(text):
+    """``text`` without leading bullets and decorations."""
+    return re.sub(r"^[^\w(]+", "", text).strip()
+
+
+def assemble(blocks):
+    """The resume model from every section's blocks, in document order."""
+    model = {"name": "", "contact": "", "summary": "", "competencies": [], "jobs": [], "skills": [],
+             "education": [], "certifications": [], "other": {}}
+    section = None
+    summary = []
+    for style, numbered, text in blocks:
+        text = text.strip()
+        if not text:
+            continue
+        # The summary itself is styled Heading1 too; only capitals start a section.
+        if style == "Heading1" and _heading(text):
+            section = text.lower()
+            continue
+        if section is None:
+            if not model["name"]:
+                model["name"] = text
+            elif not model["contact"]:
+                model["contact"] = re.sub(r"\s*\|\s*", " | ", text)
+        elif "summary" in section:
+            if numbered:
+                model["competencies"].append(_plain(text))
+            elif not _heading(text):
+                summary.append(text)
+        elif "experience" in section:
+            lines = [line.strip() for line in text.split("\n") if line.strip()]
+            if not numbered and len(lines) == 1 and _heading(lines[0]):
+                model["jobs"].append({"role": lines[0], "organisation": "", "dates": "", "bullets": []})
+            elif model["jobs"]:
+                job = model["jobs"][-1]
+                if not job["organisation"] and "|" in lines[0] and not numbered:
+                    job["organisation"], _, job["dates"] = (part.strip() for part in lines.pop(0).rpartition("|"))
+                job["bullets"] += [_plain(line) for line in lines]
+        elif "skill" in section:
+            if numbered and model["skills"]:
+                model["skills"][-1]["items"].append(_plain(text))
+            elif not numbered:
+                model["skills"].append({"group": _plain(text), "items": []})
+        elif "education" in section:
+            if numbered or not model["education"]:
+                model["education"].append({"title": _plain(text), "details": ""})
+            else:
+                model["education"][-1]["details"] = text
+        elif "certification" in section:
+            model["certifications"].append(_plain(text))
+        else:
+            model["other"].setdefault(section, []).append(text)
+    model["summary"] = "\n\n".join(summary)
+    return model
+
+
+# --- CACHE ---
+def _read_cache():
+    try:
+        cache = json.loads(CACHE_FILE.read_bytes())
+    except (OSError, ValueError):
+        return {}
+    return cache if cache.get("code") == _CODE else {}
+
+
+def _write_cache(cache):
+    tmp = None
+    try:
+        CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile("w", encoding="utf-8", dir=CACHE_FILE.parent,
+                                         prefix=f".{CACHE_FILE.name}.", delete=False) as tmp:
+            json.dump(cache, tmp, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp.name, CACHE_FILE)
+    except OSError as error:
+        log.warning("not caching the CV model: %s", error)
+        if tmp is not None:
+            Path(tmp.name).unlink(missing_ok=True)
+
+
+def _stale(cache, path, error, report):
+    """The last cached model when ``path`` cannot be read, else a ValueError."""
+    if "model" not in cache:
+        raise ValueError(f"{path}: cannot read the CV ({error})") from error
+    log.warning("%s: cannot read the CV (%s); using the last parsed version", path, error)
+    report.update(cached=True, sections=len(cache["sections"]), parsed=0)
+    return cache["model"]
+
+
+def load(path=SOURCE, force=False, report=None):
+    """The model of ``path``, parsing only what the cache does not cover.
+
+    ``report``, if given, is filled with ``sections``, ``parsed`` (how many
+    of them had to be parsed) and ``cached`` (the whole model was).
+    """
+    report = {} if report is None else report
+    cache = {} if force else _read_cache()
+    try:
+        data = Path(path).read_bytes()
+    except OSError as error:
+        return _stale(cache, path, error, report)
+    digest = hashlib.sha256(data).hexdigest()
+    if cache.get("docx") == digest:
+        report.update(cached=True, sections=len(cache["sections"]), parsed=0)
+        return cache["model"]
+
+    import zipfile
+
+    try:
+        with zipfile.ZipFile(io.BytesIO(data)) as package:
+            xml = package.read(DOCUMENT).decode("utf-8")
+        document_tag, sections = split(xml)
+    except (zipfile.BadZipFile, KeyError, ValueError) as error:
+        return _stale(cache, path, error, report)
+    known = cache.get("sections", {})
+    current = {}  # section hash -> blocks, in document order
+    parsed = 0
+    for section in sections:
+        key = hashlib.sha256(section.encode()).hexdigest()
+        if key not in current:
+            if key not in known:
+                try:
+                    known[key] = parse_section(document_tag, section)
+                except SyntaxError as error:  # xml.etree's ParseError
+                    return _stale(cache, path, error, report)
+                parsed += 1
+            current[key] = known[key]
+    model = assemble([block for section in sections
+                      for block in current[hashlib.sha256(section.encode()).hexdigest()]])
+    _write_cache({"code": _CODE, "docx": digest, "model": model, "sections": current})
+    report.update(cached=False, sections=len(sections), parsed=parsed)
+    return model
+
+
+# --- CONTENT ---
+def _title(text):
+    """``DATA SCIENCE/ANALYSIS INSTRUCTOR`` -> ``Data Science/Analysis Instructor``."""
+    return re.sub(r"[A-Za-z']+", lambda word: word.group().capitalize(), text) if text.isupper() else text
+
+
+def jobs(model):
+    """``(title, dates, bullets)`` per job, as ``resume.content.JOBS``."""
+    return [(f"{_title(job['role'])} | {job['organisation']}" if job["organisation"] else _title(job["role"]),
+             job["dates"], job["bullets"]) for job in model["jobs"]]
+
+
+def skills(model):
+    """``(group, details)`` pairs, as ``resume.content.SKILLS``."""
+    return [(f"🔹 {group['group']}", ", ".join(group["items"])) for group in model["skills"]]
+
+
+def education(model):
+    """``(title, details)`` pairs, as ``resume.content.EDUCATION``."""
+    return [(entry["title"], entry["details"]) for entry in model["education"]]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("path", nargs="?", type=Path, default=SOURCE)
+    parser.add_argument("--force", action="store_true", help="parse every section again")
+    parser.add_argument("--json", action="store_true", help="print the model")
+    args = parser.parse_args(argv)
+
+    report = {}
+    start = time.perf_counter()
+    try:
+        model = load(args.path, args.force, report)
+    except ValueError as error:
+        parser.exit(1, f"{error}\n")
+    elapsed = (time.perf_counter() - start) * 1e3
+    if args.json:
+        json.dump(model, sys.stdout, ensure_ascii=False, indent=1)
+        print()
+        return
+    state = "cached model" if report["cached"] else f"{report['parsed']} of {report['sections']} sections parsed"
+    print(f"{args.path.name}: {state} in {elapsed:.2f} ms")
+    print(f"{model['name']} | {len(model['jobs'])} jobs, {sum(len(job['bullets']) for job in model['jobs'])} bullets, "
+          f"{len(model['skills'])} skill groups, {len(model['education'])} education, "
+          f"{len(model['certifications'])} certifications")
+    for title, dates, bullets in jobs(model):
+        print(f"  {title} ({dates}): {len(bullets)} bullets")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,197 @@
+"""Resized, pre-encoded copies of the profile picture and project images.
+
+The apps display images far smaller than the source files (the car price
+screenshot alone is 4537px wide), and handing a PIL image to ``st.image``
+makes Streamlit re-encode it on every rerun. Instead we render each source
+once per content hash into ``.cache/derivatives`` at 1x and 2x of its display
+width, as WebP plus a JPEG (or PNG, for images with real transparency)
+fallback, and the apps pass those bytes straight through.
+
+Run ``python -m resume.derivatives`` at build time to pre-generate every
+variant; anything missing or stale is otherwise rendered on first use. A
+source PIL cannot decode (a tenant's broken upload) raises ValueError and is
+logged once per version.
+"""
+import json
+import logging
+import os
+import tempfile
+import threading
+from pathlib import Path
+
+from resume import assets
+
+ROOT = Path(__file__).resolve().parent.parent
+CACHE_DIR = Path(os.environ.get("RESUME_DERIVATIVES_DIR", ROOT / ".cache" / "derivatives"))
+PROFILE_PIC = ROOT / "assets" / "profile-pic.png"
+PROJECT_IMAGES_DIR = ROOT / "assets" / "project_images"
+
+# Display widths in CSS pixels, as used by app.py / app2.py.
+PROFILE_WIDTH = 400
+PROJECT_WIDTH = 300
+
+FORMATS = ("webp", "fallback")
+SCALES = (1, 2)
+QUALITY = 82
+
+_EXTENSIONS = {"webp": "webp", "jpeg": "jpg", "png": "png"}
+_MANIFEST = "manifest.json"
+_lock = threading.Lock()
+_rendering = {}  # target -> lock held while it is rendered
+_manifest = None
+_unreadable = {}  # digest -> why the source cannot be decoded
+
+log = logging.getLogger("resume.derivatives")
+
+
+def sources():
+    """Every source image with the display width it is rendered for."""
+    yield PROFILE_PIC, PROFILE_WIDTH
+    for path in sorted(PROJECT_IMAGES_DIR.iterdir()):
+        if path.suffix.lower() in (".png", ".jpg", ".jpeg", ".webp"):
+            yield path, PROJECT_WIDTH
+
+
+# --- MANIFEST ---
+# Per source hash we remember the pixel size and whether the image needs an
+# alpha-capable fallback, so a warm process never has to decode a source,
+# and which source files have that content (see ``_prune``).
+def _load_manifest():
+    global _manifest
+    if _manifest is None:
+        try:
+            _manifest = json.loads((CACHE_DIR / _MANIFEST).read_text())
+        except (OSError, ValueError):
+            _manifest = {}
+    return _manifest
+
+
+def _save_manifest():
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile("w", dir=CACHE_DIR, prefix=f".{_MANIFEST}.", delete=False) as tmp:
+        json.dump(_manifest, tmp, indent=1, sort_keys=True)
+    os.replace(tmp.name, CACHE_DIR / _MANIFEST)
+
+
+def _meta(source):
+    digest = assets.digest(source)
+    with _lock:
+        meta = _load_manifest().get(digest)
+    if meta is None:
+        if digest in _unreadable:
+            raise ValueError(_unreadable[digest])
+        # Decoded outside the lock, so lookups of other images never wait
+        # for a large source; two sessions may both decode this one.
+        try:
+            image = assets.open_image(source)
+        except Exception as error:  # PIL raises OSError, DecompressionBombError, ...
+            _unreadable[digest] = f"{source}: not a readable image ({error})"
+            log.warning("%s", _unreadable[digest])
+            raise ValueError(_unreadable[digest]) from error
+        alpha = image.mode in ("RGBA", "LA", "PA") and image.getchannel("A").getextrema()[0] < 255
+        fresh = {"width": image.width, "height": image.height, "fallback": "png" if alpha else "jpeg", "sources": []}
+    with _lock:
+        meta = _load_manifest().setdefault(digest, meta or fresh)
+        sources = meta.setdefault("sources", [])
+        if str(source) not in sources:
+            sources.append(str(source))
+            _save_manifest()
+    return digest, meta
+
+
+# --- RENDERING ---
+def _render(source, pixels, fmt, target):
+    from PIL import Image
+
+    image = assets.open_image(source)
+    if image.width > pixels:
+        height = round(image.height * pixels / image.width)
+        image = image.resize((pixels, height), Image.Resampling.LANCZOS)
+    if fmt == "jpeg" and image.mode != "RGB":
+        image = image.convert("RGB")
+
+    options = {"webp": {"quality": QUALITY, "method": 6},
+               "jpeg": {"quality": QUALITY, "optimize": True, "progressive": True},
+               "png": {"optimize": True}}[fmt]
+    target.parent.mkdir(parents=True, exist_ok=True)
+    # A unique name per writer: cluster workers may render the same target.
+    with tempfile.NamedTemporaryFile(dir=target.parent, prefix=f".{target.name}.", delete=False) as tmp:
+        image.save(tmp, format=fmt.upper(), **options)
+    os.replace(tmp.name, target)
+
+
+def _prune(source, digest):
+    """Remove derivatives rendered from older versions of ``source``.
+
+    Every tenant's picture is a ``profile-pic.png``, so the name does not say
+    whose a derivative is: an older version is only removed once no other
+    source in the manifest has the same content.
+    """
+    stale, changed = set(), False
+    with _lock:
+        for other, meta in _load_manifest().items():
+            sources = meta.get("sources", [])
+            if other != digest and str(source) in sources:
+                sources.remove(str(source))
+                changed = True
+                if not sources:
+                    stale.add(other[:12])
+        if changed:
+            _save_manifest()
+    for path in CACHE_DIR.glob(f"{source.stem}.*"):
+        if path.name.split(".")[1] in stale:
+            path.unlink(missing_ok=True)
+
+
+def size(source):
+    """Pixel ``(width, height)`` of ``source``, from the manifest when possible.
+
+    Like every function here, raises ValueError for a source that is not an image.
+    """
+    _, meta = _meta(Path(source))
+    return meta["width"], meta["height"]
+
+
+def derivative_path(source, width, fmt="webp", scale=1):
+    """Path of ``source`` rendered ``width`` CSS px wide, creating it if needed.
+
+    ``fmt`` is ``"webp"``, ``"jpeg"``, ``"png"`` or ``"fallback"`` (JPEG, or
+    PNG when the source has transparency). Sources are never upscaled.
+    """
+    source = Path(source)
+    digest, meta = _meta(source)
+    if fmt == "fallback":
+        fmt = meta["fallback"]
+    pixels = min(width * scale, meta["width"])
+    target = CACHE_DIR / f"{source.stem}.{digest[:12]}.{pixels}w.{_EXTENSIONS[fmt]}"
+    if not target.exists():
+        # Sessions asking for the same new derivative render it once.
+        with _lock:
+            rendering = _rendering.setdefault(target, threading.Lock())
+        with rendering:
+            if not target.exists():
+                _render(source, pixels, fmt, target)
+                _prune(source, digest)
+        with _lock:
+            _rendering.pop(target, None)
+    return target
+
+
+def derivative(source, width, fmt="webp", scale=1):
+    """Pre-encoded bytes of ``source`` at ``width`` CSS px, ready for ``st.image``."""
+    return assets.read_bytes(derivative_path(source, width, fmt, scale))
+
+
+def build():
+    """Render every variant of every source image; returns the paths written."""
+    paths = []
+    for source, width in sources():
+        for fmt in FORMATS:
+            for scale in SCALES:
+                paths.append(derivative_path(source, width, fmt, scale))
+    return paths
+
+
+if __name__ == "__main__":
+    for path in build():
+        print(f"{path.stat().st_size:>9,}  {path.relative_to(ROOT)}")
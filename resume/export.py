@@ -0,0 +1,226 @@
+"""Export the resume as a self-contained static site.
+
+The content never changes between visitors, so nothing about it needs a
+Python process or a websocket per visitor. This renders ``resume.content``
+into ``dist/index.html`` with every asset (CSS, generated CV, image
+derivatives) under ``dist/static/`` at a content-fingerprinted URL, plus
+``.gz`` (and ``.br``, when the ``brotli`` package is installed) siblings for
+anything that compresses. Any static host or CDN can serve the result; the Streamlit apps
+remain the live mode.
+
+The output is deterministic - same inputs, same bytes - so it can be
+committed, diffed, or checked in CI:
+
+    python -m resume.export [--out dist]
+"""
+import argparse
+import gzip
+import hashlib
+import html
+import json
+import os
+import re
+from pathlib import Path
+
+from resume import artifacts, assets, content, derivatives, icons, styles
+
+ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_OUT = ROOT / "dist"
+CSS_FILE = ROOT / "styles" / "main.css"
+STATIC = "static"
+MANIFEST = ".export-manifest.json"
+
+# Mirrors the [theme] written by setup.sh.
+THEME_CSS = """\
+body {margin: 0; background: #002b36; color: #fff; line-height: 1.6;}
+main {max-width: 730px; margin: 0 auto; padding: 3rem 1rem;}
+nav {position: sticky; top: 0; background: #00000d; padding: 5px 1rem; z-index: 1;}
+nav a {display: inline-block; margin-right: 1.2rem; font-size: 1.1rem;}
+.download {display: inline-block; padding: .4rem .8rem; border: 1px solid #586e75; border-radius: .25rem;}
+picture {background: #586e75;}
+"""
+
+# Only keep a compressed sibling when it saves at least this much.
+MIN_SAVING = 0.1
+COMPRESSIBLE = {".html", ".css", ".js", ".svg", ".json", ".txt", ".pdf"}
+
+try:
+    import brotli
+except ImportError:  # optional: .gz is always produced
+    brotli = None
+
+
+class Site:
+    """The files making up one export, keyed by relative path."""
+
+    def __init__(self):
+        self.files = {}
+
+    def asset(self, name, data):
+        """Add ``data`` under a fingerprinted name and return its URL."""
+        stem, _, suffix = name.rpartition(".")
+        path = f"{STATIC}/{stem}.{hashlib.sha256(data).hexdigest()[:12]}.{suffix}"
+        self.files[path] = data
+        return path
+
+    def image(self, source, width, alt, lazy=True):
+        src_width, src_height = derivatives.size(source)
+        width = min(width, src_width)
+        height = round(src_height * width / src_width)
+        urls = {}
+        for fmt in ("webp", "fallback"):
+            for scale in derivatives.SCALES:
+                path = derivatives.derivative_path(source, width, fmt, scale)
+                urls[fmt, scale] = self.asset(f"{Path(source).stem}-{path.name.split('.')[2]}.{path.suffix[1:]}",
+                                              assets.read_bytes(path))
+        srcset = lambda fmt: ", ".join(f"{urls[fmt, scale]} {scale}x" for scale in derivatives.SCALES)
+        loading = ' loading="lazy"' if lazy else ""
+        return (
+            f'<picture style="display:block;width:{width}px;max-width:100%;aspect-ratio:{width}/{height};">'
+            f'<source type="image/webp" srcset="{srcset("webp")}">'
+            f'<img src="{urls["fallback", 1]}" srcset="{srcset("fallback")}" width="{width}" height="{height}" '
+            f'alt="{html.escape(alt)}"{loading} decoding="async" style="width:100%;height:auto;">'
+            "</picture>"
+        )
+
+
+# --- PAGE ---
+def _section(anchor, title, body):
+    return f'<section id="{anchor}">\n<h2 style="color:blue;">{html.escape(title)}</h2>\n{body}\n</section>\n'
+
+
+def _anchor(title):
+    return re.sub(r"[^a-z0-9]+", "-", title.lower()).strip("-")
+
+
+def render(site):
+    esc = html.escape
+    # The stylesheet is small enough to inline as critical CSS; the font it
+    # references is a fingerprinted file, preloaded so it is fetched early.
+    fonts = []
+
+    def font_url(path):
+        fonts.append(site.asset(path.name, assets.read_bytes(path)))
+        return fonts[-1]
+
+    css = THEME_CSS + "\n" + styles.render_css(CSS_FILE, font_url)
+    preload = "".join(f'<link rel="preload" href="{url}" as="font" type="font/woff2" crossorigin>\n' for url in fonts)
+    cv = site.asset(artifacts.filename("pdf"), artifacts.read_bytes("pdf"))
+    profile = site.image(derivatives.PROFILE_PIC, derivatives.PROFILE_WIDTH, content.NAME, lazy=False)
+
+    social = icons.social_links(content.SOCIAL_MEDIA)
+    experience = "<ul>\n" + "\n".join(f"<li>{esc(item)}</li>" for item in content.EXPERIENCE) + "\n</ul>"
+    skills = "<ul>\n" + "\n".join(
+        f"<li>- {esc(skill)}: {esc(details)}</li>" for skill, details in content.SKILLS
+    ) + "\n</ul>"
+    jobs = "<hr>\n" + "\n".join(
+        f"<article>\n<p>🚧 <strong>{esc(role)}</strong><br>{esc(dates)}</p>\n<ul>\n"
+        + "\n".join(f"<li>► {esc(bullet)}</li>" for bullet in bullets)
+        + "\n</ul>\n</article>"
+        for role, dates, bullets in content.JOBS
+    )
+    projects = "<hr>\n" + "\n".join(
+        f"<article>\n<h3>{esc(project)}</h3>\n"
+        f"{site.image(ROOT / 'assets' / 'project_images' / content.PROJECT_IMAGES[project], derivatives.PROJECT_WIDTH, project)}\n"
+        f'<p><a href="{esc(link)}" target="_blank" rel="noopener">Link to project</a></p>\n</article>'
+        for project, link in content.PROJECTS.items()
+    )
+    sections = [
+        ("Experience & Qualifications", experience),
+        ("Skills", skills),
+        ("Work History", jobs),
+        ("Projects & Accomplishments", projects),
+    ]
+    nav = "\n".join(f'<a href="#{_anchor(title)}">{esc(title)}</a>' for title, _ in [("Introduction", "")] + sections)
+    body = "".join(_section(_anchor(title), title, section) for title, section in sections)
+
+    return f"""<!doctype html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{esc(content.PAGE_TITLE)}</title>
+<meta name="description" content="{esc(content.DESCRIPTION.strip())}">
+{preload}<style>
+{css}</style>
+</head>
+<body>
+<nav>
+{nav}
+</nav>
+<main>
+<header id="introduction">
+{profile}
+<h1>{esc(content.NAME)}</h1>
+<p>{esc(content.DESCRIPTION.strip())}</p>
+<p>📫 <a href="mailto:{esc(content.EMAIL)}">{esc(content.EMAIL)}</a></p>
+<p><a class="download" href="{cv}" download="{artifacts.filename('pdf')}">📄 Download Resume</a></p>
+{social}
+</header>
+{body}<footer>
+<hr>
+<p>{esc(content.THANK_YOU)}</p>
+</footer>
+</main>
+</body>
+</html>
+"""
+
+
+# --- OUTPUT ---
+def compressed(path, data):
+    """Yield ``(path, bytes)`` for the precompressed variants worth keeping."""
+    if Path(path).suffix not in COMPRESSIBLE:
+        return
+    variants = [(".gz", gzip.compress(data, compresslevel=9, mtime=0))]
+    if brotli is not None:
+        variants.append((".br", brotli.compress(data, quality=11)))
+    for suffix, packed in variants:
+        if len(packed) <= len(data) * (1 - MIN_SAVING):
+            yield path + suffix, packed
+
+
+def build():
+    """Return every output file as ``{relative path: bytes}``."""
+    site = Site()
+    site.files["index.html"] = render(site).encode()
+    site.files["_headers"] = f"/{STATIC}/*\n  Cache-Control: public, max-age=31536000, immutable\n".encode()
+    for path, data in list(site.files.items()):
+        site.files.update(compressed(path, data))
+    return dict(sorted(site.files.items()))
+
+
+def export(out=DEFAULT_OUT):
+    """Write the site to ``out``, removing files left over from a previous export."""
+    out = Path(out)
+    files = build()
+    try:
+        previous = json.loads((out / MANIFEST).read_text())
+    except (OSError, ValueError):
+        previous = []
+    for path in set(previous) - set(files):
+        (out / path).unlink(missing_ok=True)
+
+    for path, data in files.items():
+        target = out / path
+        target.parent.mkdir(parents=True, exist_ok=True)
+        if not target.exists() or target.read_bytes() != data:
+            tmp = target.with_name(f".{target.name}.{os.getpid()}")
+            tmp.write_bytes(data)
+            os.replace(tmp, target)
+    (out / MANIFEST).write_text(json.dumps(list(files), indent=1) + "\n")
+    return files
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--out", default=DEFAULT_OUT, type=Path)
+    args = parser.parse_args(argv)
+    files = export(args.out)
+    for path, data in files.items():
+        print(f"{len(data):>9,}  {path}")
+    print(f"{sum(map(len, files.values())):>9,}  total -> {args.out}")
+
+
+if __name__ == "__main__":
+    main()
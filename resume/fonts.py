@@ -0,0 +1,86 @@
+"""Vendor a subset of the Readex Pro web font into ``styles/fonts/``.
+
+The stylesheet used to ``@import`` Readex Pro from Google Fonts: a
+render-blocking request to two third-party origins before anything could be
+painted. Instead we keep a WOFF2 copy next to the stylesheet, cut down to the
+characters the resume actually uses plus printable ASCII (Readex Pro is a
+variable font, so the weight axis survives subsetting).
+
+Run this once and commit the result; it needs network access and fontTools
+(``pip install fonttools brotli``), neither of which the app needs at runtime:
+
+    python -m resume.fonts                      # download from Google Fonts
+    python -m resume.fonts --source Readex.ttf  # subset a local copy
+"""
+import argparse
+import io
+import re
+import urllib.request
+from pathlib import Path
+
+from resume import content
+
+ROOT = Path(__file__).resolve().parent.parent
+TARGET = ROOT / "styles" / "fonts" / "ReadexPro.woff2"
+CSS_API = "https://fonts.googleapis.com/css2?family=Readex+Pro:wght@160..700&display=swap"
+# Google Fonts serves WOFF2 only to browsers it recognises.
+USER_AGENT = "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0 Safari/537.36"
+
+
+def text():
+    """Every character the resume can render, plus printable ASCII."""
+    chars = set(map(chr, range(0x20, 0x7F)))
+    stack = [vars(content)[name] for name in dir(content) if name.isupper()]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, str):
+            chars.update(value)
+        elif isinstance(value, dict):
+            stack.extend(value.keys())
+            stack.extend(value.values())
+        elif isinstance(value, (list, tuple)):
+            stack.extend(value)
+    return "".join(sorted(chars))
+
+
+def download():
+    """Fetch the latin Readex Pro WOFF2 that Google Fonts would serve."""
+    request = urllib.request.Request(CSS_API, headers={"User-Agent": USER_AGENT})
+    css = urllib.request.urlopen(request, timeout=30).read().decode()
+    # Each unicode-range subset is preceded by a /* name */ comment.
+    blocks = dict(re.findall(r"/\* ([\w-]+) \*/\s*(@font-face\s*\{[^}]*\})", css))
+    url = re.search(r"url\((https://[^)]+)\)", blocks.get("latin", css)).group(1)
+    return urllib.request.urlopen(url, timeout=30).read()
+
+
+def subset(data, characters):
+    from fontTools import subset
+
+    options = subset.Options()
+    options.flavor = "woff2"
+    options.layout_features = ["*"]
+    options.name_IDs = ["*"]
+    font = subset.load_font(io.BytesIO(data), options)
+    subsetter = subset.Subsetter(options)
+    subsetter.populate(text=characters)
+    subsetter.subset(font)
+    out = io.BytesIO()
+    subset.save_font(font, out, options)
+    return out.getvalue()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--source", type=Path, help="local TTF/WOFF2 instead of downloading")
+    parser.add_argument("--out", type=Path, default=TARGET)
+    args = parser.parse_args(argv)
+
+    data = args.source.read_bytes() if args.source else download()
+    font = subset(data, text())
+    args.out.parent.mkdir(parents=True, exist_ok=True)
+    args.out.write_bytes(font)
+    print(f"{len(data):,} -> {len(font):,} bytes: {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+"""Whole sections pre-built as a single markdown/HTML fragment.
+
+Every ``st.write`` call turns into its own delta on the websocket; the Work
+History section alone used to send about forty. The builders here produce the
+same content as one string, memoised by a hash of their inputs, so a section
+costs one delta and the string is only assembled when the content changes.
+The memo keeps at most ``RESUME_FRAGMENT_CACHE_BYTES`` (default 16 MiB) of
+fragments, least recently used first out, whatever the number of tenants.
+
+``RESUME_RENDER_MODE=legacy`` switches the apps back to per-item writes,
+which is what ``python -m resume.headless --compare`` measures against.
+"""
+import hashlib
+import html
+import os
+import threading
+
+from resume.lru import ByteLRU, MiB, budget
+
+BATCHED = os.environ.get("RESUME_RENDER_MODE", "batched") != "legacy"
+HEADER_COLOR = "blue"
+
+_lock = threading.Lock()
+_cache = ByteLRU(budget("RESUME_FRAGMENT_CACHE_BYTES", 16 * MiB))
+_stats = {"hits": 0, "misses": 0}
+
+
+def compile(name, builder, *content):
+    """Return ``builder(*content)``, cached under a hash of ``content``."""
+    key = f"{name}:{hashlib.sha256(repr(content).encode()).hexdigest()}"
+    with _lock:
+        fragment = _cache.get(key)
+        if fragment is not None:
+            _stats["hits"] += 1
+            return fragment
+        _stats["misses"] += 1
+    fragment = builder(*content)
+    return _cache.put(key, fragment, len(fragment))
+
+
+def write(fragment):
+    import streamlit as st
+
+    st.markdown(fragment, unsafe_allow_html=True)
+
+
+def stats():
+    with _lock:
+        return dict(_stats, entries=len(_cache), bytes=_cache.bytes, evictions=_cache.evictions)
+
+
+# --- BUILDERS ---
+# Blank lines around raw HTML blocks keep the markdown parser from swallowing
+# the markdown that follows them. Fragments are written with
+# unsafe_allow_html, and a tenant's content is not trusted, so every piece
+# of content text is escaped.
+def header(title, color=HEADER_COLOR):
+    return f"<h2 style='color:{color};'>{html.escape(title)}</h2>\n\n"
+
+
+def intro_markdown(name, description, email):
+    return f"# {html.escape(name)}\n\n{html.escape(description.strip())}\n\n📫 {html.escape(email)}\n"
+
+
+def list_section(title, items, color=HEADER_COLOR):
+    return header(title, color) + "\n".join(f"- {html.escape(item)}" for item in items) + "\n"
+
+
+def skills_section(title, skills, color=HEADER_COLOR, line_height=1.2):
+    rows = "".join(f"<p>- {html.escape(skill)}: {html.escape(details)}</p>" for skill, details in skills)
+    return header(title, color) + f"<div style='line-height: {line_height};'>{rows}</div>\n"
+
+
+def jobs_section(title, jobs, color=HEADER_COLOR):
+    parts = [header(title, color), "---\n\n"]
+    for i, (role, dates, bullets) in enumerate(jobs):
+        if i:
+            parts.append("<br>\n\n")
+        parts.append(f"🚧 **{html.escape(role)}**\n\n{html.escape(dates)}\n\n")
+        parts.append("\n".join(f"- ► {html.escape(bullet)}" for bullet in bullets) + "\n\n")
+    return "".join(parts)
+
+
+def projects_section(title, projects, color=HEADER_COLOR):
+    """``projects`` holds ``(title, link, image_html, badge_html)`` tuples."""
+    parts = [header(title, color), "---\n\n"]
+    for project, link, image, badge in projects:
+        parts.append(f"### {html.escape(project)}\n\n{image}\n\n[Link to project]({html.escape(link)}) {badge}\n\n")
+    return "".join(parts)
+
+
+def footer(message):
+    return f"<br>\n\n---\n\n{html.escape(message)}\n"
+
+
+# --- CLIENT-SIDE PANES ---
+# Every section is sent once as a hidden pane next to a radio input; the
+# sidebar labels check the inputs and CSS shows the matching pane, so
+# switching sections never goes back to the server.
+PANE_CSS = """
+.resume-toggle, .resume-pane {display: none;}
+.resume-nav {padding: 5px; background-color: #00000d; border-radius: .5rem;}
+.resume-nav h3 {color: white; padding: .5rem; margin: 0;}
+.resume-nav label {display: block; padding: .5rem; border-radius: .5rem; color: white;
+                   font-size: 20px; cursor: pointer;}
+.resume-nav label:hover {background-color: #555;}
+.resume-hits label {cursor: pointer; text-decoration: underline;}
+.resume-hits small {display: block; opacity: .75;}
+"""
+
+
+def intro_pane(name, description, email, image, download_url, download_name, social):
+    return (
+        f"<div>{image}</div>\n\n" + intro_markdown(name, description, email)
+        + f'\n<div><a class="resume-download" href="{html.escape(download_url)}" '
+        f'download="{html.escape(download_name)}">📄 Download Resume</a></div>\n\n'
+        f"<div>{social}</div>\n"
+    )
+
+
+def pane_nav(title, sections):
+    """Sidebar labels for ``sections``, ``(slug, icon, title)`` triples."""
+    labels = "".join(
+        f'<label for="resume-show-{slug}">{icon} {html.escape(name)}</label>' for slug, icon, name in sections
+    )
+    # Styled by the <style> block that ships with the panes.
+    return f"<nav class='resume-nav'><h3>{html.escape(title)}</h3>{labels}</nav>\n"
+
+
+def search_hits(query, hits, client=True, base_query=""):
+    """Search results, ``(slug, title, snippet)`` triples, linking to their section.
+
+    With client-side panes a hit is a label that switches pane in place;
+    otherwise it is a ``?section=`` deep link, after ``base_query`` (e.g.
+    ``"tenant=jane&"``).
+    """
+    if not hits:
+        return f"No matches for “{html.escape(query)}”.\n"
+    items = []
+    for slug, title, snippet in hits:
+        if client:
+            link = f'<label for="resume-show-{slug}">{html.escape(title)}</label>'
+        else:
+            link = f'<a href="?{html.escape(base_query)}section={slug}" target="_self">{html.escape(title)}</a>'
+        if len(snippet) > 120:
+            snippet = snippet[:117].rsplit(" ", 1)[0] + "…"
+        items.append(f"<li>{link}<small>{html.escape(snippet)}</small></li>")
+    return f"<ul class='resume-hits'>{''.join(items)}</ul>\n"
+
+
+def panes(sections, selected=0, beacons=()):
+    """``sections`` (``(slug, fragment)`` pairs) as panes, ``selected`` showing.
+
+    ``beacons`` optionally holds a URL per section, fetched by the browser
+    (as the pane's background image) the first time that pane is shown.
+    """
+    beacons = dict(zip((slug for slug, _ in sections), beacons))
+    css = "".join(
+        f"#resume-show-{slug}:checked ~ #resume-{slug} {{display: block;"
+        + (f" background-image: url('{beacons[slug]}');" if beacons.get(slug) else "") + "}\n"
+        f"body:has(#resume-show-{slug}:checked) label[for='resume-show-{slug}'] {{background-color: #007bff;}}\n"
+        for slug, _ in sections
+    )
+    inputs = "".join(
+        f'<input type="radio" name="resume-section" class="resume-toggle" id="resume-show-{slug}"'
+        f'{" checked" if i == selected else ""}>'
+        for i, (slug, _) in enumerate(sections)
+    )
+    parts = [f"<style>{PANE_CSS}{css}</style>\n\n<div class='resume-panes'>\n{inputs}\n"]
+    for slug, fragment in sections:
+        parts.append(f'<section class="resume-pane" id="resume-{slug}">\n\n{fragment}\n</section>\n')
+    parts.append("</div>\n")
+    return "".join(parts)
@@ -0,0 +1,186 @@
+"""Run an app script in-process against an embedded Streamlit context.
+
+This does what Streamlit's ``ScriptRunner`` does for a connected browser -
+sets up a ``ScriptRunContext``, applies widget state, executes the script as
+``__main__`` - but records the ForwardMsgs instead of sending them over a
+websocket. That makes it cheap to count the deltas and bytes each sidebar
+section produces without starting a server.
+
+    python -m resume.headless app.py            # one row per section
+    python -m resume.headless --compare app.py  # legacy vs batched rendering
+
+Legacy rendering always uses the option-menu sidebar, so ``--compare`` runs
+both modes with ``RESUME_NAV_MODE=server`` to get the same sections in each.
+"""
+import argparse
+import json
+import sys
+import threading
+import time
+import types
+import uuid
+from pathlib import Path
+
+MENU_KEY = "options"
+
+
+class Run:
+    """The messages one script run produced, and how long it took."""
+
+    def __init__(self, messages, seconds):
+        self.messages = messages
+        self.seconds = seconds
+
+    @property
+    def deltas(self):
+        return sum(1 for msg in self.messages if msg.HasField("delta"))
+
+    @property
+    def bytes(self):
+        return sum(msg.ByteSize() for msg in self.messages if msg.HasField("delta"))
+
+    def elements(self):
+        for msg in self.messages:
+            if msg.HasField("delta") and msg.delta.HasField("new_element"):
+                yield msg.delta.new_element
+
+
+class Session:
+    """One simulated browser session for ``script``."""
+
+    def __init__(self, script, query_string=""):
+        import streamlit
+        from streamlit.runtime.state import SafeSessionState, SessionState
+        from streamlit.runtime.uploaded_file_manager import UploadedFileManager
+
+        self.script = Path(script).resolve()
+        self.query_string = query_string
+        self.id = str(uuid.uuid4())
+        self.session_state = SafeSessionState(SessionState())
+        self.uploaded_file_mgr = UploadedFileManager()
+        self.menu = None  # (widget id, options) once the sidebar has rendered
+        self._code = compile(self.script.read_bytes(), str(self.script), "exec")
+        # Elements such as st.download_button only register their payload
+        # when they believe a real runtime is present.
+        streamlit._is_running_with_streamlit = True
+
+    def run(self, widgets=None):
+        """Execute the script once; ``widgets`` maps widget id to JSON value."""
+        from streamlit.proto.WidgetStates_pb2 import WidgetStates
+        from streamlit.runtime.in_memory_file_manager import in_memory_file_manager
+        from streamlit.runtime.scriptrunner import StopException, add_script_run_ctx
+        from streamlit.runtime.scriptrunner.script_run_context import (
+            SCRIPT_RUN_CONTEXT_ATTR_NAME,
+            ScriptRunContext,
+        )
+
+        messages = []
+        ctx = ScriptRunContext(
+            session_id=self.id,
+            _enqueue=messages.append,
+            query_string=self.query_string,
+            session_state=self.session_state,
+            uploaded_file_mgr=self.uploaded_file_mgr,
+            page_script_hash="",
+            user_info={"email": "test@example.com"},
+        )
+        states = WidgetStates()
+        for widget_id, value in (widgets or {}).items():
+            state = states.widgets.add()
+            state.id = widget_id
+            state.json_value = json.dumps(value)
+        self.session_state.on_script_will_rerun(states)
+        in_memory_file_manager.clear_session_files(self.id)
+
+        module = types.ModuleType("__main__")
+        module.__dict__["__file__"] = str(self.script)
+        thread = threading.current_thread()
+        saved_main = sys.modules.get("__main__")
+        script_dir = str(self.script.parent)
+        if script_dir not in sys.path:
+            sys.path.insert(0, script_dir)
+
+        from resume import analytics
+
+        add_script_run_ctx(thread, ctx)
+        sys.modules["__main__"] = module
+        ctx.on_script_start()
+        start = time.perf_counter()
+        try:
+            # Not a visitor: nothing this session shows is recorded.
+            with analytics.paused():
+                exec(self._code, module.__dict__)
+        except StopException:
+            pass
+        finally:
+            seconds = time.perf_counter() - start
+            sys.modules["__main__"] = saved_main
+            delattr(thread, SCRIPT_RUN_CONTEXT_ATTR_NAME)
+        self.session_state.on_script_finished(ctx.widget_ids_this_run)
+
+        if self.menu is None:
+            self.menu = find_menu(messages)
+        return Run(messages, seconds)
+
+    def select(self, option):
+        """Rerun as if ``option`` had been clicked in the sidebar menu."""
+        if self.menu is None:
+            self.run()
+        if self.menu is None:
+            raise ValueError(f"{self.script.name} has no sidebar menu")
+        return self.run({self.menu[0]: option})
+
+
+def find_menu(messages):
+    """``(widget_id, options)`` of the option_menu component, if any."""
+    for element in Run(messages, 0).elements():
+        if element.HasField("component_instance"):
+            args = json.loads(element.component_instance.json_args or "{}")
+            if MENU_KEY in args:
+                return element.component_instance.id, args[MENU_KEY]
+    return None
+
+
+def sections(script):
+    """Yield ``(section, Run)`` for every sidebar option, or the whole page."""
+    session = Session(script)
+    first = session.run()
+    if session.menu is None:
+        yield "(page)", first
+        return
+    for option in session.menu[1]:
+        yield option, session.select(option)
+
+
+def _table(rows, header):
+    widths = [max(len(str(row[i])) for row in rows + [header]) for i in range(len(header))]
+    for row in [header] + rows:
+        print("  ".join(str(cell).ljust(width) if i == 0 else str(cell).rjust(width)
+                        for i, (cell, width) in enumerate(zip(row, widths))))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("script", nargs="?", default="app.py")
+    parser.add_argument("--compare", action="store_true", help="legacy vs batched rendering")
+    args = parser.parse_args(argv)
+
+    from resume import fragments, layouts
+
+    if not args.compare:
+        rows = [(name, run.deltas, run.bytes, f"{run.seconds * 1000:.1f}") for name, run in sections(args.script)]
+        _table(rows, ("section", "deltas", "bytes", "ms"))
+        return
+
+    results = {}
+    layouts.NAV_MODE = "server"
+    for batched in (False, True):
+        fragments.BATCHED = batched
+        for name, run in sections(args.script):
+            results.setdefault(name, []).extend((run.deltas, run.bytes))
+    rows = [(name, d0, d1, b0, b1) for name, (d0, b0, d1, b1) in results.items()]
+    _table(rows, ("section", "deltas before", "after", "bytes before", "after"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""A small keep-alive HTTP/1.1 client for the probes and load tests.
+
+``resume.links`` checks many links on a few hosts, and ``resume.loadtest``
+fetches a page's media like a browser does: both want one connection
+reused for every request to a host, which urllib does not do, and neither
+should pull in a dependency. This is just enough of a client for them:
+``GET`` and ``HEAD``, the status and headers, and the body, read by
+``Content-Length``, chunked encoding or until the server closes.
+"""
+import asyncio
+import ssl
+from collections import namedtuple
+
+MAX_HEAD = 64 * 1024  # the longest request or response head accepted; also resume.cluster's
+
+# ``headers`` has lower-cased names; ``body`` is b"" for HEAD.
+Response = namedtuple("Response", "status headers body")
+
+
+class Connection:
+    """One keep-alive HTTP/1.1 connection to ``host:port``, reused for every request.
+
+    ``timeout`` bounds the connect and each request separately (None: no
+    limit); ``headers`` are sent with every request.
+    """
+
+    def __init__(self, host, port, tls=False, timeout=None, headers=None):
+        self.host, self.port, self.tls = host, port, tls
+        self.timeout = timeout
+        self.headers = dict(headers or {})
+        self.address = None  # connect here rather than looking ``host`` up again
+        self.reader = self.writer = None
+
+    async def _open(self):
+        context = ssl.create_default_context() if self.tls else None
+        self.reader, self.writer = await asyncio.wait_for(
+            asyncio.open_connection(self.address or self.host, self.port, ssl=context,
+                                    server_hostname=self.host if context else None, limit=MAX_HEAD),
+            self.timeout)
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+        self.reader = self.writer = None
+
+    async def request(self, method, target, headers=None):
+        """The ``Response`` to ``method target``, reconnecting once if a reused connection went stale."""
+        for reused in (self.writer is not None, False):
+            if self.writer is None:
+                await self._open()
+            try:
+                return await asyncio.wait_for(self._exchange(method, target, headers or {}), self.timeout)
+            except (ConnectionError, asyncio.IncompleteReadError):
+                self.close()
+                if not reused:
+                    raise
+
+    async def get(self, target, headers=None):
+        return await self.request("GET", target, headers)
+
+    async def head(self, target, headers=None):
+        return await self.request("HEAD", target, headers)
+
+    async def _exchange(self, method, target, headers):
+        host = self.host if self.port == (443 if self.tls else 80) else f"{self.host}:{self.port}"
+        lines = [f"{method} {target} HTTP/1.1", f"Host: {host}"]
+        lines += [f"{name}: {value}" for name, value in {**self.headers, **headers}.items()]
+        self.writer.write(("\r\n".join(lines) + "\r\nConnection: keep-alive\r\n\r\n").encode())
+        await self.writer.drain()
+
+        lines = (await self.reader.readuntil(b"\r\n\r\n")).decode("latin-1").split("\r\n")
+        status = int(lines[0].split(" ")[1])
+        response_headers = {}
+        for line in lines[1:]:
+            name, _, value = line.partition(":")
+            if name:
+                response_headers[name.strip().lower()] = value.strip()
+        body = await self._body(method, status, response_headers)
+        if response_headers.get("connection", "").lower() == "close":
+            self.close()
+        return Response(status, response_headers, body)
+
+    async def _body(self, method, status, headers):
+        if method == "HEAD" or status in (204, 304) or 100 <= status < 200:
+            return b""
+        if "content-length" in headers:
+            return await self.reader.readexactly(int(headers["content-length"]))
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            chunks = []
+            while True:
+                size = int((await self.reader.readuntil(b"\r\n")).split(b";")[0], 16)
+                chunks.append((await self.reader.readexactly(size + 2))[:-2])
+                if not size:
+                    # No trailers expected; the last chunk ends with its blank line.
+                    return b"".join(chunks)
+        # No length: the body runs until the server closes the connection.
+        headers["connection"] = "close"
+        return await self.reader.read()
@@ -0,0 +1,76 @@
+"""Inline SVG icons for the social links.
+
+The links used to be hard-coded ``<img>`` tags pointing at img.icons8.com,
+which cost four third-party requests (plus DNS and TLS) on first paint. The
+markup is now generated from ``SOCIAL_MEDIA``: one hidden ``<svg>`` sprite
+with a ``<symbol>`` per network, referenced by ``<use>`` in each link.
+"""
+import html
+
+# name -> (background colour, viewBox, glyph markup in white)
+ICONS = {
+    "Facebook": (
+        "#1877f2", "0 0 24 24",
+        '<path d="M15.6 7.9h-1.7c-.8 0-1 .4-1 1.1v1.6h2.7l-.4 2.7h-2.3V20H10v-6.7H7.8v-2.7H10V8.7'
+        'C10 6.6 11.3 5.4 13.3 5.4c.9 0 1.8.1 2.3.2z"/>',
+    ),
+    "LinkedIn": (
+        "#0a66c2", "0 0 24 24",
+        '<circle cx="7.4" cy="7.4" r="1.7"/><path d="M5.9 10h3v8.5h-3zM10.9 10h2.9v1.2c.5-.8 1.4-1.4 2.8-1.4'
+        ' 2.3 0 3.1 1.5 3.1 3.7v5h-3v-4.4c0-1-.3-1.8-1.3-1.8s-1.5.8-1.5 1.8v4.4h-3z"/>',
+    ),
+    "GitHub": (
+        "#181717", "-4 -4 24 24",
+        '<path d="M8 0C3.58 0 0 3.58 0 8c0 3.54 2.29 6.53 5.47 7.59.4.07.55-.17.55-.38 0-.19-.01-.82-.01-1.49'
+        '-2.01.37-2.53-.49-2.69-.94-.09-.23-.48-.94-.82-1.13-.28-.15-.68-.52-.01-.53.63-.01 1.08.58 1.23.82'
+        '.72 1.21 1.87.87 2.33.66.07-.52.28-.87.51-1.07-1.78-.2-3.64-.89-3.64-3.95 0-.87.31-1.59.82-2.15'
+        '-.08-.2-.36-1.02.08-2.12 0 0 .67-.21 2.2.82.64-.18 1.32-.27 2-.27.68 0 1.36.09 2 .27 1.53-1.04 2.2'
+        '-.82 2.2-.82.44 1.1.16 1.92.08 2.12.51.56.82 1.27.82 2.15 0 3.07-1.87 3.75-3.65 3.95.29.25.54.73'
+        '.54 1.48 0 1.07-.01 1.93-.01 2.2 0 .21.15.46.55.38A8.01 8.01 0 0016 8c0-4.42-3.58-8-8-8z"/>',
+    ),
+    "Twitter": (
+        "#1d9bf0", "0 0 24 24",
+        '<path d="M19 8.1c0 .2 0 .3 0 .5 0 4.9-3.7 10.5-10.5 10.5-2.1 0-4-.6-5.7-1.7.3 0 .6.1.9.1 1.7 0 3.3-.6'
+        ' 4.6-1.6-1.6 0-3-1.1-3.5-2.6.2 0 .5.1.7.1.3 0 .7 0 1-.1-1.7-.3-3-1.8-3-3.6.5.3 1.1.5 1.7.5-1-.7-1.6'
+        '-1.8-1.6-3.1 0-.7.2-1.3.5-1.9 1.8 2.2 4.5 3.7 7.6 3.8-.1-.3-.1-.6-.1-.8 0-2 1.7-3.7 3.7-3.7 1.1 0 2'
+        '.4 2.7 1.2.8-.2 1.6-.5 2.3-.9-.3.9-.9 1.6-1.6 2 .7-.1 1.4-.3 2.1-.6-.5.8-1.1 1.4-1.9 1.9z"/>',
+    ),
+}
+
+
+def _id(name):
+    return "resume-icon-" + "".join(c for c in name.lower() if c.isalnum())
+
+
+def sprite(names):
+    """A hidden ``<svg>`` holding one ``<symbol>`` per known icon in ``names``."""
+    symbols = []
+    for name in names:
+        if name not in ICONS:
+            continue
+        color, viewbox, glyph = ICONS[name]
+        x, y, w, h = (float(v) for v in viewbox.split())
+        symbols.append(
+            f'<symbol id="{_id(name)}" viewBox="{viewbox}">'
+            f'<rect x="{x:g}" y="{y:g}" width="{w:g}" height="{h:g}" rx="{w / 5:g}" fill="{color}"/>'
+            f'<g fill="#fff">{glyph}</g></symbol>'
+        )
+    return f'<svg width="0" height="0" style="position:absolute" aria-hidden="true">{"".join(symbols)}</svg>'
+
+
+def icon(name, size=40):
+    if name not in ICONS:
+        return html.escape(name)
+    return (f'<svg width="{size}" height="{size}" role="img" aria-label="{html.escape(name)}">'
+            f'<use href="#{_id(name)}"/></svg>')
+
+
+def social_links(social_media, size=40):
+    """The row of social links, icons and all, as a single HTML block."""
+    links = "".join(
+        f'<a href="{html.escape(url)}" target="_blank" rel="noopener" '
+        f'style="text-decoration: none; color: inherit;">{icon(name, size)}</a>'
+        for name, url in social_media.items()
+    )
+    return (f'{sprite(social_media)}'
+            f'<div style="display: flex; justify-content: space-between; width: 300px;">{links}</div>')
@@ -0,0 +1,352 @@
+"""The two page layouts, shared by the app entry points.
+
+``app.py`` is the sidebar layout (one section at a time, chosen from an
+option menu) and ``app2.py`` the single scrolling page. Both render the
+current tenant's content (``resume.content`` unless ``?tenant=`` names
+another, see ``resume.tenants``); keeping them side by side here is what
+stops the two scripts from drifting apart again.
+
+The sidebar layout switches sections in the browser by default: every
+section is sent once as a hidden pane (see ``fragments.panes``), so a session
+costs one script run however many sections are viewed. Set
+``RESUME_NAV_MODE=server`` for the option-menu sidebar, which reruns the
+script per click. Either way ``?section=skills`` (or any section's slug)
+opens that section directly.
+
+Heavy imports are deferred to the code that needs them: the option-menu
+component is only imported by the sidebar layout, and PIL only when an image
+derivative has to be (re)rendered.
+"""
+import html
+import os
+import re
+from collections import namedtuple
+from pathlib import Path
+
+import streamlit as st
+
+from resume import (analytics, artifacts, derivatives, fragments, icons, links, media, metrics, search, static, styles,
+                    tenants)
+
+ROOT = Path(__file__).resolve().parent.parent
+CSS_FILE = ROOT / "styles" / "main.css"
+
+NAV_MODE = os.environ.get("RESUME_NAV_MODE", "client")
+
+SECTIONS = ["Introduction", "Experience & Qualifications", "Skills", "Work History", "Projects & Accomplishments"]
+MENU_ICONS = ["person", "briefcase", "clipboard", "building", "star"]
+PANE_ICONS = ["👤", "💼", "📋", "🏢", "⭐"]  # client-side nav; no icon font needed
+MENU_STYLES = {
+    "container": {"padding": "5px", "background-color": "#00000d"},
+    "icon": {"color": "white", "font-size": "22px"},
+    "nav-link": {"font-size": "20px", "text-align": "left", "margin": "0px", "--hover-color": "#555", "color": "white"},
+    "nav-link-selected": {"background-color": "#007bff", "color": "white"},
+}
+
+Theme = namedtuple("Theme", "header_color line_height")
+SIDEBAR_THEME = Theme("blue", 1.2)
+PAGE_THEME = Theme("#007bff", 1.5)
+
+BACK_TO_TOP = """
+<style>
+.back-to-top {
+    position: fixed;
+    bottom: 30px;
+    right: 30px;
+    background-color: #007bff;
+    color: #fff;
+    padding: 10px 15px;
+    border-radius: 50px;
+    text-align: center;
+    cursor: pointer;
+    box-shadow: 0px 0px 10px rgba(0, 0, 0, 0.1);
+}
+.back-to-top:hover {
+    background-color: #0056b3;
+}
+</style>
+<div class="back-to-top" onclick="window.scrollTo({top: 0, behavior: 'smooth'});">⬆️</div>
+"""
+
+
+def _setup(script):
+    """Page config, background services and CSS; stops the run for an unknown tenant."""
+    tenant = tenants.select()
+    content = tenant or tenants.DEFAULT
+    st.set_page_config(page_title=content.PAGE_TITLE, page_icon=content.PAGE_ICON)
+    if tenant is None:
+        st.error("There is no resume here.")
+        st.stop()
+
+    # Off unless RESUME_METRICS_PORT or RESUME_METRICS_FILE is set.
+    metrics.start()
+    metrics.inc("reruns", script=script)
+    # Both run in the background and are only started under streamlit run:
+    # the project link checker, and the analytics writer and routes.
+    links.start()
+    analytics.start()
+    tenants.install()
+
+    with metrics.span("css"):
+        st.markdown("<style>{}</style>".format(styles.inline_css(CSS_FILE)), unsafe_allow_html=True)
+
+
+def section_header(title, theme):
+    st.markdown(f"<h2 style='color:{theme.header_color};'>{title}</h2>", unsafe_allow_html=True)
+
+
+def section_slug(title):
+    return re.sub(r"[^a-z0-9]+", "-", title.lower()).strip("-")
+
+
+def search_box(client):
+    """Keyword search over skills, jobs and projects; hits link to sections."""
+    query = st.text_input("🔎 Search skills, jobs and projects", key="search", placeholder="e.g. Power BI")
+    if query.strip():
+        with metrics.span("search"):
+            hits = search.search(query)
+        fragments.write(fragments.search_hits(
+            query, tuple((section_slug(hit.section), hit.title, hit.snippet) for hit in hits), client,
+            tenants.query()))
+
+
+def deep_link():
+    """Index in ``SECTIONS`` named by the ``?section=`` query parameter, else 0."""
+    wanted = (st.experimental_get_query_params().get("section") or [""])[0].strip().lower()
+    for i, title in enumerate(SECTIONS):
+        if wanted in (title.lower(), section_slug(title)):
+            return i
+    return 0
+
+
+# --- SECTIONS ---
+# In the default "batched" render mode each section is compiled into a single
+# markdown fragment (cached by content hash, see resume/fragments.py) and sent
+# as one element. RESUME_RENDER_MODE=legacy keeps one st.write per item.
+def introduction(theme, **image_options):
+    width = image_options.get("width", derivatives.PROFILE_WIDTH)
+    if image_options.get("use_column_width"):
+        width = 730  # Streamlit's full content width
+    if fragments.BATCHED:
+        # Picture and CV link go out as plain markup pointing at cacheable
+        # URLs (see resume/static.py), not through st.image/download_button.
+        fragments.write(introduction_fragment(theme, width))
+        return
+
+    # Rendered from resume.content ahead of time (python -m resume.artifacts);
+    # here it is only read back from the asset cache.
+    content = tenants.current()
+    with metrics.span("pdf"):
+        pdf = artifacts.read_bytes("pdf")
+    profile_pic = content.profile_image()
+    if profile_pic is not None:
+        with metrics.span("profile_pic"):
+            try:
+                st.image(derivatives.derivative(profile_pic, width), **image_options)
+            except ValueError:  # not an image; logged by resume.derivatives
+                pass
+    st.title(content.NAME)
+    st.write(content.DESCRIPTION)
+    st.write(f"📫 {content.EMAIL}")
+    st.download_button(
+        label="📄 Download Resume",
+        data=pdf,
+        file_name=artifacts.filename("pdf"),
+        mime=artifacts.MIMETYPES["pdf"],
+    )
+    st.write('\n')
+    st.markdown(icons.social_links(content.SOCIAL_MEDIA), unsafe_allow_html=True)
+
+
+def experience_fragment(theme):
+    content = tenants.current()
+    return fragments.compile(
+        "experience", fragments.list_section, "Experience & Qualifications", content.EXPERIENCE, theme.header_color)
+
+
+def experience(theme):
+    title = "Experience & Qualifications"
+    if fragments.BATCHED:
+        fragments.write(experience_fragment(theme))
+    else:
+        section_header(title, theme)
+        st.write("\n".join(f"- {line}" for line in tenants.current().EXPERIENCE))
+
+
+def skills_fragment(theme):
+    content = tenants.current()
+    return fragments.compile(
+        "skills", fragments.skills_section, "Skills", content.SKILLS, theme.header_color, theme.line_height)
+
+
+def skills(theme):
+    title = "Skills"
+    if fragments.BATCHED:
+        fragments.write(skills_fragment(theme))
+    else:
+        section_header(title, theme)
+        st.markdown(f"<div style='line-height: {theme.line_height};'>", unsafe_allow_html=True)
+        for skill, details in tenants.current().SKILLS:
+            st.write(f"<p>- {html.escape(skill)}: {html.escape(details)}</p>", unsafe_allow_html=True)
+        st.markdown("</div>", unsafe_allow_html=True)
+
+
+def work_history_fragment(theme):
+    return fragments.compile("work", fragments.jobs_section, "Work History", tenants.current().JOBS, theme.header_color)
+
+
+def work_history(theme):
+    title = "Work History"
+    if fragments.BATCHED:
+        fragments.write(work_history_fragment(theme))
+    else:
+        section_header(title, theme)
+        st.write("---")
+        for i, (role, dates, bullets) in enumerate(tenants.current().JOBS):
+            if i:
+                st.write('\n')
+            st.write("🚧", f"**{role}**")
+            st.write(dates)
+            st.write("\n".join(f"- ► {bullet}" for bullet in bullets))
+
+
+def _project_items():
+    # Images are plain lazy-loading <img> tags, so the browser only fetches
+    # them near the viewport (never while their pane is hidden). Their URLs
+    # are registered for this session on every run; the markup around them
+    # only changes when the content or a link's status does.
+    content = tenants.current()
+    with metrics.span("project_images"):
+        return tuple(
+            (project, analytics.link_url(project, link), _image(
+                content.project_image(project), derivatives.PROJECT_WIDTH, project), links.badge(link))
+            for project, link in content.PROJECTS.items()
+        )
+
+
+def _image(path, width, alt):
+    """A lazy ``<img>`` for ``path``, or nothing when the tenant has no such (readable) image."""
+    if path is None:
+        return ""
+    try:
+        return media.lazy_image(path, width, alt=alt)
+    except ValueError:  # not an image; logged by resume.derivatives
+        return ""
+
+
+def projects_fragment(theme):
+    return fragments.compile(
+        "projects", fragments.projects_section, "Projects & Accomplishments", _project_items(), theme.header_color)
+
+
+def projects(theme):
+    title = "Projects & Accomplishments"
+    if fragments.BATCHED:
+        fragments.write(projects_fragment(theme))
+        return
+    section_header(title, theme)
+    st.write("---")
+    for project, link, image, badge in _project_items():
+        st.write(f"### {project}")
+        st.markdown(image, unsafe_allow_html=True)
+        st.markdown(f"[Link to project]({html.escape(link)}) {badge}", unsafe_allow_html=True)
+
+
+def footer():
+    thank_you = tenants.current().THANK_YOU
+    if fragments.BATCHED:
+        fragments.write(fragments.compile("footer", fragments.footer, thank_you))
+    else:
+        st.write('\n')
+        st.write("---")
+        st.write(thank_you)
+
+
+RENDERERS = {
+    "Experience & Qualifications": experience,
+    "Skills": skills,
+    "Work History": work_history,
+    "Projects & Accomplishments": projects,
+}
+FRAGMENTS = {
+    "Experience & Qualifications": experience_fragment,
+    "Skills": skills_fragment,
+    "Work History": work_history_fragment,
+    "Projects & Accomplishments": projects_fragment,
+}
+
+
+def introduction_fragment(theme, width):
+    """The introduction as one fragment: no st.image or download widget."""
+    content = tenants.current()
+    with metrics.span("pdf"):
+        cv_url = static.url(artifacts.path("pdf")) or media.media_url(
+            artifacts.read_bytes("pdf"), artifacts.MIMETYPES["pdf"], "cv", file_name=artifacts.filename("pdf"))
+    with metrics.span("profile_pic"):
+        image = _image(content.profile_image(), width, content.NAME)
+    return fragments.compile(
+        "intro_pane", fragments.intro_pane, content.NAME, content.DESCRIPTION, content.EMAIL,
+        image, cv_url, artifacts.filename("pdf"), icons.social_links(content.SOCIAL_MEDIA))
+
+
+# --- LAYOUTS ---
+def sidebar():
+    """One section at a time, picked from the sidebar menu (app.py)."""
+    _setup("app.py")
+    if NAV_MODE == "server" or not fragments.BATCHED:
+        _server_sidebar()
+    else:
+        _client_sidebar()
+    footer()
+
+
+def _server_sidebar():
+    from streamlit_option_menu import option_menu
+
+    with st.sidebar, metrics.span("sidebar"):
+        selected = option_menu(
+            'Resume Sections',
+            SECTIONS,
+            icons=MENU_ICONS,
+            default_index=deep_link(),
+            styles=MENU_STYLES,
+        )
+        # Every rerun reports the selection; count changes only.
+        if st.session_state.get("_resume_section") != selected:
+            st.session_state["_resume_section"] = selected
+            analytics.record("section", analytics.event_name(selected))
+        search_box(client=False)
+
+    with metrics.span(f"section:{selected}"):
+        if selected == "Introduction":
+            introduction(SIDEBAR_THEME, width=120, use_column_width=True)
+        else:
+            RENDERERS[selected](SIDEBAR_THEME)
+
+
+def _client_sidebar():
+    slugs = [section_slug(title) for title in SECTIONS]
+    with st.sidebar, metrics.span("sidebar"):
+        fragments.write(fragments.compile(
+            "pane_nav", fragments.pane_nav, "Resume Sections", tuple(zip(slugs, PANE_ICONS, SECTIONS))))
+        search_box(client=True)
+
+    with metrics.span("panes"):
+        panes = [introduction_fragment(SIDEBAR_THEME, width=730)]  # full column width
+        panes += [FRAGMENTS[title](SIDEBAR_THEME) for title in SECTIONS[1:]]
+        beacons = tuple(analytics.beacon_url("section", slug) for slug in slugs)
+        fragments.write(fragments.compile("panes", fragments.panes, tuple(zip(slugs, panes)), deep_link(), beacons))
+
+
+def single_page():
+    """Every section on one scrolling page (app2.py)."""
+    _setup("app2.py")
+    st.markdown(BACK_TO_TOP, unsafe_allow_html=True)
+
+    # The hero goes out first; the remaining sections stream in after it.
+    with metrics.span("section:Introduction"):
+        introduction(PAGE_THEME, width=derivatives.PROFILE_WIDTH)
+    for section in SECTIONS[1:]:
+        with metrics.span(f"section:{section}"):
+            RENDERERS[section](PAGE_THEME)
+    footer()
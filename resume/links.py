@@ -0,0 +1,249 @@
+"""Background health checks for the project links.
+
+Several projects link to ``*.streamlit.app`` deployments that go to sleep
+or get taken down, and a visitor clicking through lands on a dead page. A
+checker thread probes every ``content.PROJECTS`` URL with ``HEAD``, and
+the project URLs of other tenants (``resume.tenants``) while they are shown.
+Tenant URLs come from tenant authors, so they are only probed on hosts that
+resolve to public addresses (the checker cannot be pointed at the server's
+own network), at most ``MAX_ADDED`` of them, each dropped again once it has
+not been shown for two rounds:
+
+- hosts are probed concurrently; the URLs of one host share one keep-alive
+  connection;
+- each request (connect included) gives up after ``TIMEOUT`` seconds;
+- results are cached, and the whole set is probed again every ``TTL``
+  seconds. A result older than twice that (the checker has stalled) counts
+  as unknown.
+
+Renders only read the cache through ``badge(url)``, so they never wait for
+a probe. Before the first round finishes, links simply have no badge. Like
+``resume.static``, the checker is only started under ``streamlit run``, so
+headless renders and benchmarks stay offline. Set ``RESUME_LINK_CHECK=0`` to
+turn it off.
+
+``Checker`` takes any URLs as its own, including plain ``http://`` ones on
+a local stub server:
+
+    python -m resume.links                         # the project links
+    python -m resume.links http://127.0.0.1:8000/ --timeout 1
+"""
+import argparse
+import asyncio
+import html
+import ipaddress
+import os
+import socket
+import ssl
+import sys
+import threading
+import time
+from collections import OrderedDict, namedtuple
+from urllib.parse import urlsplit
+
+from resume import content, httpclient, server
+
+ENABLED = os.environ.get("RESUME_LINK_CHECK", "1") != "0"
+TTL = float(os.environ.get("RESUME_LINK_TTL", 600))
+TIMEOUT = 5.0
+MAX_ADDED = 1000  # added URLs probed at once; the least recently shown go first
+USER_AGENT = "resume-link-check/1.0"
+
+# ``error`` is a short reason ("timeout", "refused", ...) when there was no
+# HTTP response; ``code`` is None then.
+Status = namedtuple("Status", "ok code error checked latency")
+
+_lock = threading.Lock()
+_checker = None
+
+
+# --- PROBING ---
+class _NotPublic(Exception):
+    pass
+
+
+async def _public_address(host, port, timeout):
+    """An address of ``host``, or _NotPublic if any of its addresses is not public."""
+    infos = await asyncio.wait_for(
+        asyncio.get_running_loop().getaddrinfo(host, port, type=socket.SOCK_STREAM), timeout)
+    addresses = [info[4][0] for info in infos]
+    if not all(ipaddress.ip_address(address.split("%")[0]).is_global for address in addresses):
+        raise _NotPublic(host)
+    # The connection goes to the address checked here, so a second lookup
+    # cannot answer with another one.
+    return addresses[0]
+
+
+def _origin(url):
+    parts = urlsplit(url)
+    return parts.scheme, parts.hostname, parts.port or (443 if parts.scheme == "https" else 80)
+
+
+def _target(url):
+    parts = urlsplit(url)
+    return (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+
+
+def _reason(error):
+    if isinstance(error, _NotPublic):
+        return "not public"
+    if isinstance(error, asyncio.TimeoutError):
+        return "timeout"
+    if isinstance(error, ConnectionRefusedError):
+        return "refused"
+    if isinstance(error, ssl.SSLError):
+        return "tls error"
+    if isinstance(error, (ValueError, IndexError, asyncio.LimitOverrunError)):
+        return "bad response"
+    return "unreachable"
+
+
+class Checker:
+    """Probes its own ``urls`` on any host, and ``add``-ed ones on public hosts only."""
+
+    def __init__(self, urls, ttl=TTL, timeout=TIMEOUT):
+        self.urls = list(dict.fromkeys(urls))
+        self.ttl = ttl
+        self.timeout = timeout
+        self.statuses = {}  # url -> Status; replaced entry by entry, read from any thread
+        self.added = OrderedDict()  # url -> when it was last shown, least recent first
+        self._new = []  # added URLs not probed yet
+        self._lock = threading.Lock()
+
+    def add(self, url):
+        """Probe ``url`` too while it is shown; the first probe follows within a second."""
+        if url in self.urls:
+            return
+        with self._lock:
+            if url not in self.added:
+                self._new.append(url)
+            self.added[url] = time.monotonic()
+            self.added.move_to_end(url)
+            while len(self.added) > MAX_ADDED:
+                self.added.popitem(last=False)
+
+    def _expire(self):
+        """Forget added URLs that have not been shown for two rounds, and their results."""
+        cutoff = time.monotonic() - 2 * self.ttl
+        with self._lock:
+            while self.added and next(iter(self.added.values())) < cutoff:
+                self.added.popitem(last=False)
+            known = set(self.urls).union(self.added)
+        for url in [url for url in self.statuses if url not in known]:
+            del self.statuses[url]
+
+    async def check_all(self, urls=None):
+        """Probe every URL (or just ``urls``) once; returns ``{url: Status}``."""
+        with self._lock:
+            urls = self.urls + list(self.added) if urls is None else list(urls)
+        hosts = {}
+        for url in urls:
+            hosts.setdefault(_origin(url), []).append(url)
+        own = {_origin(url) for url in self.urls}
+        await asyncio.gather(*(self._check_host(origin, urls, public_only=origin not in own)
+                               for origin, urls in hosts.items()))
+        return {url: self.statuses[url] for url in urls}
+
+    async def _check_host(self, origin, urls, public_only=False):
+        scheme, host, port = origin
+        connection = httpclient.Connection(host, port, tls=scheme == "https", timeout=self.timeout,
+                                           headers={"User-Agent": USER_AGENT, "Accept": "*/*"})
+        try:
+            if public_only:
+                try:
+                    connection.address = await _public_address(host, port, self.timeout)
+                except Exception as error:  # not public, or no address at all
+                    for url in urls:
+                        self.statuses[url] = Status(False, None, _reason(error), time.time(), 0.0)
+                    return
+            for url in urls:
+                start = time.monotonic()
+                try:
+                    code = (await connection.head(_target(url))).status
+                except Exception as error:  # any failure counts as down
+                    connection.close()
+                    status = Status(False, None, _reason(error), time.time(), time.monotonic() - start)
+                else:
+                    # 405: the host is up but refuses HEAD.
+                    status = Status(code < 400 or code == 405, code, None, time.time(), time.monotonic() - start)
+                self.statuses[url] = status
+        finally:
+            connection.close()
+
+    async def run(self):
+        checked = None
+        while True:
+            if checked is None or time.monotonic() - checked >= self.ttl:
+                checked = time.monotonic()
+                self._expire()
+                with self._lock:
+                    self._new = []
+                await self.check_all()
+            elif self._new:
+                with self._lock:
+                    new, self._new = self._new, []
+                await self.check_all(new)
+            await asyncio.sleep(1)
+
+    def status(self, url):
+        """The cached ``Status`` of ``url``, or None when unknown or expired."""
+        status = self.statuses.get(url)
+        if status is None or time.time() - status.checked > 2 * self.ttl:
+            return None
+        return status
+
+
+# --- APP ---
+def start():
+    """Start the background checker once per process, under ``streamlit run`` only."""
+    global _checker
+    if not ENABLED or _checker is not None or server.current() is None:
+        return
+    with _lock:
+        if _checker is not None:
+            return
+        _checker = Checker(content.PROJECTS.values())
+    threading.Thread(target=asyncio.run, args=(_checker.run(),), name="resume-links", daemon=True).start()
+
+
+def status(url):
+    return _checker.status(url) if _checker is not None else None
+
+
+def badge(url):
+    """A small online/offline marker for ``url``, or ``""`` while unknown.
+
+    Only the state and its reason go into the markup (no timestamps), so the
+    fragments embedding it stay cacheable. A URL the checker does not know
+    (another tenant's project) is probed while it keeps being shown, and only
+    on a public host: anything else is marked offline, "not public".
+    """
+    if _checker is not None:
+        _checker.add(url)
+    result = status(url)
+    if result is None:
+        return ""
+    if result.ok:
+        return '<span class="resume-link resume-link-up" title="Responding">● online</span>'
+    reason = f"HTTP {result.code}" if result.code is not None else result.error
+    return f'<span class="resume-link resume-link-down" title="Not responding: {html.escape(reason)}">● offline</span>'
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("urls", nargs="*", default=list(content.PROJECTS.values()))
+    parser.add_argument("--timeout", type=float, default=TIMEOUT)
+    args = parser.parse_args(argv)
+
+    began = time.monotonic()
+    results = asyncio.run(Checker(args.urls, timeout=args.timeout).check_all())
+    for url, result in results.items():
+        state = "up" if result.ok else "DOWN"
+        detail = result.code if result.code is not None else result.error
+        print(f"{state:<5} {detail!s:<12} {result.latency * 1e3:>7.0f} ms  {url}")
+    print(f"{len(results)} links in {(time.monotonic() - began) * 1e3:.0f} ms")
+    return 0 if all(result.ok for result in results.values()) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
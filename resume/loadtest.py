@@ -0,0 +1,240 @@
+"""Load test: concurrent simulated visitors against a running app.
+
+Each visitor does what a browser does on a visit, over Streamlit's own
+websocket protocol (``resume.wsclient``):
+
+1. opens a session and runs the script (the page load);
+2. clicks through every ``option_menu`` section, one rerun each. With the
+   default client-side navigation ``app.py`` has no menu and switches
+   sections in the browser, so a visit is just the page load; ``--nav
+   server`` starts the app with the option menu instead;
+3. fetches every piece of media the page references (the CV download and
+   the images, from ``/media/`` or ``/resume-static/``) over one keep-alive
+   connection, like a browser with an empty cache;
+
+then closes the session and starts over, after ``--think`` seconds. Each
+concurrency step runs for ``--duration`` seconds and reports throughput,
+the time from sending a rerun to its ``script_finished`` at p50/p95/p99,
+the p95 of media fetches, and the share of reruns and fetches that failed
+(errors, timeouts, non-2xx answers). Behind ``resume.cluster`` the proxy's
+worker cookie is kept, so media requests reach the worker that registered
+them. All visitors run in this one process; if its CPU column nears 100%,
+the client is the bottleneck and the numbers above it are not the server's.
+
+    python -m resume.loadtest app.py --sessions 1 5 10 25    # starts the app
+    python -m resume.loadtest --url http://127.0.0.1:8501 --sessions 50
+
+Exits non-zero if anything failed.
+"""
+import argparse
+import asyncio
+import os
+import re
+import statistics
+import sys
+import time
+from urllib.parse import urlsplit
+
+from resume import cluster, coldstart, httpclient
+from resume.headless import Run
+from resume.wsclient import ConnectionClosed, StreamlitSession
+
+STEPS = [1, 5, 10, 25]
+DURATION = 20.0
+TIMEOUT = 30.0  # per connect, rerun or fetch
+ACCEPT_ENCODING = "br, gzip"
+MEDIA_PREFIXES = ("media/", "resume-static/")
+
+_URL_ATTR = re.compile(r'(?:src|href)="([^"]+)"|srcset="([^"\s]+)')
+_WORKER_COOKIE = re.compile(rf"^set-cookie:\s*({cluster.COOKIE}=[^;\r\n]+)", re.I | re.M)
+_ERRORS = (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError, ConnectionClosed, ValueError)
+
+
+def media_urls(messages, base_path=""):
+    """Paths of the media a browser would fetch for ``messages``, in page order."""
+    base = base_path.strip("/")
+    prefixes = tuple(f"/{base}/{prefix}" if base else f"/{prefix}" for prefix in MEDIA_PREFIXES)
+    found = []
+    for element in Run(messages, 0).elements():
+        kind = element.WhichOneof("type")
+        if kind == "markdown":
+            # Our own markup carries URLs with the base path already in.
+            found += [src or srcset for src, srcset in _URL_ATTR.findall(element.markdown.body)]
+            continue
+        if kind == "imgs":
+            urls = [img.url for img in element.imgs.imgs]
+        elif kind == "download_button":
+            urls = [element.download_button.url]
+        else:
+            continue
+        # Streamlit's own elements leave the base path to the frontend.
+        found += [f"/{base}{url}" if base and url.startswith("/media/") else url for url in urls]
+    return list(dict.fromkeys(url for url in found if url.startswith(prefixes)))
+
+
+# --- VISITORS ---
+class Stats:
+    """What one concurrency step's visitors did."""
+
+    def __init__(self):
+        self.reruns = []  # seconds to script_finished
+        self.fetches = []  # seconds per media request
+        self.rerun_errors = 0
+        self.fetch_errors = 0
+        self.visits = 0
+        self.bytes = 0
+
+    @property
+    def errors(self):
+        attempts = len(self.reruns) + len(self.fetches) + self.rerun_errors + self.fetch_errors
+        return (self.rerun_errors + self.fetch_errors) / attempts if attempts else 0.0
+
+
+def percentile(values, q):
+    if len(values) < 2:
+        return values[0] if values else float("nan")
+    return statistics.quantiles(values, n=100, method="inclusive")[q - 1]
+
+
+class Target:
+    def __init__(self, url):
+        parts = urlsplit(url)
+        self.host = parts.hostname or coldstart.HOST
+        self.port = parts.port or 80
+        self.base_path = parts.path.strip("/")
+
+
+async def _rerun(session, stats, widgets=None, query=""):
+    start = time.monotonic()
+    messages = await asyncio.wait_for(session.rerun(widgets, query), TIMEOUT)
+    stats.reruns.append(time.monotonic() - start)
+    return messages
+
+
+async def _fetch_all(http, paths, stats):
+    for path in paths:
+        start = time.monotonic()
+        try:
+            response = await asyncio.wait_for(http.get(path), TIMEOUT)
+        except _ERRORS:
+            http.close()
+            stats.fetch_errors += 1
+            continue
+        if response.status >= 300:
+            stats.fetch_errors += 1
+        else:
+            stats.fetches.append(time.monotonic() - start)
+            stats.bytes += len(response.body)
+
+
+async def visit(target, stats, query=""):
+    """One visit: page load, then every menu section, each with its media."""
+    session = await asyncio.wait_for(StreamlitSession.connect(target.host, target.port, target.base_path), TIMEOUT)
+    cookie = _WORKER_COOKIE.search(session.ws.head)
+    headers = {"Accept-Encoding": ACCEPT_ENCODING}
+    if cookie:
+        headers["Cookie"] = cookie.group(1)
+    http = httpclient.Connection(target.host, target.port, headers=headers)
+    seen = set()
+
+    async def run(widgets=None):
+        messages = await _rerun(session, stats, widgets, query)
+        # A rerun drops the /media/ files of the one before, so fetch them
+        # now, as the browser does.
+        paths = [path for path in media_urls(messages, target.base_path) if path not in seen]
+        seen.update(paths)
+        await _fetch_all(http, paths, stats)
+
+    try:
+        await run()
+        for option in session.menu[1] if session.menu else ():
+            await run({session.menu[0]: option})
+        stats.visits += 1
+    finally:
+        http.close()
+        await session.close()
+
+
+async def _visitor(target, stats, deadline, think, query):
+    while time.monotonic() < deadline:
+        try:
+            await visit(target, stats, query)
+        except _ERRORS:
+            # A failed connect or rerun fails the page load.
+            stats.rerun_errors += 1
+            await asyncio.sleep(0.1)
+        if think:
+            await asyncio.sleep(think)
+
+
+async def step(target, sessions, duration, think=0.0, query=""):
+    """Run ``sessions`` concurrent visitors for ``duration`` seconds."""
+    stats = Stats()
+    start, cpu = time.monotonic(), time.process_time()
+    deadline = start + duration
+    await asyncio.gather(*(_visitor(target, stats, deadline, think, query) for _ in range(sessions)))
+    elapsed = time.monotonic() - start
+    return {
+        "sessions": sessions,
+        "visits/s": stats.visits / elapsed,
+        "reruns/s": len(stats.reruns) / elapsed,
+        "p50": percentile(stats.reruns, 50),
+        "p95": percentile(stats.reruns, 95),
+        "p99": percentile(stats.reruns, 99),
+        "media p95": percentile(stats.fetches, 95),
+        "MiB/s": stats.bytes / elapsed / (1 << 20),
+        "errors": stats.errors,
+        "client cpu": (time.process_time() - cpu) / elapsed,
+    }
+
+
+def _print(row):
+    print(f"{row['sessions']:>8} {row['visits/s']:>8.1f} {row['reruns/s']:>8.1f} "
+          + " ".join(f"{row[c] * 1e3:>8.0f}" for c in ("p50", "p95", "p99", "media p95"))
+          + f" {row['MiB/s']:>7.1f} {row['errors']:>7.1%} {row['client cpu']:>10.0%}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("script", nargs="?", default="app.py", help="app to start when no --url is given")
+    parser.add_argument("--url", help="a running server, e.g. http://127.0.0.1:8501")
+    parser.add_argument("--sessions", type=int, nargs="+", default=STEPS, help="concurrent visitors per step")
+    parser.add_argument("--duration", type=float, default=DURATION, help="seconds per step")
+    parser.add_argument("--think", type=float, default=0.0, help="seconds between a visitor's visits")
+    parser.add_argument("--query", default="", help="query string for every rerun, e.g. tenant=jane")
+    parser.add_argument("--nav", choices=("client", "server"), default="client",
+                        help="navigation mode of the app this starts (see resume.layouts)")
+    args = parser.parse_args(argv)
+
+    process = None
+    if args.url is None:
+        port = coldstart.free_port()
+        # Offline and unrecorded: no link probes or analytics from test traffic.
+        env = dict(os.environ, RESUME_NAV_MODE=args.nav, RESUME_LINK_CHECK="0", RESUME_ANALYTICS="0")
+        process = coldstart.launch(args.script, port, env=env, prewarm=True)
+        coldstart.wait_healthy(port, time.monotonic() + coldstart.TIMEOUT, coldstart.READY_PATHS[True])
+        args.url = f"http://{coldstart.HOST}:{port}"
+    target = Target(args.url)
+
+    failed = False
+    try:
+        try:
+            asyncio.run(visit(target, Stats(), args.query))  # uncounted; the steps report failures
+        except _ERRORS:
+            pass
+        print(f"{args.url}  {args.duration:g}s per step")
+        print(f"{'sessions':>8} {'visits/s':>8} {'reruns/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} "
+              f"{'media95':>8} {'MiB/s':>7} {'errors':>7} {'client cpu':>10}")
+        for sessions in args.sessions:
+            row = asyncio.run(step(target, sessions, args.duration, args.think, args.query))
+            _print(row)
+            failed = failed or row["errors"] > 0
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,70 @@
+"""A thread-safe LRU cache bounded by the bytes it holds.
+
+The process-wide caches (asset files, compiled fragments, parsed tenant
+content, search indexes) used to be plain dicts, which is fine for one
+resume and unbounded for hundreds. Each now lives in a ``ByteLRU``: callers
+state what an entry weighs, and the least recently used entries are
+evicted once the total goes over the budget. An entry larger than the
+whole budget is returned to the caller but not kept.
+"""
+import os
+import threading
+from collections import OrderedDict
+
+MiB = 1 << 20
+
+
+def budget(name, default):
+    """Byte budget from the environment variable ``name``, else ``default``."""
+    return int(os.environ.get(name) or default)
+
+
+class ByteLRU:
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self.evictions = 0
+        self._entries = OrderedDict()  # key -> (value, size)
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                return default
+            self._entries.move_to_end(key)
+            return item[0]
+
+    def put(self, key, value, size):
+        """Store ``value`` as weighing ``size`` bytes; replaces any previous entry."""
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.bytes -= old[1]
+            if size > self.max_bytes:
+                return value
+            self._entries[key] = (value, size)
+            self.bytes += size
+            while self.bytes > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self.bytes -= evicted
+                self.evictions += 1
+        return value
+
+    def pop(self, key):
+        with self._lock:
+            item = self._entries.pop(key, None)
+            if item is not None:
+                self.bytes -= item[1]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def values(self):
+        with self._lock:
+            return [value for value, _ in self._entries.values()]
@@ -0,0 +1,64 @@
+"""HTML snippets whose payload is served from Streamlit's media endpoint.
+
+``st.image`` ships its bytes through the in-memory file manager and sends the
+browser only a URL. Registering derivatives the same way lets us emit plain
+``<img loading="lazy">`` markup, so images below the fold are not downloaded
+until the visitor scrolls to them.
+
+Under ``streamlit run`` the derivatives are linked from ``resume.static``
+instead, at immutable URLs the browser keeps between visits; the media store
+is the fallback when that route is not available.
+"""
+import html
+import mimetypes
+from pathlib import Path
+
+from resume import assets, derivatives, static
+
+PLACEHOLDER_COLOR = "#586e75"
+
+
+def media_url(data, mimetype, key, file_name=None):
+    """Register ``data`` for the current session and return its URL.
+
+    ``key`` identifies the element on the page; re-registering the same key
+    replaces the previous file instead of leaking it. With a ``file_name``
+    the file is served as an attachment, like ``st.download_button`` does.
+    """
+    from streamlit import config
+    from streamlit.runtime.in_memory_file_manager import in_memory_file_manager
+
+    url = in_memory_file_manager.add(
+        data, mimetype, f"resume:{key}", file_name=file_name, is_for_static_download=file_name is not None).url
+    base = config.get_option("server.baseUrlPath").strip("/")
+    return f"/{base}{url}" if base else url
+
+
+def _url(source, width, fmt, scale):
+    path = derivatives.derivative_path(source, width, fmt, scale)
+    served = static.url(path)
+    if served:
+        return served
+    key = f"{Path(source).stem}:{fmt}:{scale}"
+    return media_url(assets.read_bytes(path), mimetypes.guess_type(path.name)[0], key)
+
+
+def lazy_image(source, width, alt=""):
+    """``<picture>`` markup for ``source`` that only loads near the viewport.
+
+    The box is sized up front from the source's aspect ratio and painted with
+    a flat placeholder colour, so nothing jumps around when the image lands.
+    """
+    src_width, src_height = derivatives.size(source)
+    height = round(src_height * min(width, src_width) / src_width)
+    width = min(width, src_width)
+    webp = ", ".join(f"{_url(source, width, 'webp', scale)} {scale}x" for scale in derivatives.SCALES)
+    fallback = _url(source, width, "fallback", 1)
+    return (
+        f'<picture style="display:block;width:{width}px;max-width:100%;aspect-ratio:{width}/{height};'
+        f'background:{PLACEHOLDER_COLOR};">'
+        f'<source type="image/webp" srcset="{webp}">'
+        f'<img src="{fallback}" width="{width}" height="{height}" alt="{html.escape(alt)}" '
+        f'loading="lazy" decoding="async" style="width:100%;height:auto;">'
+        "</picture>"
+    )
@@ -0,0 +1,202 @@
+"""Where the server's memory goes, per session and per media file.
+
+Inside the app process (exported through ``resume.metrics`` when that is on):
+
+- ``rss()``: resident set size of the process;
+- ``media_files()``: every file in Streamlit's in-memory media store with
+  its size and how many sessions reference it;
+- ``session_usage()``: per session, the media and cached ForwardMsg bytes
+  it references (each shared object split evenly between the sessions
+  referencing it) plus its session state and outgoing message queue.
+
+From the outside, ``python -m resume.memory`` starts an app, connects
+growing numbers of concurrent sessions and reports RSS against the session
+count, once with the shared asset cache (the default) and once with
+``RESUME_SHARED_ASSETS=0``, where every read gets its own copy:
+
+    python -m resume.memory --sessions 1 10 25 50 app.py app2.py
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+from collections import Counter
+
+from resume import server
+
+PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+def rss(pid="self"):
+    """Resident set size in bytes (Linux), else the peak from getrusage."""
+    try:
+        with open(f"/proc/{pid}/statm") as statm:
+            return int(statm.read().split()[1]) * PAGE_SIZE
+    except OSError:
+        import resource
+
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def deep_size(obj, seen=None, depth=8):
+    """Approximate bytes held by ``obj`` and the containers/objects under it."""
+    seen = set() if seen is None else seen
+    if id(obj) in seen or depth < 0:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj, 0)
+    if isinstance(obj, dict):
+        size += sum(deep_size(k, seen, depth - 1) + deep_size(v, seen, depth - 1) for k, v in list(obj.items()))
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(deep_size(item, seen, depth - 1) for item in list(obj))
+    elif hasattr(obj, "ByteSize"):  # protobuf message
+        size += obj.ByteSize()
+    elif hasattr(obj, "__dict__"):
+        size += deep_size(vars(obj), seen, depth - 1)
+    return size
+
+
+def media_files():
+    """``[{id, mimetype, bytes, sessions}]`` for the in-memory media store."""
+    try:
+        from streamlit.runtime.in_memory_file_manager import in_memory_file_manager as manager
+    except ImportError:
+        return []
+    users = Counter()
+    for coords in list(manager._files_by_session_and_coord.values()):
+        for file_id in {imf.id for imf in list(coords.values())}:
+            users[file_id] += 1
+    return [
+        {"id": file_id, "mimetype": imf.mimetype, "bytes": imf.content_size, "sessions": users[file_id]}
+        for file_id, imf in list(manager._files_by_id.items())
+    ]
+
+
+def _message_cache():
+    srv = server.current()
+    return getattr(srv, "_message_cache", None)
+
+
+def session_usage():
+    """``{session_id: {media, messages, state, queue}}`` in bytes."""
+    try:
+        from streamlit.runtime.in_memory_file_manager import in_memory_file_manager as manager
+    except ImportError:
+        return {}
+    infos = server.sessions()
+    usage = {sid: {"media": 0, "messages": 0, "state": 0, "queue": 0} for sid in infos}
+
+    files = {sid: {imf.id: imf.content_size for imf in list(coords.values())}
+             for sid, coords in list(manager._files_by_session_and_coord.items()) if sid in usage}
+    users = Counter(file_id for ids in files.values() for file_id in ids)
+    for sid, sizes in files.items():
+        usage[sid]["media"] = sum(size / users[file_id] for file_id, size in sizes.items())
+
+    cache = _message_cache()
+    if cache is not None:
+        for entry in list(cache._entries.values()):
+            holders = [s.id for s in list(entry._session_script_run_counts.keys()) if s.id in usage]
+            for sid in holders:
+                usage[sid]["messages"] += entry.msg.ByteSize() / len(holders)
+
+    for sid, info in infos.items():
+        session = info.session
+        usage[sid]["state"] = deep_size(getattr(session, "_session_state", None))
+        usage[sid]["queue"] = deep_size(getattr(getattr(session, "_session_data", None), "_browser_queue", None))
+    return {sid: {k: int(v) for k, v in values.items()} for sid, values in usage.items()}
+
+
+def stats():
+    """``(name, type, value, labels)`` rows for ``resume.metrics``."""
+    yield "process_resident_bytes", "gauge", rss(), {}
+    files = media_files()
+    yield "media_files", "gauge", len(files), {}
+    yield "media_bytes", "gauge", sum(f["bytes"] for f in files), {}
+    yield "media_shared_bytes", "gauge", sum(f["bytes"] for f in files if f["sessions"] > 1), {}
+    usage = session_usage()
+    for kind in ("media", "messages", "state", "queue"):
+        values = [u[kind] for u in usage.values()]
+        yield "session_bytes", "gauge", sum(values), {"kind": kind}
+        yield "session_bytes_max", "gauge", max(values, default=0), {"kind": kind}
+
+
+# --- SCALING REPORT ---
+def _scrape(port):
+    import urllib.request
+
+    text = urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics", timeout=5).read().decode()
+    values = {}
+    for line in text.splitlines():
+        if line and not line.startswith("#"):
+            name, _, value = line.rpartition(" ")
+            values[name] = float(value)
+    return values
+
+
+def scale(script, steps, shared=True):
+    """One row per step: RSS and attributed memory with ``n`` sessions open."""
+    from resume import coldstart
+    from resume.wsclient import StreamlitSession
+
+    port, metrics_port = coldstart.free_port(), coldstart.free_port()
+    env = dict(os.environ, RESUME_METRICS_PORT=str(metrics_port), RESUME_SHARED_ASSETS="1" if shared else "0")
+    process = coldstart.launch(script, port, env=env)
+    rows = []
+    try:
+        coldstart.wait_healthy(port, time.monotonic() + coldstart.TIMEOUT)
+
+        async def drive():
+            sessions = []
+            try:
+                for n in steps:
+                    while len(sessions) < n:
+                        session = await StreamlitSession.connect(coldstart.HOST, port)
+                        await session.rerun()
+                        sessions.append(session)
+                    await asyncio.sleep(1)  # let finished script threads go
+                    scraped = _scrape(metrics_port)
+                    session_bytes = sum(v for k, v in scraped.items() if k.startswith("resume_session_bytes{"))
+                    rows.append({
+                        "sessions": n,
+                        "rss": rss(process.pid),
+                        "media": scraped.get("resume_media_bytes", 0),
+                        "per_session": session_bytes / n,
+                    })
+            finally:
+                for session in sessions:
+                    await session.close()
+
+        asyncio.run(drive())
+    finally:
+        process.terminate()
+        process.wait()
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("scripts", nargs="*", default=["app.py", "app2.py"])
+    parser.add_argument("--sessions", type=int, nargs="+", default=[1, 10, 25, 50])
+    parser.add_argument("--mode", choices=("shared", "copy", "both"), default="both")
+    args = parser.parse_args(argv)
+
+    modes = {"shared": [True], "copy": [False], "both": [True, False]}[args.mode]
+    mib = 1 << 20
+    print(f"{'script':<8} {'mode':<6} {'sessions':>8} {'rss MiB':>8} {'+ KiB/session':>13} "
+          f"{'media KiB':>9} {'attributed KiB/session':>22}")
+    for script in args.scripts:
+        for shared in modes:
+            rows = scale(script, sorted(args.sessions), shared)
+            first = rows[0]
+            for row in rows:
+                # Growth per added session, past the first one (which pays
+                # for imports and warm caches).
+                extra = row["sessions"] - first["sessions"]
+                slope = (row["rss"] - first["rss"]) / extra / 1024 if extra else 0
+                print(f"{script:<8} {'shared' if shared else 'copy':<6} {row['sessions']:>8} {row['rss'] / mib:>8.1f} "
+                      f"{slope:>13.0f} {row['media'] / 1024:>9.0f} {row['per_session'] / 1024:>22.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,231 @@
+"""Timing spans and counters for the rerun hot path, in Prometheus format.
+
+Instrumentation is off unless one of these is set:
+
+- ``RESUME_METRICS_PORT``: serve ``/metrics`` on ``127.0.0.1:<port>``;
+- ``RESUME_METRICS_FILE``: append a snapshot every
+  ``RESUME_METRICS_INTERVAL`` seconds (default 15) to a size-rotated file.
+
+When it is off, ``span()`` hands back a shared do-nothing context manager and
+``inc()`` returns immediately, so the apps can leave the calls in place.
+The same goes for a thread inside ``paused()``, which is how the warm-up
+of ``resume.prewarm`` stays out of the rerun counts.
+
+    with metrics.span("css"):
+        ...
+    metrics.inc("reruns", script="app.py")
+"""
+import bisect
+import contextlib
+import os
+import threading
+import time
+
+PORT = int(os.environ.get("RESUME_METRICS_PORT") or 0)
+FILE = os.environ.get("RESUME_METRICS_FILE")
+INTERVAL = float(os.environ.get("RESUME_METRICS_INTERVAL", 15))
+ENABLED = bool(PORT or FILE)
+
+PREFIX = "resume_"
+BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+_lock = threading.Lock()
+_local = threading.local()
+_spans = {}
+_counters = {}
+_collectors = []
+_started = False
+
+
+class _Noop:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NOOP = _Noop()
+
+
+class _Span:
+    __slots__ = ("name", "start")
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        observe(self.name, time.perf_counter() - self.start)
+        return False
+
+
+def span(name):
+    """Context manager timing one stage of a rerun."""
+    return _Span(name) if ENABLED and not getattr(_local, "paused", False) else _NOOP
+
+
+def observe(name, seconds):
+    with _lock:
+        hist = _spans.get(name)
+        if hist is None:
+            hist = _spans[name] = [0] * (len(BUCKETS) + 1) + [0.0]
+        hist[bisect.bisect_left(BUCKETS, seconds)] += 1
+        hist[-1] += seconds
+
+
+def inc(name, value=1, **labels):
+    """Add ``value`` to the counter ``name`` with the given labels."""
+    if not ENABLED or getattr(_local, "paused", False):
+        return
+    key = (name, tuple(sorted(labels.items())))
+    with _lock:
+        _counters[key] = _counters.get(key, 0) + value
+
+
+@contextlib.contextmanager
+def paused():
+    """Count nothing from this thread inside the block."""
+    paused_before = getattr(_local, "paused", False)  # blocks may nest
+    _local.paused = True
+    try:
+        yield
+    finally:
+        _local.paused = paused_before
+
+
+def collector(fn):
+    """Register ``fn() -> [(name, type, value, labels)]``, called per scrape."""
+    _collectors.append(fn)
+    return fn
+
+
+# --- EXPOSITION ---
+def _labels(labels):
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{k}="{str(v)}"'.replace("\n", " ") for k, v in labels) + "}"
+
+
+def render():
+    """Current values in the Prometheus text exposition format."""
+    lines = []
+    with _lock:
+        spans = {name: list(hist) for name, hist in _spans.items()}
+        counters = dict(_counters)
+
+    lines.append(f"# TYPE {PREFIX}span_seconds histogram")
+    for name, hist in sorted(spans.items()):
+        cumulative = 0
+        for bound, count in zip(BUCKETS + ("+Inf",), hist):
+            cumulative += count
+            lines.append(f'{PREFIX}span_seconds_bucket{{span="{name}",le="{bound}"}} {cumulative}')
+        lines.append(f'{PREFIX}span_seconds_sum{{span="{name}"}} {hist[-1]:.6f}')
+        lines.append(f'{PREFIX}span_seconds_count{{span="{name}"}} {cumulative}')
+
+    typed = set()
+    for (name, labels), value in sorted(counters.items()):
+        if name not in typed:
+            typed.add(name)
+            lines.append(f"# TYPE {PREFIX}{name}_total counter")
+        lines.append(f"{PREFIX}{name}_total{_labels(labels)} {value}")
+
+    for fn in _collectors:
+        for name, kind, value, labels in fn():
+            if name not in typed:
+                typed.add(name)
+                lines.append(f"# TYPE {PREFIX}{name} {kind}")
+            lines.append(f"{PREFIX}{name}{_labels(sorted(labels.items()))} {value}")
+    return "\n".join(lines) + "\n"
+
+
+def _serve():
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?")[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = render().encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    ThreadingHTTPServer(("127.0.0.1", PORT), Handler).serve_forever()
+
+
+def _write_snapshots():
+    import logging.handlers
+
+    logger = logging.getLogger("resume.metrics")
+    logger.propagate = False
+    handler = logging.handlers.RotatingFileHandler(FILE, maxBytes=1 << 20, backupCount=3)
+    handler.setFormatter(logging.Formatter("# %(asctime)s\n%(message)s"))
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    while True:
+        time.sleep(INTERVAL)
+        logger.info(render())
+
+
+def start():
+    """Start the exporter once per process; a no-op when disabled."""
+    global _started
+    if not ENABLED:
+        return
+    with _lock:
+        if _started:
+            return
+        _started = True
+    if PORT:
+        threading.Thread(target=_serve, name="resume-metrics", daemon=True).start()
+    if FILE:
+        threading.Thread(target=_write_snapshots, name="resume-metrics-file", daemon=True).start()
+
+
+# --- BUILT-IN COLLECTORS ---
+@collector
+def _cache_stats():
+    from resume import assets, fragments, server, tenants
+
+    stats = assets.stats()
+    yield "asset_cache_hits_total", "counter", stats["hits"], {}
+    yield "asset_cache_misses_total", "counter", stats["misses"], {}
+    yield "asset_cache_bytes", "gauge", stats["bytes"], {}
+    yield "asset_cache_evictions_total", "counter", stats["evictions"], {}
+    stats = fragments.stats()
+    yield "fragment_cache_hits_total", "counter", stats["hits"], {}
+    yield "fragment_cache_misses_total", "counter", stats["misses"], {}
+    yield "fragment_cache_bytes", "gauge", stats["bytes"], {}
+    yield "fragment_cache_evictions_total", "counter", stats["evictions"], {}
+    yield "tenant_cache_bytes", "gauge", tenants.cache.bytes, {}
+    yield "tenant_cache_evictions_total", "counter", tenants.cache.evictions, {}
+    yield "active_sessions", "gauge", len(server.sessions()), {}
+
+
+@collector
+def _analytics_stats():
+    from resume import analytics
+
+    stats = analytics.stats()
+    for name in ("recorded", "dropped", "written", "failed"):
+        yield f"analytics_events_{name}_total", "counter", stats[name], {}
+    yield "analytics_events_buffered", "gauge", stats["buffered"], {}
+
+
+@collector
+def _memory_stats():
+    from resume import memory
+
+    yield from memory.stats()
@@ -0,0 +1,144 @@
+"""Warm a Streamlit process up before it takes visitors.
+
+Without this, the first visitor after a dyno wakes up pays for everything
+a fresh process does once: imports, reading assets off disk, rendering
+image derivatives, component registration and the first compile of every
+fragment. Start the app with
+
+    python -m resume.prewarm app.py [streamlit options]
+
+instead of ``streamlit run``. The server starts as usual, and a background
+thread, once the server is up,
+
+1. imports the app's modules and registers the option-menu component;
+2. builds any missing CV artifacts and image derivatives and loads them,
+   with the CSS, into the asset cache;
+3. renders every section once headlessly (``resume.headless``), which
+   compiles the fragments and registers the static route. That render is
+   not a visit: it is left out of ``resume.metrics`` and
+   ``resume.analytics``.
+
+``/readyz`` answers 503 until that is done and 200 afterwards, with the
+step timings as JSON. ``/healthz`` still only means "the server is up".
+``resume.cluster`` starts its workers this way and sends visitors only to
+ready ones. If warming fails, the error is logged and the process reports
+ready anyway, just cold.
+
+``python -m resume.prewarm --build`` does only the on-disk part of step 2,
+for a build or release phase.
+"""
+import argparse
+import logging
+import sys
+import threading
+import time
+
+from resume import analytics, artifacts, assets, derivatives, metrics, server, styles
+
+READY_PATH = "readyz"
+TIMEOUT = 60.0  # for the server to come up
+
+log = logging.getLogger("resume.prewarm")
+
+_ready = threading.Event()
+_report = {}  # step -> seconds
+
+
+# --- STEPS ---
+def build():
+    """Write the on-disk caches; returns the paths of every cached file."""
+    return artifacts.build() + derivatives.build()
+
+
+def _imports(script):
+    # layouts pulls in the resume modules; the option menu (server-mode
+    # sidebar) registers its component on import.
+    import streamlit_option_menu
+    from resume import layouts
+
+
+def _caches(script):
+    from resume import layouts
+
+    for path in build():
+        assets.read_bytes(path)
+    styles.inline_css(layouts.CSS_FILE)
+
+
+def _render(script):
+    from streamlit.runtime.in_memory_file_manager import in_memory_file_manager
+
+    from resume import headless
+
+    session = headless.Session(script)
+    with metrics.paused(), analytics.paused():
+        session.run()
+        for option in session.menu[1] if session.menu else ():
+            session.select(option)
+    # Nobody will fetch what the simulated session registered.
+    in_memory_file_manager.clear_session_files(session.id)
+
+
+STEPS = (("imports", _imports), ("caches", _caches), ("render", _render))
+
+
+def warm(script):
+    """Run every step once; returns ``{step: seconds}``."""
+    report = {}
+    for name, step in STEPS:
+        start = time.perf_counter()
+        step(script)
+        report[name] = round(time.perf_counter() - start, 3)
+    return report
+
+
+# --- READINESS ---
+def _handler():
+    import tornado.web
+
+    class ReadyHandler(tornado.web.RequestHandler):
+        def get(self):
+            self.set_header("Cache-Control", "no-cache")
+            if not _ready.is_set():
+                self.set_status(503)
+            self.write({"ready": _ready.is_set(), "steps": _report})
+
+    return ReadyHandler
+
+
+def _run(script):
+    if server.wait(TIMEOUT) is None:
+        log.error("server not up after %.0fs; not warming", TIMEOUT)
+        return
+    server.add_routes([(READY_PATH, _handler())])
+    start = time.perf_counter()
+    try:
+        _report.update(warm(script))
+    except Exception:
+        log.exception("pre-warm failed; serving cold")
+    _ready.set()
+    log.info("ready after %.2fs of warming: %s", time.perf_counter() - start, _report)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("script", nargs="?", default="app.py")
+    parser.add_argument("--build", action="store_true", help="only fill the on-disk caches, then exit")
+    args, streamlit_args = parser.parse_known_args(argv)
+
+    if args.build:
+        for path in build():
+            print(f"{path.stat().st_size:>9,}  {path.name}")
+        return
+
+    # Streamlit configures logging, ours included, when it starts.
+    threading.Thread(target=_run, args=(args.script,), name="resume-prewarm", daemon=True).start()
+
+    from streamlit.web import cli
+
+    sys.argv = ["streamlit", "run", args.script, *streamlit_args]
+    cli.main(prog_name="streamlit")
+
+
+if __name__ == "__main__":
+    main()
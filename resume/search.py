@@ -0,0 +1,157 @@
+"""Keyword search over skills, work history and projects.
+
+An inverted index is built from a tenant's content (``resume.tenants``) on
+first use and kept in the shared tenant cache, keyed by the content's hash,
+so a query never scans the resume text: each query
+word is looked up in the index (words typed so far match as prefixes, found
+by bisecting the sorted vocabulary) and only the documents on those posting
+lists are scored. Hits are ranked with BM25, and exact words count for more
+than prefix matches. A document must match every query word, and matching
+the whole query as a phrase ranks it higher.
+
+    python -m resume.search "power bi" scikit
+"""
+import bisect
+import math
+import re
+import sys
+import threading
+import time
+from collections import namedtuple
+
+from resume import memory, tenants
+
+# Documents are one skill, one job or one project; ``section`` is the
+# section title they link to, ``lines`` the text shown as snippets.
+Doc = namedtuple("Doc", "section title lines")
+Hit = namedtuple("Hit", "score section title snippet")
+
+MAX_EXPANSIONS = 32  # vocabulary words a prefix may expand to
+PREFIX_WEIGHT = 0.6
+PHRASE_BOOST = 1.5
+K1, B = 1.2, 0.75
+
+_TOKEN = re.compile(r"[a-z0-9+#]+")
+_lock = threading.Lock()
+
+
+def tokenize(text):
+    return _TOKEN.findall(text.lower())
+
+
+def documents(tenant=None):
+    """The searchable documents of ``tenant`` (by default the current one)."""
+    content = tenant or tenants.current()
+    docs = [Doc("Skills", skill, (details,)) for skill, details in content.SKILLS]
+    docs += [Doc("Work History", role, (dates, *bullets)) for role, dates, bullets in content.JOBS]
+    docs += [Doc("Projects & Accomplishments", project, ()) for project in content.PROJECTS]
+    return docs
+
+
+class Index:
+    def __init__(self, docs):
+        self.docs = docs
+        postings = {}
+        self.lengths = []
+        self.texts = []
+        self.lines = []  # per document: (line, its tokens), for snippets
+        for doc_id, doc in enumerate(docs):
+            self.lines.append(tuple((line, tokenize(line)) for line in doc.lines))
+            tokens = tokenize(" ".join((doc.title, *doc.lines)))
+            self.lengths.append(len(tokens))
+            self.texts.append(" ".join(tokens))
+            for token in tokens:
+                counts = postings.setdefault(token, {})
+                counts[doc_id] = counts.get(doc_id, 0) + 1
+        self.terms = sorted(postings)
+        self.postings = {term: tuple(counts.items()) for term, counts in postings.items()}
+        n = len(docs)
+        self.idf = {term: math.log(1 + (n - len(p) + 0.5) / (len(p) + 0.5)) for term, p in self.postings.items()}
+        self.average_length = sum(self.lengths) / max(n, 1)
+
+    def expand(self, token):
+        """Vocabulary words starting with ``token``, the exact word first."""
+        start = bisect.bisect_left(self.terms, token)
+        words = []
+        for term in self.terms[start:start + MAX_EXPANSIONS]:
+            if not term.startswith(token):
+                break
+            words.append(term)
+        return words
+
+    def _scores(self, token):
+        scores = {}
+        # A completion never outweighs the word as typed: "data" should not
+        # rank "databases" (rarer, so higher idf) above "data" itself.
+        ceiling = self.idf.get(token, math.inf)
+        for term in self.expand(token):
+            weight = self.idf[term] if term == token else PREFIX_WEIGHT * min(self.idf[term], ceiling)
+            for doc_id, tf in self.postings[term]:
+                norm = 1 - B + B * self.lengths[doc_id] / self.average_length
+                score = weight * tf * (K1 + 1) / (tf + K1 * norm)
+                if score > scores.get(doc_id, 0.0):
+                    scores[doc_id] = score
+        return scores
+
+    def search(self, query, limit=10):
+        """Ranked ``Hit``s for ``query``, best first."""
+        tokens = tokenize(query)
+        if not tokens:
+            return []
+        total = None
+        for token in dict.fromkeys(tokens):
+            scores = self._scores(token)
+            if total is None:
+                total = scores
+            else:
+                total = {doc_id: total[doc_id] + score for doc_id, score in scores.items() if doc_id in total}
+            if not total:
+                return []
+        phrase = " ".join(tokens)
+        if len(tokens) > 1:
+            for doc_id in total:
+                if phrase in self.texts[doc_id]:
+                    total[doc_id] *= PHRASE_BOOST
+        ranked = sorted(total.items(), key=lambda item: (-item[1], item[0]))[:limit]
+        return [Hit(round(score, 4), self.docs[doc_id].section, self.docs[doc_id].title,
+                    self._snippet(doc_id, tokens)) for doc_id, score in ranked]
+
+    def _snippet(self, doc_id, tokens):
+        """The line matching most query words (prefixes count), or ``""``."""
+        best, best_matches = "", 0
+        for line, words in self.lines[doc_id]:
+            matches = sum(any(word.startswith(token) for word in words) for token in tokens)
+            if matches > best_matches:
+                best, best_matches = line, matches
+        return best
+
+
+def index(tenant=None):
+    """The index of ``tenant``'s content, built on first use."""
+    tenant = tenant or tenants.current()
+    key = ("index", tenant.key)
+    idx = tenants.cache.get(key)
+    if idx is None:
+        with _lock:
+            idx = tenants.cache.get(key)
+            if idx is None:
+                idx = Index(documents(tenant))
+                tenants.cache.put(key, idx, memory.deep_size(idx))
+    return idx
+
+
+def search(query, limit=10, tenant=None):
+    return index(tenant).search(query, limit)
+
+
+if __name__ == "__main__":
+    start = time.perf_counter()
+    idx = index()
+    print(f"{len(idx.docs)} documents, {len(idx.terms)} words, built in {(time.perf_counter() - start) * 1e3:.2f} ms")
+    for query in sys.argv[1:] or ["Power BI", "Scikit-Learn", "pyth"]:
+        start = time.perf_counter()
+        hits = search(query)
+        elapsed = (time.perf_counter() - start) * 1e6
+        print(f"\n{query!r}: {len(hits)} hits in {elapsed:.0f} us")
+        for hit in hits:
+            print(f"  {hit.score:>7.3f}  {hit.section} / {hit.title}" + (f"\n           {hit.snippet}" if hit.snippet else ""))
@@ -0,0 +1,129 @@
+"""Access to the running Streamlit server from inside the app process.
+
+Streamlit 1.12 has no public handle on its ``Server`` object, so we find it
+once through the garbage collector and keep a weak reference. Everything
+here degrades to "no server" when the scripts run outside ``streamlit run``
+(bare ``python app.py``, the headless runner, the benchmarks).
+"""
+import gc
+import threading
+import time
+import weakref
+
+# Walking every object is not free; don't search more often than this.
+RESCAN_SECONDS = 30
+
+_lock = threading.Lock()
+_server = None
+_searched_at = None
+_application = None
+
+
+def current():
+    """The running ``streamlit.web.server.Server``, or None."""
+    global _server, _searched_at
+    server = _server() if _server is not None else None
+    if server is not None:
+        return server
+    try:
+        from streamlit.web.server import Server
+    except ImportError:
+        return None
+    with _lock:
+        now = time.monotonic()
+        if _searched_at is not None and now - _searched_at < RESCAN_SECONDS:
+            return None
+        _searched_at = now
+        server = _find(Server)
+        if server is not None:
+            _server = weakref.ref(server)
+    return server
+
+
+def _find(cls):
+    for obj in gc.get_objects():
+        # isinstance() on a dead weak proxy raises ReferenceError.
+        if not isinstance(obj, weakref.ProxyTypes) and isinstance(obj, cls):
+            return obj
+    return None
+
+
+def sessions():
+    """``{session_id: SessionInfo}`` of the connected sessions."""
+    server = current()
+    if server is None:
+        return {}
+    return dict(server._session_info_by_id)
+
+
+def application():
+    """The server's ``tornado.web.Application``, or None.
+
+    ``Server.start`` builds it as a local, so it too is found by a search.
+    """
+    global _application
+    app = _application() if _application is not None else None
+    if app is not None or current() is None:
+        return app
+    import tornado.web
+
+    with _lock:
+        app = _find(tornado.web.Application)
+        if app is not None:
+            _application = weakref.ref(app)
+    return app
+
+
+def call_soon(callback, *args):
+    """Run ``callback(*args)`` on the server's event loop, from any thread."""
+    current()._get_eventloop().call_soon_threadsafe(callback, *args)
+
+
+def url(path):
+    """Absolute URL path of ``path`` under the server's base URL path."""
+    from streamlit import config
+
+    base = config.get_option("server.baseUrlPath").strip("/")
+    return f"/{base}/{path}" if base else f"/{path}"
+
+
+def add_routes(routes):
+    """Add ``(path, handler[, kwargs])`` routes to the running server.
+
+    ``path`` is a regex relative to the base URL path. The routes are matched
+    before Streamlit's catch-all static handler. Returns False when there is
+    no server to add them to.
+    """
+    app = application()
+    if app is None:
+        return False
+    from streamlit import config
+    from streamlit.web.server.server_util import make_url_path_regex
+
+    base = config.get_option("server.baseUrlPath")
+    rules = [(make_url_path_regex(base, path), *rest) for path, *rest in routes]
+    # Routing belongs to the server's event loop.
+    call_soon(app.add_handlers, r".*$", rules)
+    return True
+
+
+def wait(timeout):
+    """Block until the server is up and running its event loop.
+
+    For threads started next to ``streamlit run`` (see resume/prewarm.py);
+    returns the ``tornado.web.Application``, or None after ``timeout`` seconds.
+    """
+    global _server, _application
+    import tornado.web
+    from streamlit.web.server import Server
+
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        with _lock:
+            server = _find(Server)
+            app = _find(tornado.web.Application) if server is not None else None
+            if app is not None and getattr(server, "_eventloop", None) is not None:
+                _server, _application = weakref.ref(server), weakref.ref(app)
+                return app
+        time.sleep(0.1)
+    return None
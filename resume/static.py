@@ -0,0 +1,142 @@
+"""Cacheable URLs for the CV and images, on the Streamlit server's own port.
+
+Files sent through Streamlit's media store (``st.download_button``,
+``st.image``, ``media.media_url``) get a fresh URL per session and no
+caching headers, so every visit downloads them again. Instead, the first
+script run adds a route to the running tornado application:
+
+    /resume-static/<name>
+
+which serves only files that were handed to ``url``. Their names already
+carry a content hash (``CV.<key>.pdf`` from ``resume.artifacts``,
+``<stem>.<digest>.<width>w.webp`` from ``resume.derivatives``), so a URL
+never changes meaning and is served with ``Cache-Control: immutable``.
+Tornado's ``StaticFileHandler`` answers ``If-None-Match`` with 304 and
+``Range`` requests with 206. Files worth compressing get ``.gz``/``.br``
+siblings in ``.cache/static`` (same rule as ``resume.export``), sent with
+``Content-Encoding`` when the browser accepts them.
+
+Outside ``streamlit run`` there is no server to add a route to; ``url``
+then returns None and callers fall back to the media store.
+"""
+import mimetypes
+import os
+import threading
+from pathlib import Path
+
+from resume import server
+
+ROOT = Path(__file__).resolve().parent.parent
+CACHE_DIR = Path(os.environ.get("RESUME_STATIC_DIR", ROOT / ".cache" / "static"))
+PREFIX = "resume-static"
+MAX_AGE = 365 * 24 * 3600
+CACHE_CONTROL = f"public, max-age={MAX_AGE}, immutable"
+ENCODINGS = (("br", ".br"), ("gzip", ".gz"))  # in order of preference
+
+_lock = threading.Lock()
+_files = {}  # URL name -> absolute path
+_variants = {}  # URL name + ".gz"/".br" -> absolute path
+_installed = False
+
+
+# --- ROUTE ---
+def _handler():
+    import tornado.web
+
+    class Handler(tornado.web.StaticFileHandler):
+        """Serves published files by name, picking a precompressed variant."""
+
+        async def get(self, path, include_body=True):
+            # Vary: Accept-Encoding is added by tornado's compress_response
+            # transform, which Streamlit turns on.
+            if path not in _files:
+                raise tornado.web.HTTPError(404)
+            for encoding, suffix in ENCODINGS:
+                if path + suffix in _variants and _accepts(self.request.headers.get("Accept-Encoding", ""), encoding):
+                    self.set_header("Content-Encoding", encoding)
+                    path += suffix
+                    break
+            await super().get(path, include_body)
+
+        @classmethod
+        def get_absolute_path(cls, root, path):
+            return _files.get(path) or _variants.get(path, "")
+
+        def validate_absolute_path(self, root, absolute_path):
+            if not absolute_path or not os.path.isfile(absolute_path):
+                raise tornado.web.HTTPError(404)
+            return absolute_path
+
+        def get_content_type(self):
+            # The type of the published file, not of its .gz/.br variant.
+            return mimetypes.guess_type(self.path_args[0])[0] or "application/octet-stream"
+
+        def get_cache_time(self, path, modified, mime_type):
+            return MAX_AGE
+
+        def set_extra_headers(self, path):
+            self.set_header("Cache-Control", CACHE_CONTROL)
+
+    return Handler
+
+
+def _accepts(header, encoding):
+    for item in header.split(","):
+        name, *params = item.split(";")
+        if name.strip().lower() not in (encoding, "*"):
+            continue
+        for param in params:
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    return float(value) > 0
+                except ValueError:
+                    return False
+        return True
+    return False
+
+
+def install():
+    """Add the route to the running server once; False outside ``streamlit run``."""
+    global _installed
+    if _installed:
+        return True
+    with _lock:
+        if not _installed:
+            _installed = server.add_routes([(f"{PREFIX}/(.*)", _handler(), {"path": str(CACHE_DIR)})])
+    return _installed
+
+
+# --- PUBLISHING ---
+def _compress(path):
+    """Write the precompressed siblings of ``path`` that are worth keeping."""
+    from resume import assets, export
+
+    found = {}
+    for name, data in export.compressed(path.name, assets.read_bytes(path)):
+        target = CACHE_DIR / name
+        if not target.exists():
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            tmp = target.with_name(f".{name}.{os.getpid()}")
+            tmp.write_bytes(data)
+            os.replace(tmp, target)
+        found[name] = str(target)
+    # Variants of older versions of the same file (same stem and type).
+    stem = path.name.split(".")[0]
+    for old in CACHE_DIR.glob(f"{stem}.*{path.suffix}.*"):
+        if not old.name.startswith(path.name + "."):
+            old.unlink(missing_ok=True)
+    return found
+
+
+def url(path):
+    """The immutable URL of ``path`` (a content-hashed file name), or None."""
+    path = Path(path).resolve()
+    if not install():
+        return None
+    if path.name not in _files:
+        with _lock:
+            if path.name not in _files:
+                _variants.update(_compress(path))
+                _files[path.name] = str(path)
+    return server.url(f"{PREFIX}/{path.name}")
@@ -0,0 +1,68 @@
+"""The app stylesheet, with its self-hosted web font resolved.
+
+``styles/main.css`` declares Readex Pro with an ``@font-face`` pointing at a
+file next to it (see ``resume.fonts``). Streamlit 1.12 cannot serve such a
+file, so for the apps the font is inlined as a data URI into the critical CSS
+that is injected on every rerun; Streamlit's message cache means the browser
+only downloads that large delta once. If the font has not been vendored the
+``@font-face`` rule is dropped, with a warning in the log, and the system
+font stack takes over, so nothing is ever fetched from a third party.
+"""
+import base64
+import logging
+import mimetypes
+import re
+import threading
+from pathlib import Path
+
+from resume import assets
+
+ROOT = Path(__file__).resolve().parent.parent
+CSS_FILE = ROOT / "styles" / "main.css"
+
+_FONT_FACE = re.compile(r"@font-face\s*\{[^}]*\}\s*")
+_URL = re.compile(r"""url\((['"]?)([^'")]+)\1\)""")
+
+log = logging.getLogger("resume.styles")
+
+_lock = threading.Lock()
+_cache = {}
+
+
+def render_css(path, url_for):
+    """``path``'s CSS with every ``@font-face`` URL replaced by ``url_for(file)``.
+
+    Rules whose files are missing are removed altogether.
+    """
+    path = Path(path)
+
+    def face(match):
+        block = match.group(0)
+        files = [path.parent / url for _, url in _URL.findall(block)]
+        if not all(f.is_file() for f in files):
+            log.warning("%s: no %s, using the system fonts; run python -m resume.fonts",
+                        path.name, ", ".join(f.name for f in files if not f.is_file()))
+            return ""
+        return _URL.sub(lambda m: f'url("{url_for(path.parent / m.group(2))}")', block)
+
+    return _FONT_FACE.sub(face, assets.read_text(path))
+
+
+def _data_uri(path):
+    mimetype = mimetypes.guess_type(path.name)[0] or "font/woff2"
+    return f"data:{mimetype};base64,{base64.b64encode(assets.read_bytes(path)).decode()}"
+
+
+def inline_css(path=CSS_FILE):
+    """Critical CSS for the apps, fonts inlined; cached per file version."""
+    path = Path(path)
+    fonts = tuple(sorted(p.name for p in (path.parent / "fonts").glob("*.woff2")))
+    key = (assets.digest(path),) + tuple(assets.digest(path.parent / "fonts" / f) for f in fonts)
+    with _lock:
+        css = _cache.get(key)
+    if css is None:
+        css = render_css(path, _data_uri)
+        with _lock:
+            _cache.clear()
+            _cache[key] = css
+    return css
@@ -0,0 +1,234 @@
+"""Many resumes from one process: one tenant per person.
+
+The built-in resume is ``resume.content`` with its images under ``assets/``.
+Every other tenant is a directory under ``tenants/`` (``RESUME_TENANTS_DIR``):
+
+    tenants/jane-doe/
+        content.json        the fields of resume/content.py, lower-cased
+        profile-pic.png     optional
+        project_images/     optional, named per project by "project_images"
+
+A visit picks its tenant with ``?tenant=jane-doe``, or with the path
+``/r/jane-doe``, which redirects there. Without one it gets the built-in
+resume. Tenant ids are lower-case letters, digits and dashes. A
+``content.json`` that does not parse, or whose fields have the wrong types,
+is treated like a missing one (and logged); links in it must be ``http``,
+``https`` or ``mailto`` URLs.
+
+Nothing is per tenant except the content. Parsed tenants are kept in
+``cache``, an LRU bounded by ``RESUME_CONTENT_CACHE_BYTES`` (default 16 MiB)
+that ``resume.search`` shares for its indexes. Files, decoded images and
+fragments go into the byte-bounded caches of ``resume.assets`` and
+``resume.fragments``. Image derivatives and CV artifacts are written to
+the same cache directories, named by content hash, so identical images
+are stored once.
+"""
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+from pathlib import Path
+
+from resume import content, memory, server
+from resume.lru import ByteLRU, MiB, budget
+
+ROOT = Path(__file__).resolve().parent.parent
+TENANTS_DIR = Path(os.environ.get("RESUME_TENANTS_DIR", ROOT / "tenants"))
+CONTENT_FILE = "content.json"
+PATH_PREFIX = "r"
+FIELDS = ("PAGE_TITLE", "PAGE_ICON", "NAME", "DESCRIPTION", "EMAIL", "SOCIAL_MEDIA", "PROJECTS",
+          "PROJECT_IMAGES", "EXPERIENCE", "SKILLS", "JOBS", "EDUCATION", "CERTIFICATIONS", "THANK_YOU")
+
+_ID = re.compile(r"[a-z0-9][a-z0-9-]{0,63}")
+_LINK = re.compile(r"(?:https?://|mailto:)\S+", re.I)
+
+log = logging.getLogger("resume.tenants")
+_local = threading.local()
+_installed = False
+
+cache = ByteLRU(budget("RESUME_CONTENT_CACHE_BYTES", 16 * MiB))
+
+
+class Tenant:
+    """One resume: the ``resume.content`` fields, plus where its images are."""
+
+    def __init__(self, tenant_id, fields, assets_dir):
+        self.id = tenant_id
+        for name in FIELDS:
+            setattr(self, name, fields[name])
+        self.profile_pic = assets_dir / "profile-pic.png"
+        self.project_images_dir = assets_dir / "project_images"
+        # Identifies this version of the content, e.g. in cache keys.
+        self.key = hashlib.sha256(f"{tenant_id}\n{[fields[name] for name in FIELDS]!r}".encode()).hexdigest()
+
+    @property
+    def is_default(self):
+        return self is DEFAULT
+
+    def profile_image(self):
+        """Path of the profile picture, or None if there is none."""
+        return _own_file(self.profile_pic, self.profile_pic.parent)
+
+    def project_image(self, project):
+        """Path of ``project``'s image, or None if it has none."""
+        name = self.PROJECT_IMAGES.get(project)
+        return _own_file(self.project_images_dir / name, self.project_images_dir) if _file_name(name) else None
+
+
+DEFAULT = Tenant("default", {name: getattr(content, name) for name in FIELDS}, ROOT / "assets")
+
+
+def _own_file(path, directory):
+    """``path`` if it is a file inside ``directory``, not a link out of it."""
+    return path if path.is_file() and path.resolve().is_relative_to(directory.resolve()) else None
+
+
+def _file_name(name):
+    """Whether ``name`` is a plain file name, with no directory part."""
+    return isinstance(name, str) and name not in ("", ".", "..") and Path(name).name == name and "\\" not in name
+
+
+def _strings(value, length=None):
+    return (isinstance(value, list) and all(isinstance(item, str) for item in value)
+            and (length is None or len(value) == length))
+
+
+def _job(value):
+    return isinstance(value, list) and len(value) == 3 and _strings(value[:2]) and _strings(value[2])
+
+
+def _parse(tenant_id, raw, directory):
+    """The tenant in ``raw``; raises ValueError unless every field has its shape."""
+    data = json.loads(raw)  # JSONDecodeError and UnicodeDecodeError are ValueErrors
+    if not isinstance(data, dict) or not data.get("name"):
+        raise ValueError(f"{directory / CONTENT_FILE}: an object with at least a \"name\"")
+
+    def field(name, default, valid, expected):
+        value = data.get(name, default)
+        if not valid(value):
+            raise ValueError(f"{directory / CONTENT_FILE}: \"{name}\" must be {expected}")
+        return value
+
+    def text(name, default=""):
+        return field(name, default, lambda value: isinstance(value, str), "a string")
+
+    def mapping(name, valid=lambda item: isinstance(item, str), expected="an object of strings"):
+        return dict(field(name, {}, lambda value: isinstance(value, dict) and all(map(valid, value.values())),
+                          expected))
+
+    def links(name):
+        return mapping(name, lambda item: isinstance(item, str) and _LINK.fullmatch(item),
+                       "an object of http(s) or mailto URLs")
+
+    fields = {
+        "PAGE_TITLE": text("page_title") or f"Digital CV | {text('name')}",
+        "PAGE_ICON": text("page_icon") or content.PAGE_ICON,
+        "NAME": text("name"),
+        "DESCRIPTION": text("description"),
+        "EMAIL": text("email"),
+        "SOCIAL_MEDIA": links("social_media"),
+        "PROJECTS": links("projects"),
+        "PROJECT_IMAGES": mapping("project_images", _file_name, "an object of file names in project_images/"),
+        "EXPERIENCE": list(field("experience", [], _strings, "a list of strings")),
+        "SKILLS": [tuple(skill) for skill in field(
+            "skills", [], lambda value: isinstance(value, list) and all(_strings(item, 2) for item in value),
+            "a list of [skill, details] pairs")],
+        "JOBS": [(role, dates, list(bullets)) for role, dates, bullets in field(
+            "jobs", [], lambda value: isinstance(value, list) and all(map(_job, value)),
+            "a list of [title, dates, [bullet, ...]] entries")],
+        "EDUCATION": [tuple(entry) for entry in field(
+            "education", [], lambda value: isinstance(value, list) and all(_strings(item, 2) for item in value),
+            "a list of [title, details] pairs")],
+        "CERTIFICATIONS": list(field("certifications", [], _strings, "a list of strings")),
+        "THANK_YOU": text("thank_you"),
+    }
+    return Tenant(tenant_id, fields, directory)
+
+
+def load(tenant_id):
+    """The tenant called ``tenant_id``, or None if there is none.
+
+    Parsed tenants are cached and re-read when their ``content.json``
+    changes. Raises ValueError for a ``content.json`` that does not parse or
+    has a field of the wrong type.
+    """
+    if tenant_id == DEFAULT.id:
+        return DEFAULT
+    if not _ID.fullmatch(tenant_id or ""):
+        return None
+    directory = TENANTS_DIR / tenant_id
+    try:
+        st = os.stat(directory / CONTENT_FILE)
+    except OSError:
+        return None
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = cache.get(("tenant", tenant_id))
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    raw = (directory / CONTENT_FILE).read_bytes()
+    tenant = _parse(tenant_id, raw, directory)
+    return cache.put(("tenant", tenant_id), (stamp, tenant), len(raw) + memory.deep_size(tenant))[1]
+
+
+def ids():
+    """Every tenant id on disk, sorted."""
+    if not TENANTS_DIR.is_dir():
+        return []
+    return sorted(p.parent.name for p in TENANTS_DIR.glob(f"*/{CONTENT_FILE}") if _ID.fullmatch(p.parent.name))
+
+
+# --- PER RUN ---
+def current():
+    """The tenant the running script renders, by default the built-in one."""
+    return getattr(_local, "tenant", DEFAULT)
+
+
+def activate(tenant):
+    """Render ``tenant`` for the rest of this script run (this thread)."""
+    _local.tenant = tenant
+
+
+def select():
+    """Activate the tenant named by ``?tenant=``; None when there is no such (valid) tenant."""
+    import streamlit as st
+
+    wanted = (st.experimental_get_query_params().get("tenant") or [""])[0].strip().lower()
+    try:
+        tenant = load(wanted) if wanted else DEFAULT
+    except ValueError as error:
+        log.warning("not serving tenant %r: %s", wanted, error)
+        tenant = None
+    activate(tenant or DEFAULT)
+    return tenant
+
+
+def query(tenant=None):
+    """The query string prefix that keeps links on ``tenant``: ``""`` or ``"tenant=id&"``."""
+    tenant = tenant or current()
+    return "" if tenant.is_default else f"tenant={tenant.id}&"
+
+
+# --- ROUTES ---
+def _handler():
+    import tornado.web
+
+    class TenantHandler(tornado.web.RequestHandler):
+        def get(self, tenant_id):
+            try:
+                tenant = load(tenant_id)
+            except ValueError:
+                tenant = None
+            if tenant is None:
+                raise tornado.web.HTTPError(404)
+            self.redirect(f"{server.url('')}?tenant={tenant.id}")
+
+    return TenantHandler
+
+
+def install():
+    """Add the ``/r/<id>`` redirect once; a no-op outside ``streamlit run``."""
+    global _installed
+    if not _installed and server.current() is not None:
+        _installed = server.add_routes([(rf"{PATH_PREFIX}/([a-z0-9-]+)", _handler())])
@@ -0,0 +1,154 @@
+"""A small asyncio WebSocket client - just enough to drive a Streamlit app.
+
+Streamlit's browser protocol is protobuf ``BackMsg``/``ForwardMsg`` messages
+in binary frames on ``/stream``. This speaks that from the standard library
+so the measurement tools don't need a browser or extra dependencies.
+"""
+import asyncio
+import base64
+import hashlib
+import os
+import struct
+
+_GUID = b"258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+OP_CONT, OP_TEXT, OP_BINARY, OP_CLOSE, OP_PING, OP_PONG = 0x0, 0x1, 0x2, 0x8, 0x9, 0xA
+
+
+class ConnectionClosed(Exception):
+    pass
+
+
+class WebSocket:
+    def __init__(self, reader, writer, head=""):
+        self.reader = reader
+        self.writer = writer
+        self.head = head  # the handshake response, e.g. for its Set-Cookie headers
+
+    @classmethod
+    async def connect(cls, host, port, path="/stream", headers=None):
+        reader, writer = await asyncio.open_connection(host, port)
+        key = base64.b64encode(os.urandom(16)).decode()
+        lines = [
+            f"GET {path} HTTP/1.1",
+            f"Host: {host}:{port}",
+            "Upgrade: websocket",
+            "Connection: Upgrade",
+            f"Sec-WebSocket-Key: {key}",
+            "Sec-WebSocket-Version: 13",
+        ] + [f"{name}: {value}" for name, value in (headers or {}).items()]
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode())
+        head = (await reader.readuntil(b"\r\n\r\n")).decode("latin-1")
+        status = head.split("\r\n", 1)[0]
+        if " 101 " not in status + " ":
+            writer.close()
+            raise ConnectionError(f"websocket handshake failed: {status}")
+        accept = base64.b64encode(hashlib.sha1(key.encode() + _GUID).digest()).decode()
+        if accept.lower() not in head.lower():
+            writer.close()
+            raise ConnectionError("websocket handshake failed: bad Sec-WebSocket-Accept")
+        return cls(reader, writer, head)
+
+    async def _send_frame(self, opcode, payload):
+        header = bytearray([0x80 | opcode])
+        length = len(payload)
+        if length < 126:
+            header.append(0x80 | length)
+        elif length < 1 << 16:
+            header += struct.pack("!BH", 0x80 | 126, length)
+        else:
+            header += struct.pack("!BQ", 0x80 | 127, length)
+        mask = os.urandom(4)
+        header += mask
+        # Client frames must be masked; XOR in one go via int arithmetic.
+        repeated = (mask * (length // 4 + 1))[:length]
+        masked = (int.from_bytes(payload, "big") ^ int.from_bytes(repeated, "big")).to_bytes(length, "big")
+        self.writer.write(bytes(header) + masked)
+        await self.writer.drain()
+
+    async def send(self, data):
+        await self._send_frame(OP_BINARY if isinstance(data, bytes) else OP_TEXT,
+                               data if isinstance(data, bytes) else data.encode())
+
+    async def _read_frame(self):
+        first, second = await self.reader.readexactly(2)
+        length = second & 0x7F
+        if length == 126:
+            (length,) = struct.unpack("!H", await self.reader.readexactly(2))
+        elif length == 127:
+            (length,) = struct.unpack("!Q", await self.reader.readexactly(8))
+        mask = await self.reader.readexactly(4) if second & 0x80 else None
+        payload = await self.reader.readexactly(length)
+        if mask:
+            payload = bytes(b ^ mask[i % 4] for i, b in enumerate(payload))
+        return bool(first & 0x80), first & 0x0F, payload
+
+    async def recv(self):
+        """The next complete data message, answering pings along the way."""
+        chunks = []
+        while True:
+            try:
+                fin, opcode, payload = await self._read_frame()
+            except asyncio.IncompleteReadError:
+                raise ConnectionClosed("connection dropped")
+            if opcode == OP_PING:
+                await self._send_frame(OP_PONG, payload)
+            elif opcode == OP_CLOSE:
+                raise ConnectionClosed(payload[2:].decode(errors="replace"))
+            elif opcode in (OP_TEXT, OP_BINARY, OP_CONT):
+                chunks.append(payload)
+                if fin:
+                    return b"".join(chunks)
+
+    async def close(self):
+        try:
+            await self._send_frame(OP_CLOSE, struct.pack("!H", 1000))
+        except (ConnectionError, RuntimeError):
+            pass
+        self.writer.close()
+
+
+class StreamlitSession:
+    """One browser-like session against a running Streamlit server."""
+
+    def __init__(self, ws):
+        self.ws = ws
+        self.menu = None  # (widget id, options) once the sidebar has rendered
+
+    @classmethod
+    async def connect(cls, host, port, base_path="", headers=None):
+        path = "/" + "/".join(p for p in (base_path.strip("/"), "stream") if p)
+        return cls(await WebSocket.connect(host, port, path, headers))
+
+    async def rerun(self, widgets=None, query_string=""):
+        """Trigger a rerun and return its ForwardMsgs up to ``script_finished``."""
+        import json
+
+        from resume.headless import find_menu
+        from streamlit.proto.BackMsg_pb2 import BackMsg
+        from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+        msg = BackMsg()
+        msg.rerun_script.query_string = query_string
+        for widget_id, value in (widgets or {}).items():
+            state = msg.rerun_script.widget_states.widgets.add()
+            state.id = widget_id
+            state.json_value = json.dumps(value)
+        await self.ws.send(msg.SerializeToString())
+
+        messages = []
+        while True:
+            forward = ForwardMsg()
+            forward.ParseFromString(await self.ws.recv())
+            messages.append(forward)
+            if forward.WhichOneof("type") == "script_finished":
+                break
+        if self.menu is None:
+            self.menu = find_menu(messages)
+        return messages
+
+    async def select(self, option):
+        return await self.rerun({self.menu[0]: option})
+
+    async def close(self):
+        await self.ws.close()
+
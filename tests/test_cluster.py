@@ -0,0 +1,107 @@
+"""resume.cluster routing and cookie handling, with fake workers (no processes)."""
+import asyncio
+
+import pytest
+
+from resume import cluster
+
+RESPONSE = b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\nConnection: close\r\n\r\nok"
+
+
+@pytest.mark.parametrize("head, expected", [
+    (b"GET / HTTP/1.1\r\nHost: x\r\n\r\n", None),
+    (b"GET / HTTP/1.1\r\nCookie: resume_worker=2\r\n\r\n", 2),
+    (b"GET / HTTP/1.1\r\ncookie: _xsrf=abc; resume_worker=1; other=3\r\n\r\n", 1),
+    (b"GET / HTTP/1.1\r\nCookie: resume_worker=x\r\n\r\n", None),
+    (b"GET / HTTP/1.1\r\nCookie: not_resume_worker=1\r\n\r\n", None),
+    (b"GET /?resume_worker=1 HTTP/1.1\r\nX-Cookie: resume_worker=1\r\n\r\n", None),
+])
+def test_pinned_worker(head, expected):
+    assert cluster._pinned_worker(head) == expected
+
+
+def _cluster(workers=3, healthy=True):
+    result = cluster.Cluster("app.py", workers, 9000)
+    for worker in result.workers:
+        worker.healthy = healthy
+    return result
+
+
+def test_pick_pinned():
+    c = _cluster()
+    c.workers[0].connections = 5
+    assert c.pick(2) is c.workers[2]
+    assert c.pick(0) is c.workers[0]  # pinned wins over least busy
+
+
+def test_pick_least_busy():
+    c = _cluster()
+    c.workers[0].connections, c.workers[1].connections, c.workers[2].connections = 3, 1, 2
+    assert c.pick() is c.workers[1]
+    assert c.pick(7) is c.workers[1]  # no such worker
+
+
+def test_pick_moves_off_unhealthy():
+    c = _cluster()
+    c.workers[1].healthy = False
+    assert c.pick(1) in (c.workers[0], c.workers[2])
+    c.workers[0].healthy = c.workers[2].healthy = False
+    assert c.pick(1) is None
+
+
+def test_pick_spreads_ties():
+    c = _cluster()
+    assert {c.pick().index for _ in range(6)} == {0, 1, 2}
+
+
+async def _exchange(c, request):
+    """Send ``request`` through ``c``'s proxy to a stub upstream; returns the response."""
+    async def upstream(reader, writer):
+        await reader.readuntil(b"\r\n\r\n")
+        writer.write(RESPONSE)
+        await writer.drain()
+        writer.close()
+
+    stub = await asyncio.start_server(upstream, "127.0.0.1", 0)
+    for worker in c.workers:
+        worker.port = stub.sockets[0].getsockname()[1]
+    proxy = await asyncio.start_server(c.handle, "127.0.0.1", 0)
+    try:
+        reader, writer = await asyncio.open_connection("127.0.0.1", proxy.sockets[0].getsockname()[1])
+        writer.write(request)
+        response = await asyncio.wait_for(reader.read(), 5)
+        writer.close()
+        return response
+    finally:
+        proxy.close()
+        stub.close()
+
+
+def test_cookie_set_for_new_visitor():
+    c = _cluster(1)
+    response = asyncio.run(_exchange(c, b"GET / HTTP/1.1\r\nHost: x\r\n\r\n"))
+    head, _, body = response.partition(b"\r\n\r\n")
+    assert head.startswith(b"HTTP/1.1 200")
+    assert b"\r\nSet-Cookie: resume_worker=0; Path=/; HttpOnly; SameSite=Lax" in head
+    assert body == b"ok"
+
+
+def test_no_cookie_when_already_pinned():
+    c = _cluster(1)
+    response = asyncio.run(_exchange(c, b"GET / HTTP/1.1\r\nCookie: resume_worker=0\r\n\r\n"))
+    assert response.startswith(b"HTTP/1.1 200")
+    assert b"Set-Cookie" not in response
+
+
+def test_cookie_replaced_when_moved():
+    c = _cluster(2)
+    c.workers[1].healthy = False
+    response = asyncio.run(_exchange(c, b"GET / HTTP/1.1\r\nCookie: resume_worker=1\r\n\r\n"))
+    assert b"Set-Cookie: resume_worker=0;" in response
+
+
+def test_no_healthy_worker(monkeypatch):
+    monkeypatch.setattr(cluster, "WAIT_FOR_WORKER", 0.2)
+    c = _cluster(2, healthy=False)
+    response = asyncio.run(_exchange(c, b"GET / HTTP/1.1\r\n\r\n"))
+    assert response.startswith(b"HTTP/1.1 503")
@@ -0,0 +1,72 @@
+"""resume.cv: incremental parsing and the fallback to the cached model."""
+import shutil
+import zipfile
+
+import pytest
+
+from resume import cv
+
+
+@pytest.fixture
+def docx(tmp_path, monkeypatch):
+    monkeypatch.setattr(cv, "CACHE_FILE", tmp_path / "cache" / "cv.json")
+    path = tmp_path / "CV.docx"
+    shutil.copyfile(cv.SOURCE, path)
+    return path
+
+
+def _edit_last_section(path, old, new):
+    """Rewrite ``path`` with ``old`` replaced by ``new`` in its last section only."""
+    with zipfile.ZipFile(path) as package:
+        files = {info: package.read(info) for info in package.infolist()}
+    document = next(info for info in files if info.filename == cv.DOCUMENT)
+    xml = files[document].decode()
+    last = cv.split(xml)[1][-1]
+    assert old in last
+    files[document] = xml.replace(last, last.replace(old, new, 1)).encode()
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as package:
+        for info, data in files.items():
+            package.writestr(info, data)
+
+
+def test_only_the_edited_section_is_parsed(docx):
+    report = {}
+    before = cv.load(docx, report=report)
+    assert (report["cached"], report["parsed"], report["sections"]) == (False, 8, 8)
+    cv.load(docx, report=report)
+    assert (report["cached"], report["parsed"]) == (True, 0)
+
+    _edit_last_section(docx, "Certificate", "Certificate (2019)")
+    after = cv.load(docx, report=report)
+    assert (report["cached"], report["parsed"], report["sections"]) == (False, 1, 8)
+    assert after["certifications"] != before["certifications"]
+    assert after["jobs"] == before["jobs"]
+
+
+@pytest.mark.parametrize("corrupt", [
+    lambda path: path.write_bytes(b"not a zip"),
+    lambda path: path.unlink(),
+    lambda path: _edit_last_section(path, "</w:p>", "</w:x>"),
+])
+def test_corrupt_file_uses_cached_model(docx, corrupt):
+    model = cv.load(docx)
+    corrupt(docx)
+    report = {}
+    assert cv.load(docx, report=report) == model
+    assert (report["cached"], report["parsed"]) == (True, 0)
+
+
+def test_corrupt_file_without_cache(docx):
+    docx.write_bytes(b"not a zip")
+    with pytest.raises(ValueError, match="CV.docx"):
+        cv.load(docx)
+
+
+def test_unwritable_cache(docx, tmp_path, monkeypatch):
+    (tmp_path / "file").write_text("")
+    monkeypatch.setattr(cv, "CACHE_FILE", tmp_path / "file" / "cv.json")
+    report = {}
+    assert cv.load(docx, report=report)["name"]
+    assert report["parsed"] == 8
+    cv.load(docx, report=report)
+    assert report["parsed"] == 8  # nothing cached, parsed again
@@ -0,0 +1,39 @@
+"""resume.export: deterministic output with every referenced asset present."""
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+from resume import export
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def _tree(out):
+    return {str(path.relative_to(out)): path.read_bytes() for path in sorted(out.rglob("*")) if path.is_file()}
+
+
+def test_deterministic(tmp_path):
+    export.export(tmp_path / "a")
+    # A second process: no shared in-memory caches, another hash seed.
+    subprocess.run([sys.executable, "-m", "resume.export", "--out", str(tmp_path / "b")],
+                   cwd=ROOT, check=True, capture_output=True)
+    first, second = _tree(tmp_path / "a"), _tree(tmp_path / "b")
+    assert sorted(first) == sorted(second)
+    assert [path for path in first if first[path] != second[path]] == []
+
+
+def test_static_urls_exist(tmp_path):
+    files = export.export(tmp_path)
+    page = files["index.html"].decode()
+    urls = set(re.findall(rf"{export.STATIC}/[^\"'\s),]+", page))
+    assert urls
+    assert sorted(url for url in urls if not (tmp_path / url).is_file()) == []
+
+
+def test_stale_files_removed(tmp_path):
+    export.export(tmp_path)
+    (tmp_path / export.MANIFEST).write_text('["static/old.0123456789ab.css"]\n')
+    (tmp_path / "static" / "old.0123456789ab.css").write_text("")
+    export.export(tmp_path)
+    assert not (tmp_path / "static" / "old.0123456789ab.css").exists()
@@ -0,0 +1,78 @@
+"""resume.httpclient against a scripted asyncio server."""
+import asyncio
+
+import pytest
+
+from resume import httpclient
+
+RESPONSES = {
+    b"/length": b"HTTP/1.1 200 OK\r\nContent-Length: 5\r\n\r\nhello",
+    b"/chunked": b"HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\n3\r\nhel\r\n2;x=y\r\nlo\r\n0\r\n\r\n",
+    b"/eof": b"HTTP/1.1 200 OK\r\nContent-Type: text/plain\r\n\r\nhello",
+    b"/close": b"HTTP/1.1 404 Not Found\r\nContent-Length: 0\r\nConnection: close\r\n\r\n",
+    b"/head": b"HTTP/1.1 200 OK\r\nContent-Length: 5\r\n\r\n",
+}
+
+
+async def _serve(requests, close_after=None):
+    """A server answering from RESPONSES; records each request head in ``requests``."""
+    async def handle(reader, writer):
+        served = 0
+        while True:
+            try:
+                head = await reader.readuntil(b"\r\n\r\n")
+            except asyncio.IncompleteReadError:
+                break
+            requests.append(head)
+            target = head.split(b" ")[1]
+            writer.write(RESPONSES[target])
+            await writer.drain()
+            served += 1
+            if target in (b"/eof", b"/close") or served == close_after:
+                break
+        writer.close()
+
+    return await asyncio.start_server(handle, "127.0.0.1", 0)
+
+
+def _run(paths, method="GET", close_after=None, headers=None):
+    requests = []
+
+    async def main():
+        server = await _serve(requests, close_after)
+        connection = httpclient.Connection("127.0.0.1", server.sockets[0].getsockname()[1], timeout=5,
+                                           headers=headers)
+        try:
+            responses = []
+            for path in paths:
+                responses.append(await connection.request(method, path))
+                await asyncio.sleep(0.05)  # lets a closing server's FIN arrive
+            return responses
+        finally:
+            connection.close()
+            server.close()
+
+    return asyncio.run(main()), requests
+
+
+@pytest.mark.parametrize("path", ["/length", "/chunked", "/eof"])
+def test_body(path):
+    [response], _ = _run([path])
+    assert (response.status, response.body) == (200, b"hello")
+
+
+def test_head_has_no_body():
+    [response], _ = _run(["/head"], method="HEAD")
+    assert (response.status, response.headers["content-length"], response.body) == (200, "5", b"")
+
+
+def test_keep_alive_and_headers():
+    responses, requests = _run(["/length", "/chunked", "/close"], headers={"Cookie": "a=b"})
+    assert [response.status for response in responses] == [200, 200, 404]
+    assert all(b"\r\nCookie: a=b\r\n" in head and b"\r\nConnection: keep-alive\r\n" in head for head in requests)
+
+
+def test_reconnects_once_when_stale():
+    responses, requests = _run(["/length", "/length", "/length"], close_after=1)
+    assert [response.body for response in responses] == [b"hello"] * 3
+    assert len(requests) == 3
@@ -0,0 +1,135 @@
+"""resume.links against a stub HTTP server on an ephemeral port."""
+import asyncio
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from resume import links
+
+CODES = {"/up": 200, "/moved": 301, "/no-head": 405, "/missing": 404, "/broken": 500}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+
+    def setup(self):
+        super().setup()
+        self.server.connections += 1
+
+    def do_HEAD(self):
+        if self.path == "/slow":
+            time.sleep(1)
+        self.send_response(CODES.get(self.path, 200))
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    server.daemon_threads = True
+    server.connections = 0
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _url(server, path):
+    return f"http://127.0.0.1:{server.server_address[1]}{path}"
+
+
+def _check(urls, timeout=2.0):
+    return asyncio.run(links.Checker(urls, ttl=60, timeout=timeout).check_all())
+
+
+def test_up(stub):
+    for path in ("/up", "/moved", "/no-head"):
+        result = _check([_url(stub, path)])[_url(stub, path)]
+        assert result.ok and result.code == CODES[path] and result.error is None
+
+
+@pytest.mark.parametrize("path", ["/missing", "/broken"])
+def test_http_errors(stub, path):
+    result = _check([_url(stub, path)])[_url(stub, path)]
+    assert not result.ok
+    assert result.code == CODES[path]
+
+
+def test_timeout(stub):
+    result = _check([_url(stub, "/slow")], timeout=0.2)[_url(stub, "/slow")]
+    assert not result.ok
+    assert (result.code, result.error) == (None, "timeout")
+
+
+def test_connection_refused():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    url = f"http://127.0.0.1:{port}/"
+    result = _check([url])[url]
+    assert not result.ok
+    assert (result.code, result.error) == (None, "refused")
+
+
+def test_one_connection_per_host(stub):
+    urls = [_url(stub, path) for path in ("/up", "/missing", "/broken", "/moved")]
+    results = _check(urls)
+    assert [results[url].code for url in urls] == [200, 404, 500, 301]
+    assert stub.connections == 1
+
+
+def test_status_expires(stub):
+    checker = links.Checker([_url(stub, "/up"), _url(stub, "/missing")], ttl=60)
+    assert checker.status(_url(stub, "/up")) is None
+    asyncio.run(checker.check_all())
+    assert checker.status(_url(stub, "/up")).ok
+    assert not checker.status(_url(stub, "/missing")).ok
+    # Results older than twice the TTL count as unknown.
+    checker.statuses[_url(stub, "/up")] = checker.statuses[_url(stub, "/up")]._replace(checked=time.time() - 121)
+    assert checker.status(_url(stub, "/up")) is None
+
+
+@pytest.mark.parametrize("host", ["127.0.0.1", "localhost", "169.254.169.254", "10.0.0.1", "[::1]"])
+def test_added_urls_need_a_public_host(stub, host):
+    checker = links.Checker([], ttl=60)
+    url = f"http://{host}:{stub.server_address[1]}/up"
+    checker.add(url)
+    result = asyncio.run(checker.check_all())[url]
+    assert (result.ok, result.error) == (False, "not public")
+    assert stub.connections == 0
+
+
+def test_own_urls_on_any_host(stub):
+    checker = links.Checker([_url(stub, "/up")], ttl=60)
+    checker.add(_url(stub, "/missing"))  # same host as an own URL
+    results = asyncio.run(checker.check_all())
+    assert results[_url(stub, "/up")].ok
+    assert results[_url(stub, "/missing")].code == 404
+
+
+def test_added_urls_bounded(monkeypatch):
+    monkeypatch.setattr(links, "MAX_ADDED", 3)
+    checker = links.Checker([], ttl=60)
+    for n in range(5):
+        checker.add(f"https://example.com/{n}")
+    checker.add("https://example.com/2")  # shown again: kept longest
+    assert list(checker.added) == ["https://example.com/3", "https://example.com/4", "https://example.com/2"]
+
+
+def test_added_urls_expire():
+    checker = links.Checker(["https://example.com/own"], ttl=60)
+    checker.add("https://example.com/old")
+    checker.add("https://example.com/new")
+    checker.added["https://example.com/old"] -= 121
+    for url in ("https://example.com/own", "https://example.com/old", "https://example.com/new"):
+        checker.statuses[url] = links.Status(True, 200, None, time.time(), 0.0)
+    checker._expire()
+    assert list(checker.added) == ["https://example.com/new"]
+    assert sorted(checker.statuses) == ["https://example.com/new", "https://example.com/own"]
@@ -0,0 +1,115 @@
+"""resume.tenants: content.json validation, table-driven."""
+import json
+
+import pytest
+
+from resume import tenants
+
+VALID = {
+    "name": "Jane Doe",
+    "email": "jane@example.com",
+    "social_media": {"GitHub": "https://github.com/jane", "Mail": "mailto:jane@example.com"},
+    "projects": {"Site": "http://example.com/"},
+    "project_images": {"Site": "site.png"},
+    "experience": ["Ten years of things"],
+    "skills": [["Python", "daily"]],
+    "jobs": [["Engineer", "2020 - now", ["Built things"]]],
+    "education": [["BSc", "Somewhere, 2015"]],
+    "certifications": ["Cert"],
+}
+
+
+@pytest.fixture
+def tenants_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(tenants, "TENANTS_DIR", tmp_path)
+    tenants.cache.clear()
+    yield tmp_path
+    tenants.cache.clear()
+
+
+def _write(directory, raw):
+    (directory / "jane").mkdir(exist_ok=True)
+    (directory / "jane" / tenants.CONTENT_FILE).write_bytes(raw if isinstance(raw, bytes) else json.dumps(raw).encode())
+
+
+def test_valid(tenants_dir):
+    _write(tenants_dir, VALID)
+    tenant = tenants.load("jane")
+    assert tenant.NAME == "Jane Doe"
+    assert tenant.PAGE_TITLE == "Digital CV | Jane Doe"
+    assert tenant.SKILLS == [("Python", "daily")]
+    assert tenant.JOBS == [("Engineer", "2020 - now", ["Built things"])]
+    assert tenant.EDUCATION == [("BSc", "Somewhere, 2015")]
+    assert tenant.THANK_YOU == ""
+    assert tenants.load("jane") is tenant  # cached
+
+
+@pytest.mark.parametrize("raw", [
+    b"{not json",
+    b"\xff\xfe",
+    b"[]",
+    b'"jane"',
+    b"{}",
+    b'{"name": ""}',
+])
+def test_malformed(tenants_dir, raw):
+    _write(tenants_dir, raw)
+    with pytest.raises(ValueError):
+        tenants.load("jane")
+
+
+@pytest.mark.parametrize("name, value", [
+    ("name", 3),
+    ("description", ["a"]),
+    ("email", None),
+    ("social_media", ["https://github.com/jane"]),
+    ("social_media", {"GitHub": 1}),
+    ("social_media", {"GitHub": "javascript:alert(1)"}),
+    ("social_media", {"GitHub": "JavaScript:alert(1)"}),
+    ("projects", {"Site": "data:text/html,<script>alert(1)</script>"}),
+    ("projects", {"Site": "//example.com/"}),
+    ("projects", {"Site": "https://example.com/ x"}),
+    ("project_images", {"Site": "../../profile-pic.png"}),
+    ("project_images", {"Site": "/etc/passwd"}),
+    ("project_images", {"Site": "..\\secret.png"}),
+    ("project_images", {"Site": ""}),
+    ("experience", "one long string"),
+    ("experience", [1, 2]),
+    ("skills", [["Python"]]),
+    ("skills", [["Python", 5]]),
+    ("jobs", [["Engineer", "2020"]]),
+    ("jobs", [["Engineer", "2020", "not a list"]]),
+    ("education", [["BSc", "x", "extra"]]),
+    ("certifications", {"Cert": "x"}),
+])
+def test_wrong_field(tenants_dir, name, value):
+    _write(tenants_dir, {**VALID, name: value})
+    with pytest.raises(ValueError, match=f'"{name}"'):
+        tenants.load("jane")
+
+
+@pytest.mark.parametrize("tenant_id", ["missing", "../jane", "Jane", "", "-x" * 40])
+def test_no_such_tenant(tenants_dir, tenant_id):
+    _write(tenants_dir, VALID)
+    assert tenants.load(tenant_id) is None
+
+
+def test_fixed_file_is_read_again(tenants_dir):
+    _write(tenants_dir, {**VALID, "projects": {"Site": "javascript:alert(1)"}})
+    with pytest.raises(ValueError):
+        tenants.load("jane")
+    _write(tenants_dir, {**VALID, "name": "Jane Q. Doe"})
+    assert tenants.load("jane").NAME == "Jane Q. Doe"
+
+
+def test_project_image_stays_in_directory(tenants_dir):
+    _write(tenants_dir, VALID)
+    (tenants_dir / "jane" / "project_images").mkdir()
+    (tenants_dir / "jane" / "project_images" / "site.png").write_bytes(b"")
+    (tenants_dir / "secret.png").write_bytes(b"")
+    tenant = tenants.load("jane")
+    assert tenant.project_image("Site") == tenants_dir / "jane" / "project_images" / "site.png"
+    assert tenant.project_image("Nothing") is None
+    (tenants_dir / "jane" / "project_images" / "site.png").unlink()
+    (tenants_dir / "jane" / "project_images" / "site.png").symlink_to(tenants_dir / "secret.png")
+    assert tenant.project_image("Site") is None